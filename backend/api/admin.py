@@ -0,0 +1,166 @@
+"""
+관리자 API 라우터 (캐시/번역 메모리 관리)
+
+X-Admin-Key 헤더가 ADMIN_API_KEY 환경 변수와 일치해야 사용할 수 있습니다.
+ADMIN_API_KEY가 설정되지 않으면 모든 관리자 API가 비활성화됩니다.
+"""
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+import logging
+import os
+import secrets
+from dotenv import load_dotenv
+
+from services.translation_memory import (
+    list_keyword_translations,
+    purge_keyword_translations,
+    get_keyword_memory_stats,
+)
+from services.translation_cache import purge_translation_cache, get_translation_cache_stats
+from services.summary_cache import invalidate_summary, purge_stale_summaries, get_summary_cache_stats
+from services.gpt_summarizer import SUMMARY_PROMPT_VERSION, summary_circuit
+from services.token_budget import get_usage_stats
+from utils.auth import get_auth_cache_stats
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")
+
+
+def require_admin(x_admin_key: Optional[str] = Header(None)):
+    """관리자 키 확인 의존성"""
+    if not ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 API가 비활성화되어 있습니다"
+        )
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="관리자 인증에 실패했습니다"
+        )
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/translation-memory/keywords")
+async def get_keyword_translations(
+    country: Optional[str] = Query(None, description="국가 코드 필터"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    키워드 번역 메모리 조회
+    """
+    entries = await run_in_threadpool(list_keyword_translations, country, skip, limit)
+    return {
+        "status": "success",
+        "data": {
+            "entries": entries,
+            "memory": get_keyword_memory_stats()
+        }
+    }
+
+
+@router.delete("/translation-memory/keywords")
+async def delete_keyword_translations(
+    keyword: Optional[str] = Query(None, description="삭제할 키워드 (없으면 전체)"),
+    country: Optional[str] = Query(None, description="국가 코드 (없으면 전체)")
+):
+    """
+    키워드 번역 메모리 삭제
+    """
+    deleted = await run_in_threadpool(purge_keyword_translations, keyword, country)
+    return {
+        "status": "success",
+        "data": {
+            "deleted": deleted
+        }
+    }
+
+
+@router.get("/translation-cache/stats")
+async def get_translation_cache_status():
+    """
+    기사 번역 캐시 통계 (메모리/DB 적중률)
+    """
+    return {
+        "status": "success",
+        "data": get_translation_cache_stats()
+    }
+
+
+@router.delete("/translation-cache")
+async def delete_translation_cache(
+    expired_only: bool = Query(True, description="만료된 항목만 삭제 (false면 전체 삭제)")
+):
+    """
+    기사 번역 캐시 삭제
+    """
+    deleted = await run_in_threadpool(purge_translation_cache, expired_only)
+    return {
+        "status": "success",
+        "data": {
+            "deleted": deleted
+        }
+    }
+
+
+@router.get("/summary-cache/stats")
+async def get_summary_cache_status():
+    """
+    GPT 요약 캐시 통계 및 서킷 브레이커 상태
+    """
+    return {
+        "status": "success",
+        "data": {
+            **get_summary_cache_stats(),
+            "prompt_version": SUMMARY_PROMPT_VERSION,
+            "circuit": summary_circuit.stats()
+        }
+    }
+
+
+@router.delete("/summary-cache")
+async def delete_summary_cache(
+    url: Optional[str] = Query(None, description="삭제할 기사 URL (없으면 만료/이전 버전 항목 정리)")
+):
+    """
+    GPT 요약 캐시 삭제
+    """
+    if url:
+        deleted = await run_in_threadpool(invalidate_summary, url)
+    else:
+        deleted = await run_in_threadpool(purge_stale_summaries, SUMMARY_PROMPT_VERSION)
+    return {
+        "status": "success",
+        "data": {
+            "deleted": deleted
+        }
+    }
+
+
+@router.get("/token-usage")
+async def get_token_usage():
+    """
+    용도별 GPT 토큰 사용량 (요청 전 계획 대비 실제 usage)
+    """
+    return {
+        "status": "success",
+        "data": get_usage_stats()
+    }
+
+
+@router.get("/auth-cache/stats")
+async def get_auth_cache_status():
+    """
+    인증 캐시 통계 (토큰 검증 결과, 사용자 정보)
+    """
+    return {
+        "status": "success",
+        "data": get_auth_cache_stats()
+    }
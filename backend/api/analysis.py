@@ -3,28 +3,49 @@
 키워드 분석, 워드클라우드 등
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 import logging
 from services.keyword_analyzer import analyze_articles_keywords, analyze_keywords
-from services.wordcloud_generator import generate_wordcloud, cleanup_old_wordclouds
+from services.keyword_scoring import KEYWORD_SCORING
+from services.wordcloud_generator import (
+    generate_wordcloud,
+    get_wordcloud_image,
+    get_wordcloud_stats,
+    WORDCLOUD_FORMAT,
+)
+from services.wordcloud_pool import WordcloudRenderError
+from services.noun_extractors import get_noun_extractor
+from services.trending import trending_keywords
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
 
+# 워드클라우드 렌더링 실패 종류별 HTTP 상태 코드
+RENDER_ERROR_STATUS = {"busy": 503, "timeout": 504}
+
+
+# 키워드 점수 방식 (없으면 KEYWORD_SCORING 환경 변수 설정 사용)
+ScoringMethod = Literal["frequency", "tfidf", "bm25"]
+
+
 class KeywordRequest(BaseModel):
     """키워드 분석 요청"""
     texts: List[str]
     top_n: Optional[int] = 20
+    scoring: Optional[ScoringMethod] = None
     
 
 class ArticlesKeywordRequest(BaseModel):
     """기사 키워드 분석 요청"""
     articles: List[dict]
     top_n: Optional[int] = 20
+    scoring: Optional[ScoringMethod] = None
 
 
 class WordCloudRequest(BaseModel):
@@ -32,6 +53,8 @@ class WordCloudRequest(BaseModel):
     keywords: Dict[str, int]  # {"단어": 빈도수}
     width: Optional[int] = 600
     height: Optional[int] = 400
+    format: Optional[Literal["png", "webp"]] = None  # 없으면 WORDCLOUD_FORMAT
+    inline: Optional[bool] = False  # True면 URL 대신 이미지 바이트를 바로 응답
 
 
 @router.post("/keywords")
@@ -47,7 +70,9 @@ async def analyze_keywords_api(request: KeywordRequest):
     try:
         logger.info(f"키워드 분석 요청: {len(request.texts)}개 텍스트")
         
-        keywords = analyze_keywords(request.texts, request.top_n)
+        keywords = await run_in_threadpool(
+            analyze_keywords, request.texts, request.top_n, scoring=request.scoring or KEYWORD_SCORING
+        )
         
         return {
             "status": "success",
@@ -78,7 +103,9 @@ async def analyze_articles_keywords_api(request: ArticlesKeywordRequest):
     try:
         logger.info(f"기사 키워드 분석 요청: {len(request.articles)}개 기사")
         
-        result = analyze_articles_keywords(request.articles, request.top_n)
+        result = await run_in_threadpool(
+            analyze_articles_keywords, request.articles, request.top_n, request.scoring or KEYWORD_SCORING
+        )
         
         return {
             "status": "success",
@@ -101,19 +128,32 @@ async def generate_wordcloud_api(request: WordCloudRequest):
         request: 키워드 딕셔너리 및 옵션
         
     Returns:
-        생성된 이미지 URL
+        생성된 이미지 URL (inline이면 이미지 바이트, URL은 X-Wordcloud-Url 헤더)
     """
     try:
         logger.info(f"워드클라우드 생성 요청: {len(request.keywords)}개 키워드")
         
-        # 오래된 이미지 정리 (24시간 이상)
-        cleanup_old_wordclouds(max_age_hours=24)
+        image_format = request.format or WORDCLOUD_FORMAT
+        
+        if request.inline:
+            if not request.keywords:
+                raise HTTPException(status_code=400, detail="키워드가 비어있습니다.")
+            image_bytes, media_type, image_url = await run_in_threadpool(
+                get_wordcloud_image,
+                keywords=request.keywords,
+                width=request.width,
+                height=request.height,
+                image_format=image_format
+            )
+            return Response(content=image_bytes, media_type=media_type, headers={"X-Wordcloud-Url": image_url})
         
         # 워드클라우드 생성
-        image_url = generate_wordcloud(
+        image_url = await run_in_threadpool(
+            generate_wordcloud,
             keywords=request.keywords,
             width=request.width,
-            height=request.height
+            height=request.height,
+            image_format=image_format
         )
         
         return {
@@ -123,6 +163,14 @@ async def generate_wordcloud_api(request: WordCloudRequest):
             }
         }
         
+    except HTTPException:
+        raise
+    except WordcloudRenderError as e:
+        logger.warning(f"워드클라우드 생성 실패 ({e.kind}): {e}")
+        raise HTTPException(
+            status_code=RENDER_ERROR_STATUS.get(e.kind, 500),
+            detail=f"워드클라우드 생성 실패: {str(e)}"
+        )
     except Exception as e:
         logger.error(f"워드클라우드 생성 API 에러: {e}")
         raise HTTPException(
@@ -145,7 +193,9 @@ async def complete_analysis_api(request: ArticlesKeywordRequest):
         logger.info(f"통합 분석 요청: {len(request.articles)}개 기사")
         
         # 1. 키워드 분석
-        result = analyze_articles_keywords(request.articles, request.top_n)
+        result = await run_in_threadpool(
+            analyze_articles_keywords, request.articles, request.top_n, request.scoring or KEYWORD_SCORING
+        )
         
         # 2. 워드클라우드 생성 (키워드가 있을 때만)
         image_url = ""
@@ -156,11 +206,11 @@ async def complete_analysis_api(request: ArticlesKeywordRequest):
                 for item in result["keywords"]
             }
             
-            # 오래된 이미지 정리
-            cleanup_old_wordclouds(max_age_hours=24)
-            
-            # 워드클라우드 생성
-            image_url = generate_wordcloud(keywords=keywords_dict)
+            # 워드클라우드 생성 (렌더링이 밀리면 키워드 결과만 반환)
+            try:
+                image_url = await run_in_threadpool(generate_wordcloud, keywords=keywords_dict)
+            except WordcloudRenderError as e:
+                logger.warning(f"통합 분석 워드클라우드 생략 ({e.kind}): {e}")
         
         return {
             "status": "success",
@@ -177,3 +227,55 @@ async def complete_analysis_api(request: ArticlesKeywordRequest):
             detail=f"통합 분석 실패: {str(e)}"
         )
 
+
+@router.get("/trending")
+async def get_trending_keywords_api(
+    country: str = Query("all", description="국가 코드 (kr, us, jp 등, all이면 전체)"),
+    window_minutes: int = Query(60, ge=5, le=720, description="집계 구간 (분)"),
+    top_n: int = Query(20, ge=1, le=100, description="키워드 개수")
+):
+    """최근 검색된 기사 기반 트렌드 키워드
+    
+    형태소 분석기가 한국어 전용이므로 한국어 기사와 한국어로 번역된 기사만 집계합니다.
+    번역되지 않은 외국어 기사는 건너뜁니다 (/trending/stats의 skipped_articles).
+    
+    Args:
+        country: 국가 코드
+        window_minutes: 집계 구간 (분, 버킷 크기 TRENDING_BUCKET_SECONDS 단위로 올림)
+        top_n: 키워드 개수
+        
+    Returns:
+        트렌드 키워드 (직전 같은 길이 구간 대비 빈도 변화 포함,
+        실제 집계 구간 window_seconds와 버킷 크기 bucket_seconds 포함)
+    """
+    return {
+        "status": "success",
+        "data": trending_keywords.top(country, window_minutes * 60, top_n)
+    }
+
+
+@router.get("/trending/stats")
+async def get_trending_stats():
+    """트렌드 집계 통계"""
+    return {
+        "status": "success",
+        "data": trending_keywords.stats()
+    }
+
+
+@router.get("/analyzer/stats")
+async def get_analyzer_stats():
+    """현재 명사 추출 엔진 및 통계"""
+    return {
+        "status": "success",
+        "data": get_noun_extractor().stats()
+    }
+
+
+@router.get("/wordcloud/stats")
+async def get_wordcloud_stats_api():
+    """워드클라우드 생성/캐시 적중 통계"""
+    return {
+        "status": "success",
+        "data": get_wordcloud_stats()
+    }
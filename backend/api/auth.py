@@ -2,22 +2,40 @@
 인증 API 라우터 (회원가입, 로그인)
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from models.user_models import User
 from models.user_schemas import UserCreate, UserLogin, Token, UserResponse
-from utils.auth import get_password_hash, verify_password, create_access_token, get_current_user
+from utils.auth import (
+    get_password_hash_async,
+    verify_and_update_password_async,
+    create_access_token,
+    CurrentUser,
+    get_current_user,
+    PasswordHashBusy,
+)
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
+def _password_busy_exception(e: PasswordHashBusy) -> HTTPException:
+    """비밀번호 해싱 작업이 밀려 있을 때 응답"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     회원가입
     """
     # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_user = result.scalars().first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -25,7 +43,8 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # 사용자명 중복 확인
-    existing_username = db.query(User).filter(User.username == user_data.username).first()
+    result = await db.execute(select(User).where(User.username == user_data.username))
+    existing_username = result.scalars().first()
     if existing_username:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -33,7 +52,10 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # 새 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except PasswordHashBusy as e:
+        raise _password_busy_exception(e)
     new_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -41,31 +63,40 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: UserLogin, db: Session = Depends(get_db)):
+async def login(login_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     로그인
     """
     # 사용자 찾기
-    user = db.query(User).filter(User.email == login_data.email).first()
+    result = await db.execute(select(User).where(User.email == login_data.email))
+    user = result.scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다"
         )
     
-    # 비밀번호 확인
-    if not verify_password(login_data.password, user.hashed_password):
+    # 비밀번호 확인 (bcrypt 비용 설정이 바뀐 해시는 새 비용으로 다시 저장)
+    try:
+        verified, new_hash = await verify_and_update_password_async(login_data.password, user.hashed_password)
+    except PasswordHashBusy as e:
+        raise _password_busy_exception(e)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다"
         )
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+        await db.refresh(user)
     
     # JWT 토큰 생성 (user.id를 문자열로 변환)
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -78,7 +109,7 @@ async def login(login_data: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: CurrentUser = Depends(get_current_user)):
     """
     현재 로그인한 사용자 정보 조회
     """
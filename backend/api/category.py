@@ -2,48 +2,51 @@
 카테고리 API 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from database import get_db
-from models.user_models import User, Category
+from database import get_async_db
+from models.user_models import Category
 from models.user_schemas import CategoryCreate, CategoryUpdate, CategoryResponse
-from utils.auth import get_current_user
+from utils.auth import CurrentUser, get_current_user
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
 @router.get("/", response_model=List[CategoryResponse])
 async def get_categories(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     사용자의 카테고리 목록 조회
     """
-    categories = db.query(Category)\
-        .filter(Category.user_id == current_user.id)\
-        .order_by(Category.created_at)\
-        .all()
+    result = await db.execute(
+        select(Category)
+        .where(Category.user_id == current_user.id)
+        .order_by(Category.created_at)
+    )
     
-    return categories
+    return result.scalars().all()
 
 
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     새 카테고리 생성
     """
     # 카테고리 이름 중복 확인
-    existing_category = db.query(Category)\
-        .filter(
+    result = await db.execute(
+        select(Category).where(
             Category.user_id == current_user.id,
             Category.name == category_data.name
-        )\
-        .first()
+        )
+    )
+    existing_category = result.scalars().first()
     
     if existing_category:
         raise HTTPException(
@@ -59,8 +62,8 @@ async def create_category(
     )
     
     db.add(new_category)
-    db.commit()
-    db.refresh(new_category)
+    await db.commit()
+    await db.refresh(new_category)
     
     return new_category
 
@@ -69,18 +72,19 @@ async def create_category(
 async def update_category(
     category_id: int,
     category_data: CategoryUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     카테고리 수정
     """
-    category = db.query(Category)\
-        .filter(
+    result = await db.execute(
+        select(Category).where(
             Category.id == category_id,
             Category.user_id == current_user.id
-        )\
-        .first()
+        )
+    )
+    category = result.scalars().first()
     
     if not category:
         raise HTTPException(
@@ -91,13 +95,14 @@ async def update_category(
     # 업데이트
     if category_data.name is not None:
         # 이름 중복 확인
-        existing = db.query(Category)\
-            .filter(
+        result = await db.execute(
+            select(Category).where(
                 Category.user_id == current_user.id,
                 Category.name == category_data.name,
                 Category.id != category_id
-            )\
-            .first()
+            )
+        )
+        existing = result.scalars().first()
         
         if existing:
             raise HTTPException(
@@ -113,8 +118,8 @@ async def update_category(
     if category_data.color is not None:
         category.color = category_data.color
     
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
     
     return category
 
@@ -122,18 +127,19 @@ async def update_category(
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     카테고리 삭제
     """
-    category = db.query(Category)\
-        .filter(
+    result = await db.execute(
+        select(Category).where(
             Category.id == category_id,
             Category.user_id == current_user.id
-        )\
-        .first()
+        )
+    )
+    category = result.scalars().first()
     
     if not category:
         raise HTTPException(
@@ -141,8 +147,8 @@ async def delete_category(
             detail="카테고리를 찾을 수 없습니다"
         )
     
-    db.delete(category)
-    db.commit()
+    await db.delete(category)
+    await db.commit()
     
     return None
 
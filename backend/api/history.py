@@ -2,13 +2,14 @@
 검색 히스토리 API 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime, timezone
-from database import get_db
-from models.user_models import User, SearchHistory
+from database import get_async_db
+from models.user_models import SearchHistory
 from models.user_schemas import SearchHistoryCreate, SearchHistoryResponse
-from utils.auth import get_current_user
+from utils.auth import CurrentUser, get_current_user
 
 router = APIRouter(prefix="/api/history", tags=["history"])
 
@@ -17,27 +18,28 @@ router = APIRouter(prefix="/api/history", tags=["history"])
 async def get_search_histories(
     skip: int = 0,
     limit: int = 20,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     사용자의 검색 히스토리 조회 (최신순)
     """
-    histories = db.query(SearchHistory)\
-        .filter(SearchHistory.user_id == current_user.id)\
-        .order_by(SearchHistory.searched_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    result = await db.execute(
+        select(SearchHistory)
+        .where(SearchHistory.user_id == current_user.id)
+        .order_by(SearchHistory.searched_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
     
-    return histories
+    return result.scalars().all()
 
 
 @router.post("/", response_model=SearchHistoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_search_history(
     history_data: SearchHistoryCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     검색 히스토리 저장
@@ -53,8 +55,8 @@ async def create_search_history(
     )
     
     db.add(new_history)
-    db.commit()
-    db.refresh(new_history)
+    await db.commit()
+    await db.refresh(new_history)
     
     return new_history
 
@@ -62,18 +64,19 @@ async def create_search_history(
 @router.delete("/{history_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_search_history(
     history_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     검색 히스토리 삭제
     """
-    history = db.query(SearchHistory)\
-        .filter(
+    result = await db.execute(
+        select(SearchHistory).where(
             SearchHistory.id == history_id,
             SearchHistory.user_id == current_user.id
-        )\
-        .first()
+        )
+    )
+    history = result.scalars().first()
     
     if not history:
         raise HTTPException(
@@ -81,25 +84,25 @@ async def delete_search_history(
             detail="검색 히스토리를 찾을 수 없습니다"
         )
     
-    db.delete(history)
-    db.commit()
+    await db.delete(history)
+    await db.commit()
     
     return None
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_all_search_histories(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     사용자의 모든 검색 히스토리 삭제
     """
-    db.query(SearchHistory)\
-        .filter(SearchHistory.user_id == current_user.id)\
-        .delete()
+    await db.execute(
+        delete(SearchHistory).where(SearchHistory.user_id == current_user.id)
+    )
     
-    db.commit()
+    await db.commit()
     
     return None
 
@@ -1,12 +1,26 @@
 from fastapi import APIRouter, Query, HTTPException
-from newsapi import NewsApiClient
-import os
-from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import asyncio
+import json
 import logging
+import os
 import re
+from dotenv import load_dotenv
 from services.summarizer import summarize_articles
-from services.gpt_summarizer import summarize_articles_with_gpt
+from services.gpt_summarizer import (
+    summarize_articles_with_gpt,
+    summarize_article_with_gpt,
+    prefetch_article_summaries,
+    is_gpt_summary_available,
+    GPT_SUMMARY_CONCURRENCY,
+)
 from services.translator import translate_articles, translate_keyword_for_country
+from services.news_client import news_client
+from services.search_cache import search_cache, make_search_key
+from services.headline_prefetcher import HeadlinePrefetcher
+from services.trending import trending_keywords
+from utils.singleflight import SingleFlight
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG)
@@ -15,14 +29,18 @@ logger = logging.getLogger(__name__)
 # 환경 변수 로드
 load_dotenv()
 
-# API 키 확인
-api_key = os.getenv("NEWS_API_KEY")
-logger.info(f"API Key 로드됨: {'있음' if api_key else '없음'}")
-if api_key:
-    logger.info(f"API Key 길이: {len(api_key)}")
+# 스트리밍 검색에서 번역 패치를 보내는 기사 묶음 크기
+STREAM_TRANSLATION_CHUNK_SIZE = int(os.getenv("STREAM_TRANSLATION_CHUNK_SIZE", "5"))
+
+# 스트리밍 패치에 담는 필드
+TRANSLATION_PATCH_FIELDS = (
+    "translated_title", "original_title",
+    "translated_description", "original_description",
+    "translation_language", "translation_cached_fields",
+)
+SUMMARY_PATCH_FIELDS = ("summary", "summary_type", "gpt_summary", "summary_cached")
 
 router = APIRouter(prefix="/api/news", tags=["news"])
-newsapi = NewsApiClient(api_key=api_key)
 
 # 언어별 필터링용 정규식
 HANGUL_REGEX = re.compile(r"[가-힣]")  # 한국어
@@ -45,6 +63,261 @@ COUNTRY_LANGUAGE_REGEX = {
     "de": GERMAN_REGEX,
 }
 
+# 국가별 기사 원문 언어 (헤드라인 사전 조회 시 같은 언어로는 번역하지 않음)
+COUNTRY_SOURCE_LANGUAGE = {
+    "kr": "ko",
+    "jp": "ja",
+    "cn": "zh",
+    "us": "en",
+    "gb": "en",
+    "au": "en",
+    "ca": "en",
+    "fr": "fr",
+    "de": "de",
+}
+
+# 국가별 기본 키워드 (키워드가 없을 때 사용)
+COUNTRY_DEFAULT_KEYWORDS = {
+    "jp": "ニュース OR Japan",
+    "cn": "新闻 OR China",
+    "kr": "뉴스 OR Korea",
+    "us": "news OR United States OR America",
+    "gb": "news OR United Kingdom OR Britain",
+    "fr": "actualité OR France",
+    "de": "Nachrichten OR Germany",
+    "au": "news OR Australia",
+    "ca": "news OR Canada",
+}
+
+async def fetch_everything(
+    query: str,
+    from_date: str = None,
+    to_date: str = None,
+    page_size: int = 5,
+    sort_by: str = "popularity",
+    refresh: bool = False,
+) -> dict:
+    """NewsAPI get_everything 호출 (검색 결과 캐시 적용)
+
+    Args:
+        query: 검색어 (번역 완료된 키워드 또는 국가 기본 키워드)
+        from_date: 시작일
+        to_date: 종료일
+        page_size: 결과 개수
+        sort_by: 정렬 기준
+        refresh: True면 캐시를 건너뛰고 조회한 뒤 캐시 갱신
+
+    Returns:
+        NewsAPI 응답 (articles, totalResults)
+    """
+    cache_key = make_search_key(query, from_date, to_date, page_size, sort_by)
+    cached = None if refresh else await search_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"검색 캐시 적중: '{query}' ({len(cached.get('articles', []))}건)")
+        return cached
+
+    response = await news_client.get_everything(
+        q=query,
+        from_param=from_date,
+        to=to_date,
+        sort_by=sort_by,
+        page_size=page_size,
+    )
+    await search_cache.set(cache_key, response)
+    return response
+
+
+async def search_articles(
+    keyword: str,
+    country: str,
+    from_date: str = None,
+    to_date: str = None,
+    page_size: int = 5,
+    refresh: bool = False
+) -> tuple[dict, list[dict]]:
+    """뉴스 검색 단계 (키워드 번역 → NewsAPI 조회 → 국가 언어 필터링)
+
+    Args:
+        keyword: 검색 키워드 (없으면 국가별 기본 키워드)
+        country: 국가 코드
+        from_date: 시작일
+        to_date: 종료일
+        page_size: 결과 개수
+        refresh: True면 검색 결과 캐시를 건너뜀
+
+    Returns:
+        (NewsAPI 응답, 필터링된 기사 목록)
+    """
+    # 1. 뉴스 검색 (국가별 또는 전체)
+    # NewsAPI 제한: 일부 국가(jp, cn 등)는 get_top_headlines에서 뉴스가 없을 수 있음
+    # → 키워드가 있거나, 국가가 특정 국가면 get_everything 사용
+
+    # 국가별 대표 언론 도메인 (NewsAPI가 지원하는 도메인 위주, 예시는 확장 가능)
+    country_domain_map: dict[str, list[str]] = {
+        # 일본 주요 매체
+        "jp": [
+            "nhk.or.jp",
+            "asahi.com",
+            "yomiuri.co.jp",
+            "mainichi.jp",
+            "nikkei.com",
+        ],
+        # 중국 / 홍콩 매체 (NewsAPI에서 지원하는 일부 영어권 매체 포함)
+        "cn": [
+            "scmp.com",
+            "globaltimes.cn",
+        ],
+        # 한국: NewsAPI에서 공식 지원은 제한적이지만, 확장 가능성을 고려해 정의
+        "kr": [
+            "yna.co.kr",
+            "koreatimes.co.kr",
+            "koreaherald.com",
+        ],
+        # 미국
+        "us": [
+            "nytimes.com",
+            "wsj.com",
+            "washingtonpost.com",
+            "cnn.com",
+            "foxnews.com",
+            "nbcnews.com",
+        ],
+        # 영국
+        "gb": [
+            "bbc.co.uk",
+            "theguardian.com",
+            "independent.co.uk",
+            "telegraph.co.uk",
+        ],
+        # 프랑스
+        "fr": [
+            "lemonde.fr",
+            "lefigaro.fr",
+        ],
+        # 독일
+        "de": [
+            "spiegel.de",
+            "faz.net",
+        ],
+        # 호주
+        "au": [
+            "abc.net.au",
+            "theaustralian.com.au",
+        ],
+        # 캐나다
+        "ca": [
+            "theglobeandmail.com",
+            "nationalpost.com",
+        ],
+    }
+
+    # 모든 국가에서 도메인 필터링 제거 (언어 기반 필터링으로 대체)
+    domains = None
+
+    if country and country != "all":
+        # 키워드가 있으면 해당 국가의 언어로 번역
+        if keyword:
+            logger.info(f"키워드 번역 시작: '{keyword}' (국가: {country})")
+            translated_keyword = await run_in_threadpool(translate_keyword_for_country, keyword, country)
+            logger.info(f"키워드 번역 완료: '{keyword}' → '{translated_keyword}'")
+            search_query = translated_keyword
+            logger.info(f"번역된 키워드로 검색: '{search_query}' (국가: {country})")
+        else:
+            # 키워드 없으면 국가별 기본 키워드 사용
+            search_query = COUNTRY_DEFAULT_KEYWORDS.get(country, "news")
+
+        # 도메인 필터링 없이 검색 (언어 기반 후처리 필터링 사용)
+        logger.info(f"get_everything 사용: country={country}, from={from_date}, to={to_date} (도메인 필터링 없음)")
+        # 인기 뉴스에 가깝게 가져오기 위해 popularity 기준으로 정렬
+        response = await fetch_everything(
+            search_query,
+            from_date=from_date,
+            to_date=to_date,
+            sort_by="popularity",
+            page_size=page_size,
+            refresh=refresh,
+        )
+    else:
+        # 전체 검색 (날짜 범위 가능)
+        logger.info(f"get_everything 사용 (all 모드)")
+        # 전체(all) 모드도 popularity 기준 정렬 사용
+        response = await fetch_everything(
+            keyword.strip() if keyword else "news",
+            from_date=from_date,
+            to_date=to_date,
+            sort_by="popularity",
+            page_size=page_size,
+            refresh=refresh,
+        )
+
+    logger.info(f"검색 성공: {response.get('totalResults', 0)}건")
+
+    articles = response.get('articles', [])
+
+    # 국가별 언어 기반 기사 필터링
+    if country and country != "all" and articles:
+        language_regex = COUNTRY_LANGUAGE_REGEX.get(country)
+        if language_regex:
+            original_count = len(articles)
+            filtered_articles = []
+            for article in articles:
+                title = article.get("title", "") or ""
+                description = article.get("description", "") or ""
+                text = f"{title} {description}"
+                if language_regex.search(text):
+                    filtered_articles.append(article)
+
+            if filtered_articles:
+                logger.info(f"{country} 국가 언어 기사 필터링: {len(filtered_articles)}/{original_count}개 유지")
+                articles = filtered_articles
+            else:
+                logger.info(f"{country} 국가 언어 기사를 찾지 못해 원본 결과를 그대로 사용합니다.")
+
+    return response, articles
+
+
+async def _load_default_feed(country: str, page_size: int) -> tuple[dict, list[dict]]:
+    """헤드라인 사전 조회용 국가별 기본 피드 조회 (항상 NewsAPI에서 새로 조회)"""
+    return await search_articles(None, country, page_size=page_size, refresh=True)
+
+
+# 같은 파라미터로 동시에 들어온 검색 요청은 한 번만 처리
+search_flight = SingleFlight("search_news")
+
+
+# 키워드 없는 국가별 검색 결과를 주기적으로 미리 조회/번역
+# (HEADLINE_PREFETCH_ENABLED일 때 main.py startup에서 시작, 최근 요청된 피드만 갱신)
+headline_prefetcher = HeadlinePrefetcher(
+    _load_default_feed,
+    COUNTRY_DEFAULT_KEYWORDS.keys(),
+    source_languages=COUNTRY_SOURCE_LANGUAGE,
+)
+
+
+def _empty_search_data(country: str, translate_to: str) -> dict:
+    """검색 결과가 없을 때의 응답 data"""
+    return {
+        "total": 0,
+        "articles": [],
+        "country": country,
+        "translation_language": translate_to if translate_to != "none" else None,
+        "message": f"{country} 국가의 뉴스를 찾을 수 없습니다. 키워드를 입력해보세요."
+    }
+
+
+@router.get("/cache/stats")
+async def get_search_cache_stats():
+    """검색 결과 캐시 적중/실패 통계"""
+    return {
+        "status": "success",
+        "data": {
+            **search_cache.stats(),
+            "headlines": headline_prefetcher.stats(),
+            "coalescing": search_flight.stats()
+        }
+    }
+
+
 @router.get("/search")
 async def search_news(
     keyword: str = Query(None, description="검색 키워드 (선택, 없으면 국가 헤드라인)"),
@@ -69,174 +342,69 @@ async def search_news(
     Returns:
         뉴스 기사 목록 (번역 및 요약 포함)
     """
+    # 같은 검색이 진행 중이면 그 결과를 함께 사용 (키워드 번역/NewsAPI/번역/요약 중복 방지)
+    flight_key = (
+        " ".join(keyword.split()).casefold() if keyword else None,
+        country, translate_to, from_date, to_date, page_size, use_gpt,
+    )
+    return await search_flight.do(
+        flight_key,
+        lambda: _run_search(keyword, country, translate_to, from_date, to_date, page_size, use_gpt)
+    )
+
+
+async def _run_search(
+    keyword: str,
+    country: str,
+    translate_to: str,
+    from_date: str,
+    to_date: str,
+    page_size: int,
+    use_gpt: bool
+) -> dict:
+    """검색 → 번역 → 요약 파이프라인 (search_news 본체)"""
     try:
         logger.info(f"뉴스 검색: country={country}, keyword={keyword}, translate={translate_to}")
         
         # 1. 뉴스 검색 (국가별 또는 전체)
-        # NewsAPI 제한: 일부 국가(jp, cn 등)는 get_top_headlines에서 뉴스가 없을 수 있음
-        # → 키워드가 있거나, 국가가 특정 국가면 get_everything 사용
+        # 키워드 없는 국가별 검색은 미리 조회/번역해 둔 헤드라인 피드 사용
+        prefetched = None
+        if not keyword and country != "all" and not from_date and not to_date:
+            prefetched = headline_prefetcher.get(country, translate_to, page_size)
         
-        # 국가별 기본 키워드 (키워드가 없을 때 사용)
-        country_keywords = {
-            "jp": "ニュース OR Japan",
-            "cn": "新闻 OR China",
-            "kr": "뉴스 OR Korea",
-            "us": "news OR United States OR America",
-            "gb": "news OR United Kingdom OR Britain",
-            "fr": "actualité OR France",
-            "de": "Nachrichten OR Germany",
-            "au": "news OR Australia",
-            "ca": "news OR Canada",
-        }
-        
-        # 국가별 대표 언론 도메인 (NewsAPI가 지원하는 도메인 위주, 예시는 확장 가능)
-        country_domain_map: dict[str, list[str]] = {
-            # 일본 주요 매체
-            "jp": [
-                "nhk.or.jp",
-                "asahi.com",
-                "yomiuri.co.jp",
-                "mainichi.jp",
-                "nikkei.com",
-            ],
-            # 중국 / 홍콩 매체 (NewsAPI에서 지원하는 일부 영어권 매체 포함)
-            "cn": [
-                "scmp.com",
-                "globaltimes.cn",
-            ],
-            # 한국: NewsAPI에서 공식 지원은 제한적이지만, 확장 가능성을 고려해 정의
-            "kr": [
-                "yna.co.kr",
-                "koreatimes.co.kr",
-                "koreaherald.com",
-            ],
-            # 미국
-            "us": [
-                "nytimes.com",
-                "wsj.com",
-                "washingtonpost.com",
-                "cnn.com",
-                "foxnews.com",
-                "nbcnews.com",
-            ],
-            # 영국
-            "gb": [
-                "bbc.co.uk",
-                "theguardian.com",
-                "independent.co.uk",
-                "telegraph.co.uk",
-            ],
-            # 프랑스
-            "fr": [
-                "lemonde.fr",
-                "lefigaro.fr",
-            ],
-            # 독일
-            "de": [
-                "spiegel.de",
-                "faz.net",
-            ],
-            # 호주
-            "au": [
-                "abc.net.au",
-                "theaustralian.com.au",
-            ],
-            # 캐나다
-            "ca": [
-                "theglobeandmail.com",
-                "nationalpost.com",
-            ],
-        }
-        
-        # 모든 국가에서 도메인 필터링 제거 (언어 기반 필터링으로 대체)
-        domains = None
-        
-        if country and country != "all":
-            # 키워드가 있으면 해당 국가의 언어로 번역
-            if keyword:
-                logger.info(f"키워드 번역 시작: '{keyword}' (국가: {country})")
-                translated_keyword = translate_keyword_for_country(keyword, country)
-                logger.info(f"키워드 번역 완료: '{keyword}' → '{translated_keyword}'")
-                search_query = translated_keyword
-                logger.info(f"번역된 키워드로 검색: '{search_query}' (국가: {country})")
-            else:
-                # 키워드 없으면 국가별 기본 키워드 사용
-                search_query = country_keywords.get(country, "news")
-            
-            # 도메인 필터링 없이 검색 (언어 기반 후처리 필터링 사용)
-            logger.info(f"get_everything 사용: country={country}, from={from_date}, to={to_date} (도메인 필터링 없음)")
-            # 인기 뉴스에 가깝게 가져오기 위해 popularity 기준으로 정렬
-            response = newsapi.get_everything(
-                q=search_query,
-                from_param=from_date,
-                to=to_date,
-                sort_by="popularity",
-                page_size=page_size,
-            )
+        if prefetched is not None:
+            total, articles = prefetched
+            response = {"totalResults": total, "articles": articles}
+            logger.info(f"사전 조회 헤드라인 사용: country={country}, {len(articles)}건")
         else:
-            # 전체 검색 (날짜 범위 가능)
-            logger.info(f"get_everything 사용 (all 모드)")
-            # 전체(all) 모드도 popularity 기준 정렬 사용
-            response = newsapi.get_everything(
-                q=keyword if keyword else "news",
-                from_param=from_date,
-                to=to_date,
-                sort_by="popularity",
-                page_size=page_size,
-            )
-        
-        logger.info(f"검색 성공: {response.get('totalResults', 0)}건")
-        
-        articles = response.get('articles', [])
-
-        # 국가별 언어 기반 기사 필터링
-        if country and country != "all" and articles:
-            language_regex = COUNTRY_LANGUAGE_REGEX.get(country)
-            if language_regex:
-                original_count = len(articles)
-                filtered_articles = []
-                for article in articles:
-                    title = article.get("title", "") or ""
-                    description = article.get("description", "") or ""
-                    text = f"{title} {description}"
-                    if language_regex.search(text):
-                        filtered_articles.append(article)
-
-                if filtered_articles:
-                    logger.info(f"{country} 국가 언어 기사 필터링: {len(filtered_articles)}/{original_count}개 유지")
-                    articles = filtered_articles
-                else:
-                    logger.info(f"{country} 국가 언어 기사를 찾지 못해 원본 결과를 그대로 사용합니다.")
+            response, articles = await search_articles(keyword, country, from_date, to_date, page_size)
         
         # 결과가 없으면 에러 메시지 개선
         if not articles or len(articles) == 0:
             logger.warning(f"검색 결과 없음: country={country}, keyword={keyword}")
             return {
                 "status": "success",
-                "data": {
-                    "total": 0,
-                    "articles": [],
-                    "country": country,
-                    "translation_language": translate_to if translate_to != "none" else None,
-                    "message": f"{country} 국가의 뉴스를 찾을 수 없습니다. 키워드를 입력해보세요."
-                }
+                "data": _empty_search_data(country, translate_to)
             }
         
         # 2. 번역 (translate_to가 "none"이 아닌 경우)
-        if articles and translate_to and translate_to != "none":
+        if prefetched is None and articles and translate_to and translate_to != "none":
             logger.info(f"번역 시작: {len(articles)}개 기사 → {translate_to}")
             try:
-                articles = translate_articles(articles, target_lang=translate_to)
+                articles = await run_in_threadpool(translate_articles, articles, target_lang=translate_to)
                 logger.info("번역 완료")
             except Exception as translate_error:
                 logger.error(f"번역 실패: {translate_error}")
                 # 번역 실패 시 원문 그대로
         
+        # 트렌드 키워드 집계 (백그라운드)
+        trending_keywords.submit(country, articles)
+        
         # 3. GPT 요약 (선택적)
         if use_gpt and articles:
             logger.info(f"GPT-4 요약 시작: {len(articles)}개 기사")
             try:
-                articles = summarize_articles_with_gpt(articles, max_sentences=3)
+                articles = await run_in_threadpool(summarize_articles_with_gpt, articles, max_sentences=3)
                 logger.info(f"GPT-4 요약 완료: {len(articles)}개 기사 처리됨")
                 # 요약이 성공한 기사 수 확인
                 summarized_count = sum(1 for a in articles if a.get('summary') and a.get('summary_type') == 'gpt')
@@ -264,4 +432,148 @@ async def search_news(
     except Exception as e:
         logger.error(f"뉴스 검색 에러: {type(e).__name__}: {str(e)}")
         logger.exception("상세 에러:")
-        raise HTTPException(status_code=500, detail=f"뉴스 검색 실패: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"뉴스 검색 실패: {str(e)}")
+
+
+@router.get("/search/stream")
+async def search_news_stream(
+    keyword: str = Query(None, description="검색 키워드 (선택, 없으면 국가 헤드라인)"),
+    country: str = Query("kr", description="국가 코드 (kr, us, jp, cn, gb, all 등)"),
+    translate_to: str = Query("ko", description="번역 언어 (ko, en, ja, none)"),
+    from_date: str = Query(None, description="시작일 (YYYY-MM-DD, all 모드에서만)"),
+    to_date: str = Query(None, description="종료일 (YYYY-MM-DD, all 모드에서만)"),
+    page_size: int = Query(5, ge=1, le=100, description="결과 개수"),
+    use_gpt: bool = Query(False, description="GPT-4 요약 사용 여부")
+):
+    """국가별 뉴스 검색 스트리밍 API (NDJSON)
+    
+    NewsAPI 조회가 끝나면 원문 기사 목록을 바로 보내고,
+    번역/요약은 끝나는 대로 기사별 패치로 이어서 보냅니다.
+    
+    이벤트 (한 줄에 JSON 하나):
+        {"type": "articles", "data": {...}}                 원문 기사 목록 (/search의 data와 같은 형태)
+        {"type": "translation", "index": i, "data": {...}}  기사 i의 translated_*/original_* 필드
+        {"type": "summary", "index": i, "data": {...}}      기사 i의 summary/summary_type 필드
+        {"type": "error", "stage": "...", "detail": "..."}  단계별 실패 (나머지 스트림은 계속)
+        {"type": "done"}
+    """
+    try:
+        logger.info(f"뉴스 검색(스트리밍): country={country}, keyword={keyword}, translate={translate_to}")
+        response, articles = await search_articles(keyword, country, from_date, to_date, page_size)
+    except Exception as e:
+        logger.error(f"뉴스 검색 에러: {type(e).__name__}: {str(e)}")
+        logger.exception("상세 에러:")
+        raise HTTPException(status_code=500, detail=f"뉴스 검색 실패: {str(e)}")
+    
+    trending_keywords.submit(country, articles)
+    
+    return StreamingResponse(
+        _stream_search_events(response, articles, country, translate_to, use_gpt),
+        media_type="application/x-ndjson"
+    )
+
+
+async def _stream_search_events(
+    response: dict,
+    articles: list[dict],
+    country: str,
+    translate_to: str,
+    use_gpt: bool
+):
+    """스트리밍 검색 이벤트 생성 (원문 목록 → 번역/요약 패치 → done)"""
+    if not articles:
+        yield _ndjson({"type": "articles", "data": _empty_search_data(country, translate_to)})
+        yield _ndjson({"type": "done"})
+        return
+    
+    yield _ndjson({
+        "type": "articles",
+        "data": {
+            "total": response.get("totalResults", 0),
+            "articles": articles,
+            "country": country,
+            "translation_language": translate_to if translate_to != "none" else None
+        }
+    })
+    
+    # 번역/요약 작업이 끝나는 대로 이벤트를 넣는 큐 (작업마다 종료 시 None)
+    queue: asyncio.Queue = asyncio.Queue()
+    tasks = []
+    
+    if translate_to and translate_to != "none":
+        for start in range(0, len(articles), STREAM_TRANSLATION_CHUNK_SIZE):
+            tasks.append(asyncio.create_task(
+                _stream_translation_chunk(queue, articles, start, translate_to)
+            ))
+    
+    if use_gpt and is_gpt_summary_available():
+        await run_in_threadpool(prefetch_article_summaries, articles, 3)
+        semaphore = asyncio.Semaphore(GPT_SUMMARY_CONCURRENCY)
+        for idx, article in enumerate(articles):
+            tasks.append(asyncio.create_task(
+                _stream_summary(queue, semaphore, idx, article)
+            ))
+    elif use_gpt:
+        logger.info("GPT 요약 사용 불가 (API 키 없음 또는 서킷 차단)")
+    
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await queue.get()
+            if event is None:
+                remaining -= 1
+                continue
+            yield _ndjson(event)
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 작업 취소
+        for task in tasks:
+            task.cancel()
+    
+    yield _ndjson({"type": "done"})
+
+
+async def _stream_translation_chunk(queue: asyncio.Queue, articles: list[dict], start: int, target_lang: str):
+    """기사 묶음을 번역하고 기사별 번역 패치를 큐에 넣음"""
+    chunk = articles[start:start + STREAM_TRANSLATION_CHUNK_SIZE]
+    try:
+        translated = await run_in_threadpool(translate_articles, chunk, target_lang=target_lang)
+        for offset, article in enumerate(translated):
+            if "translation_language" not in article:
+                continue  # 번역 실패한 기사 (원문 그대로)
+            await queue.put({
+                "type": "translation",
+                "index": start + offset,
+                "data": _pick_fields(article, TRANSLATION_PATCH_FIELDS)
+            })
+    except Exception as e:
+        logger.error(f"번역 실패 (기사 {start+1}~{start+len(chunk)}): {e}")
+        await queue.put({"type": "error", "stage": "translation", "detail": str(e)})
+    finally:
+        await queue.put(None)
+
+
+async def _stream_summary(queue: asyncio.Queue, semaphore: asyncio.Semaphore, idx: int, article: dict):
+    """기사 하나를 요약하고 요약 패치를 큐에 넣음"""
+    try:
+        async with semaphore:
+            summarized = await run_in_threadpool(summarize_article_with_gpt, article, 3)
+        await queue.put({
+            "type": "summary",
+            "index": idx,
+            "data": _pick_fields(summarized, SUMMARY_PATCH_FIELDS)
+        })
+    except Exception as e:
+        logger.error(f"GPT-4 요약 실패 (기사 {idx+1}): {e}")
+        await queue.put({"type": "error", "stage": "summary", "detail": str(e)})
+    finally:
+        await queue.put(None)
+
+
+def _pick_fields(article: dict, fields: tuple) -> dict:
+    """기사에서 패치로 보낼 필드만 추출"""
+    return {field: article[field] for field in fields if field in article}
+
+
+def _ndjson(event: dict) -> str:
+    """이벤트를 NDJSON 한 줄로 직렬화"""
+    return json.dumps(event, ensure_ascii=False, default=str) + "\n"
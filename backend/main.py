@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -20,28 +21,42 @@ app.add_middleware(
 )
 
 # 라우터 등록
-# 성능 및 안정성 문제로 분석 라우터(analysis) 일시 비활성화
-from api import news, auth, history, category  # analysis 임시 제외
+# 분석 라우터의 형태소 분석(KoNLPy/JVM)은 별도 워커 프로세스에서 실행
+from api import news, auth, history, category, admin, analysis
 
 app.include_router(auth.router)
 app.include_router(news.router)
-# app.include_router(analysis.router)  # Java/SIGBUS 문제로 비활성화
+app.include_router(analysis.router)
 app.include_router(history.router)
 app.include_router(category.router)
+app.include_router(admin.router)
 
 # 정적 파일 마운트 (API 라우터 다음에)
-static_dir = Path("static/wordcloud")
+from services.wordcloud_store import wordcloud_store, wordcloud_asset_cache, WORDCLOUD_DIR
+static_dir = Path(WORDCLOUD_DIR)
 static_dir.mkdir(parents=True, exist_ok=True)
 
 # 워드클라우드 이미지 서빙을 위한 별도 라우트 추가
+# 파일명이 내용 해시라 바뀌지 않으므로 ETag + immutable 캐시 헤더, 조건부 요청은 304
+_WORDCLOUD_MEDIA_TYPES = {".png": "image/png", ".webp": "image/webp"}
+
+
 @app.get("/api/wordcloud/{filename}")
-async def serve_wordcloud(filename: str):
-    from fastapi.responses import FileResponse
-    file_path = static_dir / filename
-    if file_path.exists():
-        return FileResponse(file_path)
-    from fastapi import HTTPException
-    raise HTTPException(status_code=404, detail="Image not found")
+async def serve_wordcloud(filename: str, request: Request):
+    media_type = _WORDCLOUD_MEDIA_TYPES.get(Path(filename).suffix)
+    if media_type is None or Path(filename).name != filename:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    file_path = str(static_dir / filename)
+    asset = wordcloud_asset_cache.get(file_path)
+    if asset is None:
+        asset = await run_in_threadpool(wordcloud_asset_cache.load, file_path, media_type)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Image not found")
+        wordcloud_store.touch(file_path)
+    else:
+        wordcloud_store.touch(file_path, update_mtime=False)
+    return wordcloud_asset_cache.response(request, asset)
 
 # 기타 정적 파일
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -59,6 +74,46 @@ async def startup_event():
         import traceback
         traceback.print_exc()
 
+    # 프롬프트가 바뀌었거나 만료된 GPT 요약 캐시 정리
+    try:
+        from services.gpt_summarizer import SUMMARY_PROMPT_VERSION
+        from services.summary_cache import purge_stale_summaries
+        purge_stale_summaries(SUMMARY_PROMPT_VERSION)
+    except Exception as e:
+        print(f"[WARNING] Summary cache purge failed: {e}", file=sys.stderr)
+
+    # 명사 추출 엔진 준비 (okt 엔진은 JVM 초기화가 오래 걸리므로 백그라운드에서)
+    import asyncio
+    from services.noun_extractors import get_noun_extractor
+    asyncio.get_running_loop().run_in_executor(None, get_noun_extractor().start)
+
+    # 워드클라우드 렌더링 워커 기동 (워커마다 한글 폰트를 미리 불러옴)
+    from services.wordcloud_pool import wordcloud_pool
+    asyncio.get_running_loop().run_in_executor(None, wordcloud_pool.start)
+
+    # 오래된 워드클라우드 이미지 백그라운드 정리 시작
+    wordcloud_store.start()
+
+    # 국가별 기본 헤드라인 사전 조회 시작
+    from services.headline_prefetcher import HEADLINE_PREFETCH_ENABLED
+    if HEADLINE_PREFETCH_ENABLED:
+        news.headline_prefetcher.start()
+
+
+# Shutdown 이벤트: 외부 API 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    from services.news_client import news_client
+    await news.headline_prefetcher.stop()
+    await wordcloud_store.stop()
+    from services.noun_extractors import get_noun_extractor
+    get_noun_extractor().close()
+    from services.wordcloud_pool import wordcloud_pool
+    wordcloud_pool.close()
+    await news_client.aclose()
+    from database import dispose_async_engine
+    await dispose_async_engine()
+
 
 @app.get("/")
 async def root():
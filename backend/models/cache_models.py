@@ -0,0 +1,50 @@
+"""
+캐시 관련 데이터베이스 모델 (번역 메모리, 요약 캐시 등)
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from database import Base
+
+
+class KeywordTranslation(Base):
+    """검색 키워드 번역 메모리 (keyword, country) → 번역 키워드"""
+    __tablename__ = "keyword_translations"
+    __table_args__ = (
+        UniqueConstraint("keyword", "country", name="uq_keyword_translations_keyword_country"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword = Column(String(255), nullable=False)  # 정규화된 원본 키워드
+    country = Column(String(10), nullable=False)
+    translated_keyword = Column(String(255), nullable=False)
+    provider = Column(String(20))  # gpt / google
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class TextTranslation(Base):
+    """기사 텍스트 번역 캐시 (원문 해시 + 대상 언어 + 번역기)"""
+    __tablename__ = "text_translations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, index=True, nullable=False)  # sha256(provider, target_lang, text)
+    target_lang = Column(String(10), nullable=False)
+    provider = Column(String(20), nullable=False)  # gpt / google
+    translated_text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime, index=True)  # UTC, None이면 만료 없음
+
+
+class SummaryCache(Base):
+    """GPT 요약 캐시 (기사 URL/본문 해시 + 모델 + 문장 수 + 프롬프트 버전)"""
+    __tablename__ = "summary_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, index=True, nullable=False)
+    article_url = Column(Text)
+    model = Column(String(50), nullable=False)
+    max_sentences = Column(Integer, nullable=False)
+    prompt_version = Column(String(20), index=True, nullable=False)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime, index=True)  # UTC
@@ -0,0 +1,134 @@
+"""
+명사 추출 엔진 벤치마크 (okt vs simple)
+
+고정된 한국어 뉴스 문장 코퍼스로 엔진별 준비 시간, 처리 속도,
+Okt 대비 명사 일치도(문장별 Jaccard, 상위 키워드 겹침)를 비교합니다.
+
+사용법:
+    python scripts/benchmark_noun_extractors.py
+    python scripts/benchmark_noun_extractors.py --repeat 20 --corpus my_corpus.txt
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.keyword_analyzer import clean_text, filter_nouns
+from services.noun_extractors import NOUN_EXTRACTORS
+
+# 고정 코퍼스 (뉴스 제목/요약 형태의 문장)
+DEFAULT_CORPUS = [
+    "정부가 반도체 산업 경쟁력 강화를 위한 지원 방안을 발표했다.",
+    "삼성전자는 올해 시설 투자를 확대하기로 결정했다고 밝혔다.",
+    "한국은행이 기준금리를 동결하면서 대출 금리 인하 기대가 커지고 있다.",
+    "서울 아파트 매매 가격이 석 달 연속 상승세를 이어갔다.",
+    "국회는 본회의를 열고 내년도 예산안을 처리했다.",
+    "기상청은 주말 동안 전국에 강한 비와 바람이 예상된다고 예보했다.",
+    "미국 연방준비제도의 금리 결정을 앞두고 원달러 환율이 급등했다.",
+    "전기차 배터리 수출이 지난달 역대 최대 실적을 기록했다.",
+    "교육부는 대학 입시 제도 개편안을 다음 달 확정할 계획이다.",
+    "프로야구 한국시리즈 1차전에서 홈팀이 역전승을 거뒀다.",
+    "인공지능 기술을 활용한 의료 진단 서비스가 병원에 도입됐다.",
+    "정부는 저출산 문제 해결을 위해 육아휴직 급여를 인상한다고 발표했다.",
+    "코스피 지수가 외국인 매수세에 힘입어 상승 마감했다.",
+    "환경부는 미세먼지 저감을 위한 비상 조치를 시행했다.",
+    "대통령은 정상회담에서 양국 간 경제 협력 확대에 합의했다.",
+    "국내 게임 업체들이 해외 시장 진출에 속도를 내고 있다.",
+    "보건당국은 독감 예방접종을 조기에 시작한다고 밝혔다.",
+    "물가 상승률이 둔화되면서 소비 심리가 회복되는 모습이다.",
+    "자동차 업계는 노사 협상이 타결되면서 생산 차질 우려를 덜었다.",
+    "검찰은 횡령 혐의를 받는 기업 대표에 대해 구속영장을 청구했다.",
+    # 끝 글자가 조사(의/이)와 같은 명사 (simple 엔진이 잘라내지 않아야 함)
+    "민주주의 고양이 사회주의 경제가 성장했다.",
+    "자본주의의 위기 속에서 어린이 보호 정책과 민주주의의 가치가 논의됐다.",
+]
+
+
+def load_corpus(path: str = None) -> list:
+    """코퍼스 로드 (파일이 없으면 기본 코퍼스)"""
+    if not path:
+        return DEFAULT_CORPUS
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def run_engine(name: str, texts: list, repeat: int) -> dict:
+    """엔진 하나의 준비 시간/처리 시간/결과 측정"""
+    extractor = NOUN_EXTRACTORS[name]()
+
+    started = time.perf_counter()
+    extractor.start()
+    nouns = extractor.nouns_batch(texts)  # 첫 호출 (워밍업 포함)
+    startup = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        extractor.nouns_batch(texts)
+    elapsed = time.perf_counter() - started
+
+    extractor.close()
+    return {
+        "startup": startup,
+        "elapsed": elapsed,
+        "texts_per_sec": len(texts) * repeat / elapsed if elapsed else float("inf"),
+        "nouns": [filter_nouns(text_nouns) for text_nouns in nouns],
+    }
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명사 추출 엔진 벤치마크")
+    parser.add_argument("--corpus", help="코퍼스 파일 (한 줄에 문장 하나)")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--top", type=int, default=20, help="상위 키워드 비교 개수")
+    parser.add_argument("--engines", default="okt,simple", help="비교할 엔진 (쉼표 구분, 첫 번째가 기준)")
+    args = parser.parse_args()
+
+    texts = [clean_text(text) for text in load_corpus(args.corpus)]
+    engines = [name.strip() for name in args.engines.split(",") if name.strip()]
+
+    print(f"코퍼스: {len(texts)}개 문장, 반복 {args.repeat}회")
+    print("-" * 70)
+
+    results = {}
+    for name in engines:
+        try:
+            results[name] = run_engine(name, texts, args.repeat)
+        except Exception as e:
+            print(f"[{name}] 실행 실패: {type(e).__name__}: {e}")
+            continue
+        result = results[name]
+        print(
+            f"[{name:>6}] 준비 {result['startup']:.3f}초 | "
+            f"처리 {result['elapsed']:.3f}초 ({result['texts_per_sec']:.0f} 문장/초)"
+        )
+
+    baseline = engines[0]
+    if baseline not in results:
+        return
+
+    print("-" * 70)
+    base_nouns = results[baseline]["nouns"]
+    base_top = {word for word, _ in Counter(n for nouns in base_nouns for n in nouns).most_common(args.top)}
+    for name, result in results.items():
+        if name == baseline:
+            continue
+        per_text = [jaccard(set(a), set(b)) for a, b in zip(base_nouns, result["nouns"])]
+        top = {word for word, _ in Counter(n for nouns in result["nouns"] for n in nouns).most_common(args.top)}
+        print(
+            f"[{name:>6}] {baseline} 대비 문장별 명사 Jaccard 평균 {sum(per_text) / len(per_text):.3f} | "
+            f"상위 {args.top}개 키워드 겹침 {len(base_top & top)}/{args.top}"
+        )
+
+
+if __name__ == "__main__":
+    main()
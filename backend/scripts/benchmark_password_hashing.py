@@ -0,0 +1,107 @@
+"""
+로그인 비밀번호 검증 벤치마크 (이벤트 루프 직접 실행 vs 전용 스레드 풀)
+
+동시 로그인 요청을 흉내 내어 방식별 처리량(로그인/초), 지연 시간(p50/p99)과
+그동안 다른 요청이 겪는 이벤트 루프 지연(10ms 주기 하트비트의 최대 지연)을 비교합니다.
+- inline: async 함수 안에서 verify_password를 바로 호출 (기존 방식)
+- executor: verify_and_update_password_async (전용 스레드 풀, 재해싱 포함)
+
+사용법:
+    python scripts/benchmark_password_hashing.py
+    python scripts/benchmark_password_hashing.py --concurrency 32 --requests 128
+    BCRYPT_ROUNDS=10 PASSWORD_HASH_WORKERS=8 python scripts/benchmark_password_hashing.py
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.auth import (
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    get_password_hash,
+    verify_password,
+    verify_and_update_password_async,
+)
+
+PASSWORD = "benchmark-password-1234"
+
+
+async def login_inline(hashed: str) -> bool:
+    """기존 방식: 이벤트 루프에서 bcrypt 실행"""
+    return verify_password(PASSWORD, hashed)
+
+
+async def login_executor(hashed: str) -> bool:
+    """새 방식: 전용 스레드 풀에서 bcrypt 실행"""
+    verified, _ = await verify_and_update_password_async(PASSWORD, hashed)
+    return verified
+
+
+async def heartbeat(interval: float, lags: list, stop: asyncio.Event):
+    """다른 요청 역할: 주기적으로 깨어나 예정보다 늦어진 시간을 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(login, hashed: str, concurrency: int, requests: int) -> dict:
+    """동시 요청 concurrency개로 총 requests번 로그인"""
+    latencies = []
+    lags = []
+    stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(arrived: float):
+        # 지연 시간은 요청 도착부터 측정 (이벤트 루프가 막혀 처리 시작이 늦어진 시간 포함)
+        async with semaphore:
+            assert await login(hashed)
+        latencies.append(time.perf_counter() - arrived)
+
+    beat = asyncio.create_task(heartbeat(0.01, lags, stop))
+    started = time.perf_counter()
+    # 모든 요청이 동시에 도착한 상황
+    await asyncio.gather(*(one(started) for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "max_lag": max(lags, default=0.0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 비밀번호 검증 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=64, help="총 로그인 수")
+    args = parser.parse_args()
+
+    hashed = get_password_hash(PASSWORD)
+    print(
+        f"bcrypt rounds {BCRYPT_ROUNDS}, 해싱 스레드 {PASSWORD_HASH_WORKERS}개, "
+        f"동시 {args.concurrency}, 총 {args.requests}회"
+    )
+    print("-" * 70)
+
+    for name, login in (("inline", login_inline), ("executor", login_executor)):
+        result = asyncio.run(run(login, hashed, args.concurrency, args.requests))
+        print(
+            f"[{name:>8}] {result['throughput']:7.1f} 로그인/초 | "
+            f"p50 {result['p50']:8.1f}ms | p99 {result['p99']:8.1f}ms | "
+            f"이벤트 루프 최대 지연 {result['max_lag']:8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+워드클라우드 렌더링 벤치마크
+
+기존 방식(matplotlib figure에 imshow 후 savefig(bbox_inches='tight')로 파일 저장)과
+Pillow로 메모리에서 바로 PNG/WebP 바이트를 만드는 방식의 시간과 크기를 비교합니다.
+레이아웃 계산(WordCloud.generate_from_frequencies)은 모든 방식이 같으므로 한 번만 하고
+인코딩/저장 단계만 반복 측정합니다.
+
+사용법:
+    python scripts/benchmark_wordcloud.py
+    python scripts/benchmark_wordcloud.py --repeat 20 --width 800 --height 600
+    WORDCLOUD_FONT_PATH=/path/to/font.ttf python scripts/benchmark_wordcloud.py
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordcloud import WordCloud
+
+from services.wordcloud_generator import IMAGE_FORMATS, WORDCLOUD_STYLE, _find_font_path
+
+# 고정 키워드 (뉴스 키워드 분석 결과 형태)
+SAMPLE_KEYWORDS = {
+    "경제": 42, "금리": 35, "반도체": 31, "정부": 29, "대통령": 27, "수출": 24, "투자": 22,
+    "환율": 20, "국회": 19, "선거": 18, "부동산": 17, "아파트": 16, "물가": 15, "기업": 15,
+    "삼성전자": 14, "배터리": 13, "전기차": 12, "인공지능": 12, "교육": 11, "의료": 10,
+    "기후": 10, "에너지": 9, "일자리": 9, "청년": 8, "저출산": 8, "관세": 7, "미국": 7,
+    "중국": 7, "일본": 6, "외교": 6, "안보": 5, "코스피": 5, "주가": 5, "소비": 4, "관광": 4,
+}
+
+
+def legacy_savefig(wc: WordCloud, width: int, height: int, path: str) -> int:
+    """기존 방식: matplotlib figure → savefig(bbox_inches='tight') → 파일"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(width/100, height/100), dpi=100)
+    plt.imshow(wc, interpolation='bilinear')
+    plt.axis('off')
+    plt.tight_layout(pad=0)
+    plt.savefig(path, format='png', bbox_inches='tight', dpi=100)
+    plt.close()
+    return os.path.getsize(path)
+
+
+def pillow_bytes(wc: WordCloud, image_format: str) -> int:
+    """새 방식: WordCloud 이미지를 Pillow로 메모리에서 바로 인코딩"""
+    buffer = io.BytesIO()
+    wc.to_image().save(buffer, **IMAGE_FORMATS[image_format][2])
+    return len(buffer.getvalue())
+
+
+def measure(fn, repeat: int) -> tuple[float, int]:
+    """평균 시간(ms)과 결과 크기"""
+    size = fn()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        size = fn()
+    return (time.perf_counter() - started) / repeat * 1000, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워드클라우드 렌더링 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--width", type=int, default=600)
+    parser.add_argument("--height", type=int, default=400)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    wc = WordCloud(
+        width=args.width,
+        height=args.height,
+        font_path=_find_font_path(),
+        **WORDCLOUD_STYLE
+    ).generate_from_frequencies(SAMPLE_KEYWORDS)
+    layout_ms = (time.perf_counter() - started) * 1000
+
+    print(f"키워드 {len(SAMPLE_KEYWORDS)}개, {args.width}x{args.height}, 반복 {args.repeat}회")
+    print(f"레이아웃 계산 (공통): {layout_ms:.1f}ms")
+    print("-" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, "legacy.png")
+        cases = [
+            ("matplotlib savefig PNG (파일)", lambda: legacy_savefig(wc, args.width, args.height, legacy_path)),
+            ("Pillow PNG (메모리)", lambda: pillow_bytes(wc, "png")),
+            ("Pillow WebP (메모리)", lambda: pillow_bytes(wc, "webp")),
+        ]
+        for name, fn in cases:
+            elapsed_ms, size = measure(fn, args.repeat)
+            print(f"{name:<30} {elapsed_ms:8.1f}ms  {size / 1024:8.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -48,7 +48,7 @@ def main():
         new_tables = check_tables()
         print(f"생성된 테이블: {new_tables}")
         
-        expected_tables = ['users', 'search_histories', 'categories']
+        expected_tables = ['users', 'search_histories', 'categories', 'keyword_translations', 'text_translations', 'summary_cache']
         missing_tables = [t for t in expected_tables if t not in new_tables]
         
         if missing_tables:
@@ -4,15 +4,86 @@ GPT-4 기반 뉴스 요약 서비스
 OpenAI GPT-4o-mini를 사용하여 뉴스 기사를 자연스럽게 요약합니다.
 """
 
+import openai
 from openai import OpenAI
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 from dotenv import load_dotenv
 import logging
 
+from services.token_budget import (
+    trim_to_token_budget,
+    plan_chat_request,
+    record_usage,
+    estimate_cost_usd,
+)
+from services.summary_cache import make_summary_key, get_cached_summary, prefetch_summaries, save_summary
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limit import ProviderLimiter
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 병렬 요약 설정
+GPT_SUMMARY_CONCURRENCY = int(os.getenv("GPT_SUMMARY_CONCURRENCY", "8"))  # 동시에 진행하는 요약 호출 수
+GPT_SUMMARY_RATE = float(os.getenv("GPT_SUMMARY_RATE", "0"))  # 초당 호출 수 (0이면 제한 없음)
+GPT_SUMMARY_MAX_WORKERS = int(os.getenv("GPT_SUMMARY_MAX_WORKERS", "16"))
+GPT_CIRCUIT_RESET_SECONDS = float(os.getenv("GPT_CIRCUIT_RESET_SECONDS", "60"))
+
+# 토큰 예산 (기사 본문 입력 / 요약 출력)
+GPT_SUMMARY_INPUT_TOKENS = int(os.getenv("GPT_SUMMARY_INPUT_TOKENS", "1500"))
+GPT_SUMMARY_MAX_COMPLETION_TOKENS = int(os.getenv("GPT_SUMMARY_MAX_COMPLETION_TOKENS", "300"))
+
+# 요청 간 공유되는 호출 제한 / 서킷 브레이커
+summary_limiter = ProviderLimiter("gpt-summary", GPT_SUMMARY_CONCURRENCY, GPT_SUMMARY_RATE)
+summary_circuit = CircuitBreaker("gpt-summary", failure_threshold=5, reset_timeout=GPT_CIRCUIT_RESET_SECONDS)
+_summary_executor = ThreadPoolExecutor(max_workers=GPT_SUMMARY_MAX_WORKERS, thread_name_prefix="gpt-summary")
+
+# 요약 프롬프트 (수정하면 SUMMARY_PROMPT_VERSION이 바뀌어 기존 요약 캐시가 무효화됨)
+SUMMARY_SYSTEM_PROMPT = """당신은 뉴스 기사 요약 전문가입니다. 
+주어진 뉴스 기사를 핵심 내용만 담아 {max_sentences}문장 이내로 간결하게 요약하세요.
+- 객관적이고 중립적인 톤 유지
+- 중요한 사실과 숫자 포함
+- 불필요한 수식어 제거
+- 한국어로 답변"""
+SUMMARY_USER_PROMPT = "다음 뉴스 기사를 {max_sentences}문장으로 요약하세요:\n\n{text}"
+SUMMARY_PROMPT_VERSION = hashlib.sha256(
+    (SUMMARY_SYSTEM_PROMPT + "\x00" + SUMMARY_USER_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
+# 서킷을 즉시 차단하는 에러 종류 (재시도해도 실패)
+FATAL_ERROR_KINDS = {"quota", "auth"}
+
+
+class GPTSummaryError(Exception):
+    """GPT 요약 실패 (kind: quota, auth, rate_limit, network, other)"""
+
+    def __init__(self, message: str, kind: str = "other"):
+        super().__init__(message)
+        self.kind = kind
+
+
+def classify_openai_error(error: Exception) -> str:
+    """
+    OpenAI 예외 타입으로 에러 종류를 분류합니다.
+    
+    Returns:
+        quota(할당량 초과), auth(인증/권한), rate_limit(일시적 429),
+        network(타임아웃/연결), other
+    """
+    if isinstance(error, GPTSummaryError):
+        return error.kind
+    if isinstance(error, (openai.AuthenticationError, openai.PermissionDeniedError)):
+        return "auth"
+    if isinstance(error, openai.RateLimitError):
+        return "quota" if getattr(error, "code", None) == "insufficient_quota" else "rate_limit"
+    if isinstance(error, openai.APIConnectionError):  # APITimeoutError 포함
+        return "network"
+    return "other"
+
 # OpenAI 클라이언트 초기화
 client = None
 try:
@@ -43,34 +114,34 @@ def summarize_with_gpt(
         요약된 텍스트
     
     Raises:
-        Exception: API 키가 없거나 요청 실패 시
+        GPTSummaryError: API 키가 없거나 요청 실패 시 (kind로 에러 종류 구분)
     """
     if not client:
-        raise Exception("OpenAI API 키가 설정되지 않았습니다. .env 파일에 OPENAI_API_KEY를 추가하세요.")
+        raise GPTSummaryError("OpenAI API 키가 설정되지 않았습니다. .env 파일에 OPENAI_API_KEY를 추가하세요.", kind="auth")
     
     if not text or len(text.strip()) < 50:
         return text  # 텍스트가 너무 짧으면 그대로 반환
     
     try:
+        # 기사 본문을 토큰 예산에 맞춰 문장 단위로 자름
+        text = trim_to_token_budget(text, GPT_SUMMARY_INPUT_TOKENS, model)
+        messages = [
+            {
+                "role": "system",
+                "content": SUMMARY_SYSTEM_PROMPT.format(max_sentences=max_sentences)
+            },
+            {
+                "role": "user",
+                "content": SUMMARY_USER_PROMPT.format(max_sentences=max_sentences, text=text)
+            }
+        ]
+        plan = plan_chat_request(messages, GPT_SUMMARY_MAX_COMPLETION_TOKENS, model)
+        
         # GPT-4에게 요약 요청
         response = client.chat.completions.create(
             model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"""당신은 뉴스 기사 요약 전문가입니다. 
-주어진 뉴스 기사를 핵심 내용만 담아 {max_sentences}문장 이내로 간결하게 요약하세요.
-- 객관적이고 중립적인 톤 유지
-- 중요한 사실과 숫자 포함
-- 불필요한 수식어 제거
-- 한국어로 답변"""
-                },
-                {
-                    "role": "user",
-                    "content": f"다음 뉴스 기사를 {max_sentences}문장으로 요약하세요:\n\n{text}"
-                }
-            ],
-            max_tokens=300,
+            messages=messages,
+            max_tokens=GPT_SUMMARY_MAX_COMPLETION_TOKENS,
             temperature=0.3,  # 일관된 요약을 위해 낮은 temperature
             top_p=1.0,
             frequency_penalty=0.0,
@@ -78,78 +149,156 @@ def summarize_with_gpt(
         )
         
         summary = response.choices[0].message.content.strip()
+        record_usage("summary", plan, response)
         
         logger.info(f"GPT 요약 성공 (모델: {model}, 원본: {len(text)}자 → 요약: {len(summary)}자)")
         
         return summary
     
     except Exception as e:
-        logger.error(f"GPT 요약 실패: {e}")
-        raise Exception(f"GPT 요약 중 오류 발생: {str(e)}")
+        kind = classify_openai_error(e)
+        logger.error(f"GPT 요약 실패 ({kind}): {e}")
+        raise GPTSummaryError(f"GPT 요약 중 오류 발생: {str(e)}", kind=kind) from e
 
 
-def summarize_articles_with_gpt(
-    articles: list[dict],
+def _article_full_text(article: dict) -> str:
+    """요약 입력으로 쓰는 기사 전문"""
+    return f"{article.get('title', '')}. {article.get('description', '')} {article.get('content', '')}"
+
+
+def _with_summary(article: dict, summary: str, cached: bool) -> dict:
+    """원본 기사에 GPT 요약 추가 (summary 필드와 summary_type 필드 추가)"""
+    return {
+        **article, 
+        "summary": summary,  # 프론트엔드에서 사용하는 필드
+        "summary_type": "gpt",   # 요약 타입 표시
+        "gpt_summary": summary,  # 호환성을 위해 유지
+        "summary_cached": cached  # 요약 캐시 적중 여부
+    }
+
+
+def summarize_article_with_gpt(
+    article: dict,
     max_sentences: int = 3,
     model: str = "gpt-4o-mini"
-) -> list[dict]:
+) -> dict:
     """
-    여러 뉴스 기사를 GPT로 요약합니다.
+    기사 하나를 GPT로 요약합니다. (호출 제한 + 서킷 브레이커 적용)
     
     Args:
-        articles: 뉴스 기사 목록 (각 기사는 title, description, content 포함)
-        max_sentences: 각 요약의 최대 문장 수
+        article: 뉴스 기사 (title, description, content 포함)
+        max_sentences: 요약의 최대 문장 수
         model: 사용할 GPT 모델
     
     Returns:
-        요약이 추가된 기사 목록 (gpt_summary 필드 추가)
+        요약 필드(summary, summary_type, gpt_summary, summary_cached)가 추가된 기사 사본
+        (실패하거나 서킷이 차단된 경우 summary=None, summary_type="none")
     """
-    if not client:
-        logger.warning("OpenAI API 키가 없어 GPT 요약을 건너뜁니다.")
-        return articles
+    # 기사 전문 생성
+    full_text = _article_full_text(article)
+    cache_key = make_summary_key(article.get("url"), full_text, model, max_sentences, SUMMARY_PROMPT_VERSION)
     
-    summarized_articles = []
+    # 요약 캐시 적중 시 GPT 호출 없이 반환
+    cached_summary = get_cached_summary(cache_key)
+    if cached_summary is not None:
+        return _with_summary(article, cached_summary, cached=True)
     
-    for article in articles:
+    with summary_limiter:
+        # 대기하는 동안 할당량 초과가 발생했으면 새 호출을 시작하지 않음
+        if not summary_circuit.allow():
+            return {**article, "summary": None, "summary_type": "none"}
+        
         try:
-            # 기사 전문 생성
-            full_text = f"{article.get('title', '')}. {article.get('description', '')} {article.get('content', '')}"
-            
             # GPT 요약
             gpt_summary = summarize_with_gpt(full_text, max_sentences, model)
+            summary_circuit.record_success()
             
-            # 원본 기사에 GPT 요약 추가 (summary 필드와 summary_type 필드 추가)
-            article_with_summary = {
-                **article, 
-                "summary": gpt_summary,  # 프론트엔드에서 사용하는 필드
-                "summary_type": "gpt",   # 요약 타입 표시
-                "gpt_summary": gpt_summary  # 호환성을 위해 유지
-            }
-            summarized_articles.append(article_with_summary)
+            if gpt_summary:
+                save_summary(
+                    cache_key, gpt_summary, article.get("url"),
+                    model, max_sentences, SUMMARY_PROMPT_VERSION
+                )
+            
+            return _with_summary(article, gpt_summary, cached=False)
             
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"기사 요약 실패: {error_msg}")
+            kind = classify_openai_error(e)
+            logger.error(f"기사 요약 실패 ({kind}): {e}")
             
-            # 429 에러 (할당량 초과) 또는 401 에러 (인증 실패) 시 조기 종료
-            if "429" in error_msg or "insufficient_quota" in error_msg or "401" in error_msg:
-                logger.warning("API 할당량 초과 또는 인증 실패. GPT 요약을 중단하고 원본 기사를 반환합니다.")
-                # 이미 요약된 기사와 나머지 원본 기사를 모두 반환 (summary 필드 추가)
-                remaining_articles = [
-                    {**article, "summary": None, "summary_type": "none"}
-                    for article in articles[len(summarized_articles):]
-                ]
-                return summarized_articles + remaining_articles
+            # 할당량 초과 또는 인증 실패 시 서킷 차단 (진행 중인 호출 결과는 유지)
+            if kind in FATAL_ERROR_KINDS:
+                summary_circuit.trip(f"{kind} 에러")
+            else:
+                summary_circuit.record_failure()
             
-            # 그 외 에러는 해당 기사만 건너뛰고 계속 (summary 필드 없이)
-            article_without_summary = {
-                **article,
-                "summary": None,
-                "summary_type": "none"
-            }
-            summarized_articles.append(article_without_summary)
+            # 해당 기사만 요약 없이 반환
+            return {**article, "summary": None, "summary_type": "none"}
+
+
+def prefetch_article_summaries(
+    articles: list[dict],
+    max_sentences: int = 3,
+    model: str = "gpt-4o-mini"
+) -> int:
+    """
+    기사 목록의 요약 캐시를 한 번의 DB 쿼리로 메모리에 적재합니다.
     
-    return summarized_articles
+    Returns:
+        메모리로 적재된 요약 수
+    """
+    return prefetch_summaries([
+        make_summary_key(article.get("url"), _article_full_text(article), model, max_sentences, SUMMARY_PROMPT_VERSION)
+        for article in articles
+    ])
+
+
+def is_gpt_summary_available() -> bool:
+    """GPT 요약을 시도할 수 있는지 (API 키 있음 + 서킷 차단 아님)"""
+    return client is not None and not summary_circuit.is_open()
+
+
+def summarize_articles_with_gpt(
+    articles: list[dict],
+    max_sentences: int = 3,
+    model: str = "gpt-4o-mini",
+    concurrent: bool = True
+) -> list[dict]:
+    """
+    여러 뉴스 기사를 GPT로 요약합니다.
+    
+    Args:
+        articles: 뉴스 기사 목록 (각 기사는 title, description, content 포함)
+        max_sentences: 각 요약의 최대 문장 수
+        model: 사용할 GPT 모델
+        concurrent: True면 기사별 요약을 병렬 실행 (GPT_SUMMARY_CONCURRENCY로 동시 호출 수 제한)
+    
+    Returns:
+        요약이 추가된 기사 목록 (gpt_summary 필드 추가, 입력 순서 유지)
+    """
+    if not client:
+        logger.warning("OpenAI API 키가 없어 GPT 요약을 건너뜁니다.")
+        return articles
+    
+    if summary_circuit.is_open():
+        logger.warning("GPT 요약 서킷이 차단되어 있어 원본 기사를 반환합니다.")
+        return [
+            {**article, "summary": None, "summary_type": "none"}
+            for article in articles
+        ]
+    
+    # 요약 캐시를 한 번의 DB 쿼리로 미리 적재
+    prefetch_article_summaries(articles, max_sentences, model)
+    
+    if concurrent and len(articles) > 1:
+        return list(_summary_executor.map(
+            lambda article: summarize_article_with_gpt(article, max_sentences, model),
+            articles,
+        ))
+    
+    return [
+        summarize_article_with_gpt(article, max_sentences, model)
+        for article in articles
+    ]
 
 
 def get_available_models() -> list[str]:
@@ -167,30 +316,29 @@ def get_available_models() -> list[str]:
     ]
 
 
-def estimate_cost(text_length: int, model: str = "gpt-4o-mini") -> float:
+def estimate_cost(
+    text: Union[str, int],
+    model: str = "gpt-4o-mini",
+    max_sentences: int = 3,
+) -> float:
     """
     요약 비용을 추정합니다 (USD).
     
     Args:
-        text_length: 입력 텍스트 길이 (문자 수)
+        text: 요약할 텍스트 (이전 호출 방식처럼 문자 수를 넘기면 문자 수 기준으로 대략 추정)
         model: 사용할 모델
+        max_sentences: 요약 문장 수
     
     Returns:
-        예상 비용 (달러)
+        예상 비용 (달러, 텍스트면 프롬프트는 실제 토큰 수 + 출력은 최대 토큰 수 기준,
+        문자 수면 입력 토큰만 문자 2개당 1토큰으로 추정)
     """
-    # 대략적인 토큰 계산 (한글: ~1.5자/토큰, 영문: ~4자/토큰)
-    estimated_tokens = text_length / 2
-    
-    # 모델별 비용 (per 1M tokens)
-    pricing = {
-        "gpt-4o-mini": 0.15,
-        "gpt-4o": 2.50,
-        "gpt-4-turbo": 10.00,
-        "gpt-3.5-turbo": 0.50
-    }
-    
-    price_per_million = pricing.get(model, 0.15)
-    cost = (estimated_tokens / 1_000_000) * price_per_million
-    
-    return cost
+    if isinstance(text, int):
+        return estimate_cost_usd(text / 2, 0, model)
 
+    text = trim_to_token_budget(text, GPT_SUMMARY_INPUT_TOKENS, model)
+    messages = [
+        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT.format(max_sentences=max_sentences)},
+        {"role": "user", "content": SUMMARY_USER_PROMPT.format(max_sentences=max_sentences, text=text)},
+    ]
+    return plan_chat_request(messages, GPT_SUMMARY_MAX_COMPLETION_TOKENS, model)["max_cost_usd"]
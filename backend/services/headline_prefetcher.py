@@ -0,0 +1,231 @@
+"""
+국가별 기본 헤드라인 사전 조회 (백그라운드 스케줄러)
+
+키워드 없는 국가별 검색은 항상 같은 기본 키워드로 조회하므로
+일정 주기로 NewsAPI를 조회하고 자주 쓰는 언어(ko, en, ja)로 미리 번역해 저장해 둡니다.
+검색 API는 저장된 결과가 있으면 바로 반환합니다.
+
+NewsAPI/GPT 호출 비용이 들므로 기본은 꺼져 있고 (HEADLINE_PREFETCH_ENABLED=true로 사용),
+켜더라도 최근 HEADLINE_DEMAND_SECONDS 안에 실제로 요청된 (국가, 언어) 피드만 갱신하며
+피드 원문과 같은 언어로는 번역하지 않습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Iterable, Optional
+from dotenv import load_dotenv
+
+from services.translator import translate_articles
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+HEADLINE_PREFETCH_ENABLED = os.getenv("HEADLINE_PREFETCH_ENABLED", "false").lower() == "true"
+HEADLINE_REFRESH_SECONDS = float(os.getenv("HEADLINE_REFRESH_SECONDS", "600"))  # 기본 10분
+HEADLINE_PREFETCH_PAGE_SIZE = int(os.getenv("HEADLINE_PREFETCH_PAGE_SIZE", "20"))
+HEADLINE_PREFETCH_LANGUAGES = [
+    lang.strip() for lang in os.getenv("HEADLINE_PREFETCH_LANGUAGES", "ko,en,ja").split(",") if lang.strip()
+]
+# 마지막 요청 후 이 시간이 지난 (국가, 언어) 피드는 더 이상 갱신하지 않음 (기본 1시간)
+HEADLINE_DEMAND_SECONDS = float(os.getenv("HEADLINE_DEMAND_SECONDS", "3600"))
+# 갱신이 연속으로 실패해도 이 시간까지는 저장된 결과를 사용 (기본: 갱신 주기 3배)
+HEADLINE_MAX_STALE_SECONDS = float(
+    os.getenv("HEADLINE_MAX_STALE_SECONDS", str(HEADLINE_REFRESH_SECONDS * 3))
+)
+
+# 원문(번역 안 함) 피드의 저장 키
+ORIGINAL_LANGUAGE = "none"
+
+# (NewsAPI 응답, 필터링된 기사 목록)을 반환하는 국가별 피드 조회 함수
+FeedLoader = Callable[[str, int], Awaitable[tuple[dict, list[dict]]]]
+
+
+class HeadlinePrefetcher:
+    """국가별 기본 피드를 주기적으로 조회/번역해 저장하는 스케줄러
+
+    Args:
+        loader: 국가 코드와 결과 개수를 받아 (응답, 기사 목록)을 반환하는 코루틴 함수
+        countries: 사전 조회할 국가 코드
+        languages: 미리 번역할 언어 코드
+        source_languages: 국가별 피드 원문 언어 (같은 언어로는 번역하지 않음)
+        interval: 갱신 주기 (초)
+        page_size: 국가별로 저장할 기사 수
+        max_stale: 저장된 결과를 사용할 최대 경과 시간 (초)
+        demand_window: 이 시간 안에 요청된 (국가, 언어) 피드만 갱신 (초)
+    """
+
+    def __init__(
+        self,
+        loader: FeedLoader,
+        countries: Iterable[str],
+        languages: Iterable[str] = HEADLINE_PREFETCH_LANGUAGES,
+        source_languages: Optional[dict[str, str]] = None,
+        interval: float = HEADLINE_REFRESH_SECONDS,
+        page_size: int = HEADLINE_PREFETCH_PAGE_SIZE,
+        max_stale: float = HEADLINE_MAX_STALE_SECONDS,
+        demand_window: float = HEADLINE_DEMAND_SECONDS,
+    ):
+        self.loader = loader
+        self.countries = list(countries)
+        self.languages = list(languages)
+        self.source_languages = dict(source_languages or {})
+        self.interval = interval
+        self.page_size = page_size
+        self.max_stale = max_stale
+        self.demand_window = demand_window
+        # (국가, 언어) → {"total", "articles", "refreshed_at"}
+        self._store: dict[tuple[str, str], dict] = {}
+        # (국가, 언어) → 마지막 요청 시각 (요청된 피드만 갱신)
+        self._requested: dict[tuple[str, str], float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0, "idle_skips": 0}
+
+    def start(self):
+        """백그라운드 갱신 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"헤드라인 사전 조회 시작: {len(self.countries)}개 국가, "
+            f"언어 {self.languages}, 주기 {self.interval:.0f}초"
+        )
+
+    async def stop(self):
+        """백그라운드 갱신 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.monotonic()
+            await self.refresh_all()
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def _demanded_languages(self, country: str, now: float) -> Optional[list[str]]:
+        """최근 요청된 번역 언어 목록 (국가 피드가 최근 요청되지 않았으면 None)"""
+        requested = [
+            lang for (c, lang), at in self._requested.items()
+            if c == country and now - at <= self.demand_window
+        ]
+        if not requested:
+            return None
+        source = self.source_languages.get(country)
+        return [lang for lang in self.languages if lang in requested and lang != source]
+
+    async def refresh_all(self):
+        """최근 요청된 국가의 피드를 순서대로 갱신 (NewsAPI 호출이 몰리지 않도록 국가별 순차 실행)"""
+        now = time.time()
+        for country in self.countries:
+            languages = self._demanded_languages(country, now)
+            if languages is None:
+                # 아무도 보지 않는 피드는 NewsAPI/번역 비용을 쓰지 않음
+                self._stats["idle_skips"] += 1
+                continue
+            try:
+                await self.refresh_country(country, languages)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["refresh_failures"] += 1
+                logger.warning(f"헤드라인 갱신 실패 ({country}): {type(e).__name__}: {e}")
+
+    async def refresh_country(self, country: str, languages: Optional[list[str]] = None):
+        """한 국가의 피드 조회 후 언어별 번역본까지 저장
+
+        Args:
+            country: 국가 코드
+            languages: 번역할 언어 (기본: 원문 언어를 뺀 설정 언어 전체)
+        """
+        if languages is None:
+            source = self.source_languages.get(country)
+            languages = [lang for lang in self.languages if lang != source]
+        response, articles = await self.loader(country, self.page_size)
+        total = response.get("totalResults", 0)
+        if not articles:
+            # 빈 결과로 기존 피드를 덮어쓰지 않음
+            logger.info(f"헤드라인 갱신: {country} 결과 없음, 기존 피드 유지")
+            return
+
+        refreshed_at = time.time()
+        self._store[(country, ORIGINAL_LANGUAGE)] = {
+            "total": total,
+            "articles": articles,
+            "refreshed_at": refreshed_at,
+        }
+
+        for lang in languages:
+            try:
+                translated = await asyncio.to_thread(translate_articles, articles, target_lang=lang)
+            except Exception as e:
+                logger.warning(f"헤드라인 번역 실패 ({country} → {lang}): {e}")
+                continue
+            self._store[(country, lang)] = {
+                "total": total,
+                "articles": translated,
+                "refreshed_at": refreshed_at,
+            }
+
+        self._stats["refreshes"] += 1
+        logger.info(f"헤드라인 갱신 완료: {country} {len(articles)}건 (번역: {', '.join(languages) or '없음'})")
+
+    def get(self, country: str, translate_to: Optional[str], page_size: int) -> Optional[tuple[int, list[dict]]]:
+        """
+        저장된 피드 조회
+
+        Args:
+            country: 국가 코드
+            translate_to: 번역 언어 (none 또는 None이면 원문)
+            page_size: 결과 개수
+
+        Returns:
+            (전체 결과 수, 기사 목록) 또는 None (저장된 피드가 없거나 오래됐거나 개수가 부족한 경우)
+        """
+        lang = translate_to if translate_to and translate_to != "none" else ORIGINAL_LANGUAGE
+        if lang == self.source_languages.get(country):
+            # 원문과 같은 언어로의 번역은 미리 준비하지 않음
+            self._stats["misses"] += 1
+            return None
+        # 요청 기록 (다음 갱신부터 이 피드를 미리 준비)
+        self._requested[(country, lang)] = time.time()
+        entry = self._store.get((country, lang))
+        if (
+            entry is None
+            or page_size > self.page_size
+            or time.time() - entry["refreshed_at"] > self.max_stale
+        ):
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["hits"] += 1
+        # 호출 측에서 요약 필드 등을 덧붙여도 저장본이 바뀌지 않도록 복사
+        return entry["total"], [dict(article) for article in entry["articles"][:page_size]]
+
+    def stats(self) -> dict:
+        """사전 조회 통계 및 국가/언어별 피드 경과 시간"""
+        now = time.time()
+        return {
+            **self._stats,
+            "running": self._task is not None and not self._task.done(),
+            "interval": self.interval,
+            "demanded": sorted(
+                f"{country}:{lang}" for (country, lang), at in self._requested.items()
+                if now - at <= self.demand_window
+            ),
+            "feeds": {
+                f"{country}:{lang}": {
+                    "articles": len(entry["articles"]),
+                    "age_seconds": round(now - entry["refreshed_at"], 1),
+                }
+                for (country, lang), entry in self._store.items()
+            },
+        }
@@ -1,22 +1,33 @@
 """
 키워드 분석 서비스
 KoNLPy를 사용한 한글 형태소 분석 및 키워드 추출
+(명사 추출 엔진은 KEYWORD_ANALYZER_ENGINE으로 선택, services.noun_extractors 참고)
 """
 
-from konlpy.tag import Okt
 from collections import Counter
+import hashlib
 import logging
+import os
 import re
 
+from services.morph_pool import MorphAnalyzerError
+from services.noun_extractors import get_noun_extractor
+from services.keyword_scoring import score_keywords, KEYWORD_SCORING
+from utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
-# 형태소 분석기 초기화 (전역으로 한 번만)
-try:
-    okt = Okt()
-    logger.info("KoNLPy Okt 형태소 분석기 초기화 완료")
-except Exception as e:
-    logger.error(f"KoNLPy 초기화 실패: {e}")
-    okt = None
+# 기사별 명사 빈도 캐시 (기사 텍스트 해시 → 필드별 Counter)
+ARTICLE_NOUN_CACHE_SIZE = int(os.getenv("ARTICLE_NOUN_CACHE_SIZE", "5000"))
+ARTICLE_NOUN_CACHE_TTL = float(os.getenv("ARTICLE_NOUN_CACHE_TTL", str(24 * 3600)))  # 기본 24시간 (초)
+
+article_noun_cache = TTLCache(maxsize=ARTICLE_NOUN_CACHE_SIZE, ttl=ARTICLE_NOUN_CACHE_TTL)
+
+# 제목 가중치 (제목 명사는 이 횟수만큼 반복해서 셈)
+TITLE_WEIGHT = 2
+
+# 기사 필드별 가중치 (제목, 설명, 본문)
+ARTICLE_FIELD_WEIGHTS = (TITLE_WEIGHT, 1, 1)
 
 
 # 한글 불용어 리스트
@@ -70,10 +81,6 @@ def extract_keywords(text: str, top_n: int = 20, min_length: int = 2) -> list:
     Returns:
         키워드 리스트 [{"word": "단어", "count": 빈도}]
     """
-    if not okt:
-        logger.error("KoNLPy가 초기화되지 않았습니다")
-        return []
-    
     try:
         # 텍스트 정제
         cleaned_text = clean_text(text)
@@ -82,98 +89,194 @@ def extract_keywords(text: str, top_n: int = 20, min_length: int = 2) -> list:
             return []
         
         # 명사 추출
-        nouns = okt.nouns(cleaned_text)
-        
-        # 필터링
-        filtered_nouns = [
-            word for word in nouns
-            if len(word) >= min_length  # 최소 길이
-            and word not in STOPWORDS  # 불용어 제외
-            and not word.isdigit()  # 숫자만 있는 단어 제외
-        ]
-        
-        # 빈도 계산
-        counter = Counter(filtered_nouns)
+        nouns = get_noun_extractor().nouns(cleaned_text)
         
-        # 상위 N개 추출
-        keywords = [
-            {"word": word, "count": count}
-            for word, count in counter.most_common(top_n)
-        ]
-        
-        logger.info(f"키워드 추출 완료: {len(keywords)}개")
-        return keywords
+        return count_keywords(nouns, top_n, min_length)
         
+    except MorphAnalyzerError as e:
+        logger.error(f"형태소 분석 실패 ({e.kind}): {e}")
+        return []
     except Exception as e:
         logger.error(f"키워드 추출 중 에러: {type(e).__name__}: {e}")
         return []
 
 
-def analyze_keywords(texts: list, top_n: int = 20, min_length: int = 2) -> list:
-    """여러 텍스트에서 키워드 분석
+def count_keywords(nouns: list, top_n: int = 20, min_length: int = 2) -> list:
+    """명사 목록을 필터링하고 빈도순 상위 키워드 반환
     
     Args:
-        texts: 텍스트 리스트
+        nouns: 형태소 분석으로 얻은 명사 목록
         top_n: 추출할 키워드 개수
         min_length: 최소 단어 길이
         
     Returns:
         키워드 리스트 [{"word": "단어", "count": 빈도}]
     """
+    # 빈도 계산
+    counter = Counter(filter_nouns(nouns, min_length))
+    
+    return top_keywords(counter, top_n)
+
+
+def filter_nouns(nouns: list, min_length: int = 2) -> list:
+    """최소 길이/불용어/숫자 기준으로 명사 필터링"""
+    return [
+        word for word in nouns
+        if len(word) >= min_length  # 최소 길이
+        and word not in STOPWORDS  # 불용어 제외
+        and not word.isdigit()  # 숫자만 있는 단어 제외
+    ]
+
+
+def top_keywords(counter: Counter, top_n: int = 20) -> list:
+    """빈도 Counter에서 상위 N개 키워드 추출"""
+    keywords = [
+        {"word": word, "count": count}
+        for word, count in counter.most_common(top_n)
+    ]
+    
+    logger.info(f"키워드 추출 완료: {len(keywords)}개")
+    return keywords
+
+
+def analyze_keywords(
+    texts: list,
+    top_n: int = 20,
+    min_length: int = 2,
+    scoring: str = KEYWORD_SCORING
+) -> list:
+    """여러 텍스트에서 키워드 분석
+    
+    Args:
+        texts: 텍스트 리스트 (텍스트 하나를 문서 하나로 취급)
+        top_n: 추출할 키워드 개수
+        min_length: 최소 단어 길이
+        scoring: 점수 방식 (frequency, tfidf, bm25)
+        
+    Returns:
+        키워드 리스트 [{"word": "단어", "count": 빈도, "score": 점수}]
+    """
     if not texts:
         logger.warning("분석할 텍스트가 없습니다")
         return []
     
     try:
-        # 모든 텍스트 합치기
-        combined_text = ' '.join([str(t) for t in texts if t])
+        # 텍스트별로 정제 (워커들이 나눠서 분석하도록 합치지 않음)
+        cleaned_texts = [cleaned for cleaned in (clean_text(str(t)) for t in texts if t) if cleaned]
         
-        logger.info(f"키워드 분석 시작: {len(texts)}개 텍스트, 총 {len(combined_text)}자")
+        logger.info(f"키워드 분석 시작: {len(texts)}개 텍스트, 총 {sum(len(t) for t in cleaned_texts)}자")
         
-        # 키워드 추출
-        keywords = extract_keywords(combined_text, top_n, min_length)
+        # 명사 추출 (okt 엔진은 워커 프로세스 병렬 처리)
+        documents = [
+            (Counter(filter_nouns(text_nouns, min_length)),)
+            for text_nouns in get_noun_extractor().nouns_batch(cleaned_texts)
+        ]
         
-        return keywords
+        return score_keywords(documents, top_n, scoring)
         
+    except MorphAnalyzerError as e:
+        logger.error(f"형태소 분석 실패 ({e.kind}): {e}")
+        return []
     except Exception as e:
         logger.error(f"키워드 분석 중 에러: {type(e).__name__}: {e}")
         logger.exception("상세 에러:")
         return []
 
 
-def analyze_articles_keywords(articles: list, top_n: int = 20) -> dict:
+def _article_text_fields(article: dict) -> tuple[str, str, str]:
+    """기사에서 분석할 (제목, 설명, 본문) 텍스트"""
+    title = article.get('title') or ''
+    description = article.get('description') or ''
+    # [+XXX chars] 제거
+    content = re.sub(r'\[\+\d+ chars\]', '', article.get('content') or '')
+    return title, description, content
+
+
+def make_article_noun_key(fields: tuple[str, str, str], min_length: int, engine: str) -> str:
+    """기사 명사 캐시 키 (텍스트 필드 해시 + 최소 단어 길이 + 명사 추출 엔진)"""
+    raw = "\x00".join((engine, str(min_length), *fields))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_article_field_nouns(articles: list, min_length: int = 2) -> list:
+    """기사별/필드별 필터링된 명사 빈도 (캐시에 없는 기사만 형태소 분석)
+    
+    Args:
+        articles: 뉴스 기사 리스트
+        min_length: 최소 단어 길이
+        
+    Returns:
+        입력 순서대로 기사별 (제목, 설명, 본문) Counter 튜플
+    """
+    extractor = get_noun_extractor()
+    fields_list = [_article_text_fields(article) for article in articles]
+    keys = [make_article_noun_key(fields, min_length, extractor.name) for fields in fields_list]
+    
+    counts = {}
+    pending = {}  # 캐시 키 → 기사 텍스트 필드 (같은 기사는 한 번만 분석)
+    for key, fields in zip(keys, fields_list):
+        cached = article_noun_cache.get(key)
+        if cached is not None:
+            counts[key] = cached
+        else:
+            pending[key] = fields
+    
+    if pending:
+        # 분석할 텍스트를 한 번에 추출기로 보내고 기사별로 다시 모음
+        texts = []
+        owners = []
+        for key, fields in pending.items():
+            for field_idx, text in enumerate(fields):
+                cleaned = clean_text(text)
+                if cleaned:
+                    texts.append(cleaned)
+                    owners.append((key, field_idx))
+        
+        field_counts = {key: (Counter(), Counter(), Counter()) for key in pending}
+        for (key, field_idx), nouns in zip(owners, extractor.nouns_batch(texts)):
+            field_counts[key][field_idx].update(filter_nouns(nouns, min_length))
+        
+        for key, fields in field_counts.items():
+            counts[key] = fields
+            article_noun_cache.set(key, fields)
+    
+    logger.info(f"기사 명사 캐시: {len(articles) - len(pending)}개 적중, {len(pending)}개 분석")
+    return [counts[key] for key in keys]
+
+
+def get_article_noun_counts(articles: list, min_length: int = 2) -> list:
+    """기사별 필터링된 명사 빈도 (필드 가중치 적용)
+    
+    Returns:
+        입력 순서대로 기사별 Counter (제목 명사는 TITLE_WEIGHT배)
+    """
+    results = []
+    for fields in get_article_field_nouns(articles, min_length):
+        counter = Counter()
+        for weight, field_counts in zip(ARTICLE_FIELD_WEIGHTS, fields):
+            for word, count in field_counts.items():
+                counter[word] += count * weight
+        results.append(counter)
+    return results
+
+
+def analyze_articles_keywords(articles: list, top_n: int = 20, scoring: str = KEYWORD_SCORING) -> dict:
     """뉴스 기사 리스트에서 키워드 분석
     
+    기사별 명사 빈도를 캐시하므로 이전에 분석한 기사는 다시 형태소 분석하지 않습니다.
+    
     Args:
         articles: 뉴스 기사 리스트
         top_n: 추출할 키워드 개수
+        scoring: 점수 방식 (frequency: 필드 가중 빈도, tfidf, bm25)
         
     Returns:
         분석 결과 {"keywords": [...], "total_words": N}
     """
     try:
-        # 모든 기사의 제목, 설명, 본문 수집
-        texts = []
-        for article in articles:
-            # 제목 추가 (중요도 높음)
-            if article.get('title'):
-                texts.append(article['title'])
-                texts.append(article['title'])  # 2번 추가 (가중치)
-            
-            # 설명 추가
-            if article.get('description'):
-                texts.append(article['description'])
-            
-            # 본문 추가
-            if article.get('content'):
-                # [+XXX chars] 제거
-                content = re.sub(r'\[\+\d+ chars\]', '', article['content'])
-                texts.append(content)
-        
-        logger.info(f"총 {len(texts)}개 텍스트 수집 ({len(articles)}개 기사)")
-        
-        # 키워드 분석
-        keywords = analyze_keywords(texts, top_n)
+        # 기사별/필드별 명사 빈도로 문서-단어 행렬을 만들어 점수 계산
+        documents = get_article_field_nouns(articles)
+        keywords = score_keywords(documents, top_n, scoring, ARTICLE_FIELD_WEIGHTS)
         
         # 총 단어 수 계산
         total_words = sum(kw['count'] for kw in keywords)
@@ -184,13 +287,9 @@ def analyze_articles_keywords(articles: list, top_n: int = 20) -> dict:
             "analyzed_articles": len(articles)
         }
         
+    except MorphAnalyzerError as e:
+        logger.error(f"형태소 분석 실패 ({e.kind}): {e}")
+        return {"keywords": [], "total_words": 0, "analyzed_articles": 0}
     except Exception as e:
         logger.error(f"기사 키워드 분석 중 에러: {e}")
         return {"keywords": [], "total_words": 0, "analyzed_articles": 0}
-
-
-
-
-
-
-
@@ -0,0 +1,311 @@
+"""
+KoNLPy 형태소 분석 워커 프로세스 풀
+
+KoNLPy(Okt)는 JPype로 JVM을 띄우는데, 웹 서버 프로세스 안에서 JVM이
+SIGBUS 등으로 죽으면 서버 전체가 함께 죽습니다. 그래서 형태소 분석은
+각자 JVM을 가진 별도 워커 프로세스에서 실행합니다.
+
+- 워커마다 Pipe 하나로 (명령, 데이터) 튜플을 주고받음
+    요청: ("nouns", [텍스트, ...]) / ("close", None)
+    응답: ("ready", pid) / ("init_error", 메시지) / ("ok", 결과) / ("error", 메시지)
+- 워커가 죽거나 호출 시간이 초과되면 해당 워커를 종료하고 새로 띄움
+- 여러 텍스트는 워커 수만큼 나눠 병렬로 분석
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+KONLPY_WORKERS = int(os.getenv("KONLPY_WORKERS", "2"))
+KONLPY_CALL_TIMEOUT = float(os.getenv("KONLPY_CALL_TIMEOUT", "30"))  # 호출당 제한 시간 (초)
+KONLPY_START_TIMEOUT = float(os.getenv("KONLPY_START_TIMEOUT", "60"))  # JVM 기동 제한 시간 (초)
+
+# JVM과 fork는 함께 쓰면 안전하지 않으므로 항상 spawn으로 워커 생성
+_mp_context = multiprocessing.get_context("spawn")
+
+
+class MorphAnalyzerError(Exception):
+    """형태소 분석 실패
+
+    kind:
+        unavailable: KoNLPy/JVM을 사용할 수 없음 (재시도해도 소용없음)
+        timeout: 호출 시간 초과 (워커 재시작됨)
+        crash: 워커 프로세스 비정상 종료 (워커 재시작됨)
+        busy: 모든 워커가 사용 중
+        error: 분석 중 예외
+    """
+
+    def __init__(self, message: str, kind: str = "error"):
+        super().__init__(message)
+        self.kind = kind
+
+
+def _worker_main(conn):
+    """워커 프로세스 본체 (Okt를 한 번 초기화하고 요청을 처리)"""
+    # Ctrl+C는 부모 프로세스가 처리하고 워커는 close 명령/파이프 종료로 정리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        from konlpy.tag import Okt
+        okt = Okt()
+        okt.nouns("형태소 분석기 초기화")  # JVM 워밍업
+    except Exception as e:
+        conn.send(("init_error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(("ready", os.getpid()))
+    while True:
+        try:
+            op, payload = conn.recv()
+        except (EOFError, OSError):
+            break
+        if op == "close":
+            break
+        try:
+            if op == "nouns":
+                result = [okt.nouns(text) if text else [] for text in payload]
+            else:
+                raise ValueError(f"알 수 없는 명령: {op}")
+            conn.send(("ok", result))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class _Worker:
+    """워커 프로세스 하나와 연결된 파이프"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self, timeout: float):
+        """프로세스를 띄우고 Okt 초기화 완료(ready)까지 대기"""
+        parent_conn, child_conn = _mp_context.Pipe()
+        process = _mp_context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name=f"konlpy-worker-{self.index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.process = process
+        self.conn = parent_conn
+
+        try:
+            if not parent_conn.poll(timeout):
+                raise MorphAnalyzerError(f"워커 {self.index} 기동 시간 초과 ({timeout:.0f}초)", "timeout")
+            status, payload = parent_conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise MorphAnalyzerError(f"워커 {self.index} 기동 중 종료", "crash")
+        except MorphAnalyzerError:
+            self.kill()
+            raise
+
+        if status != "ready":
+            self.kill()
+            raise MorphAnalyzerError(f"KoNLPy 초기화 실패: {payload}", "unavailable")
+        logger.info(f"KoNLPy 워커 {self.index} 시작 (pid={payload})")
+
+    def call(self, op: str, payload, timeout: float):
+        """요청을 보내고 응답 대기"""
+        try:
+            self.conn.send((op, payload))
+            if not self.conn.poll(timeout):
+                raise MorphAnalyzerError(f"워커 {self.index} 호출 시간 초과 ({timeout:.0f}초)", "timeout")
+            status, result = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise MorphAnalyzerError(f"워커 {self.index} 비정상 종료: {type(e).__name__}", "crash")
+
+        if status != "ok":
+            raise MorphAnalyzerError(result, "error")
+        return result
+
+    def kill(self):
+        """프로세스 강제 종료"""
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def close(self):
+        """정상 종료 요청 후 남아 있으면 강제 종료"""
+        if self.conn is not None and self.is_alive():
+            try:
+                self.conn.send(("close", None))
+                self.process.join(timeout=2)
+            except (OSError, ValueError):
+                pass
+        self.kill()
+
+
+class MorphAnalyzerPool:
+    """KoNLPy 워커 프로세스 풀 (스레드 안전, 동기 API)
+
+    async 코드에서는 run_in_threadpool/asyncio.to_thread로 호출합니다.
+
+    Args:
+        size: 워커 프로세스 수
+        call_timeout: 호출당 제한 시간 (초)
+        start_timeout: 워커 기동(JVM 초기화) 제한 시간 (초)
+    """
+
+    def __init__(
+        self,
+        size: int = KONLPY_WORKERS,
+        call_timeout: float = KONLPY_CALL_TIMEOUT,
+        start_timeout: float = KONLPY_START_TIMEOUT,
+    ):
+        self.size = max(1, size)
+        self.call_timeout = call_timeout
+        self.start_timeout = start_timeout
+        self._idle: queue.Queue = queue.Queue()
+        self._workers: list[_Worker] = []
+        self._start_lock = threading.Lock()
+        self._started = False
+        self._unavailable: Optional[str] = None
+        self._dispatch_executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="konlpy-dispatch")
+        self._stats_lock = threading.Lock()
+        self._stats = {"calls": 0, "texts": 0, "timeouts": 0, "crashes": 0, "restarts": 0, "errors": 0}
+
+    def start(self):
+        """워커 프로세스 기동 (처음 한 번만, 워커들은 병렬로 JVM 초기화)"""
+        with self._start_lock:
+            if self._started:
+                return
+            workers = [_Worker(idx) for idx in range(self.size)]
+            # 분배용 스레드 풀에서 호출될 수 있으므로 기동은 별도 스레드에서
+            with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="konlpy-start") as starter:
+                errors = list(starter.map(self._start_worker, workers))
+
+            for worker, error in zip(workers, errors):
+                if error is not None and error.kind == "unavailable":
+                    # 설치/환경 문제는 다시 띄워도 같으므로 풀 전체를 비활성화
+                    self._unavailable = str(error)
+                    continue
+                # 일시적으로 기동에 실패한 워커는 첫 호출 때 다시 띄움
+                self._workers.append(worker)
+                self._idle.put(worker)
+
+            if self._unavailable and not self._workers:
+                logger.error(f"KoNLPy 워커 풀 사용 불가: {self._unavailable}")
+            else:
+                self._unavailable = None
+                logger.info(f"KoNLPy 워커 풀 준비: {len(self._workers)}개")
+            self._started = True
+
+    def _start_worker(self, worker: _Worker) -> Optional[MorphAnalyzerError]:
+        try:
+            worker.start(self.start_timeout)
+            return None
+        except MorphAnalyzerError as e:
+            logger.warning(f"KoNLPy 워커 {worker.index} 기동 실패: {e}")
+            return e
+
+    def is_available(self) -> bool:
+        """형태소 분석 사용 가능 여부 (시작 전이면 기동을 시도)"""
+        self.start()
+        return self._unavailable is None
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _call(self, op: str, payload):
+        """유휴 워커 하나에 요청 (죽은 워커는 먼저 재시작)"""
+        if not self.is_available():
+            raise MorphAnalyzerError(f"KoNLPy 사용 불가: {self._unavailable}", "unavailable")
+
+        try:
+            worker = self._idle.get(timeout=self.call_timeout)
+        except queue.Empty:
+            raise MorphAnalyzerError("모든 KoNLPy 워커가 사용 중입니다", "busy")
+
+        try:
+            if not worker.is_alive():
+                worker.kill()
+                worker.start(self.start_timeout)
+                self._count("restarts")
+            self._count("calls")
+            return worker.call(op, payload, self.call_timeout)
+        except MorphAnalyzerError as e:
+            if e.kind in ("timeout", "crash"):
+                # 응답이 늦거나 죽은 워커는 종료 (다음 호출에서 새로 띄움)
+                self._count("timeouts" if e.kind == "timeout" else "crashes")
+                logger.warning(f"KoNLPy 워커 {worker.index} 교체: {e}")
+                worker.kill()
+            else:
+                self._count("errors")
+            raise
+        finally:
+            self._idle.put(worker)
+
+    def nouns(self, text: str) -> list[str]:
+        """텍스트 하나의 명사 추출"""
+        return self.nouns_batch([text])[0]
+
+    def nouns_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        여러 텍스트의 명사 추출 (워커 수만큼 나눠 병렬 처리)
+
+        Returns:
+            입력 순서대로 명사 목록
+        """
+        if not texts:
+            return []
+        self._count("texts", len(texts))
+
+        chunk_size = -(-len(texts) // self.size)  # 올림 나눗셈
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        if len(chunks) == 1:
+            return self._call("nouns", chunks[0])
+
+        results = []
+        for chunk_result in self._dispatch_executor.map(lambda chunk: self._call("nouns", chunk), chunks):
+            results.extend(chunk_result)
+        return results
+
+    def close(self):
+        """모든 워커 종료"""
+        with self._start_lock:
+            for worker in self._workers:
+                worker.close()
+            self._workers = []
+            self._idle = queue.Queue()
+            self._started = False
+
+    def stats(self) -> dict:
+        """풀 상태 및 호출 통계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            **stats,
+            "size": self.size,
+            "alive": sum(1 for worker in self._workers if worker.is_alive()),
+            "idle": self._idle.qsize(),
+            "available": self._started and self._unavailable is None,
+        }
+
+
+# 전역 워커 풀 (main.py startup에서 기동, 없으면 첫 호출 때 기동)
+morph_pool = MorphAnalyzerPool()
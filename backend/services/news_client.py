@@ -0,0 +1,131 @@
+"""
+NewsAPI 비동기 클라이언트
+
+httpx.AsyncClient 기반으로 keep-alive 커넥션 풀을 유지하여
+여러 요청이 동시에 NewsAPI를 호출해도 이벤트 루프를 막지 않습니다.
+응답 형태(status, totalResults, articles)는 newsapi-python과 동일합니다.
+"""
+
+import httpx
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# NewsAPI 설정
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
+NEWS_API_TIMEOUT = float(os.getenv("NEWS_API_TIMEOUT", "10"))  # 전체 요청 타임아웃 (초)
+NEWS_API_CONNECT_TIMEOUT = float(os.getenv("NEWS_API_CONNECT_TIMEOUT", "3"))  # 연결 타임아웃 (초)
+NEWS_API_MAX_CONNECTIONS = int(os.getenv("NEWS_API_MAX_CONNECTIONS", "20"))
+NEWS_API_MAX_KEEPALIVE = int(os.getenv("NEWS_API_MAX_KEEPALIVE", "10"))
+NEWS_API_KEEPALIVE_EXPIRY = float(os.getenv("NEWS_API_KEEPALIVE_EXPIRY", "30"))
+
+
+class NewsApiError(Exception):
+    """NewsAPI가 오류 응답을 반환했을 때 발생"""
+
+    def __init__(self, code: str, message: str, status_code: Optional[int] = None):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+
+class AsyncNewsApiClient:
+    """NewsAPI 비동기 클라이언트 (요청 간 커넥션 풀 공유)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: str = NEWS_API_BASE_URL,
+        timeout: float = NEWS_API_TIMEOUT,
+        connect_timeout: float = NEWS_API_CONNECT_TIMEOUT,
+        max_connections: int = NEWS_API_MAX_CONNECTIONS,
+        max_keepalive_connections: int = NEWS_API_MAX_KEEPALIVE,
+        keepalive_expiry: float = NEWS_API_KEEPALIVE_EXPIRY,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 반환 (처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                headers={"X-Api-Key": self.api_key or ""},
+            )
+            logger.info(
+                f"NewsAPI 커넥션 풀 생성 (max={self.limits.max_connections}, "
+                f"keepalive={self.limits.max_keepalive_connections})"
+            )
+        return self._client
+
+    async def _request(self, endpoint: str, params: dict) -> dict:
+        """NewsAPI 호출 후 JSON 응답 반환 (None 파라미터는 제외)"""
+        params = {key: value for key, value in params.items() if value is not None}
+        response = await self._get_client().get(endpoint, params=params)
+        try:
+            payload = response.json()
+        except ValueError:
+            raise NewsApiError("invalidResponse", response.text[:200], status_code=response.status_code)
+
+        if response.status_code != 200 or payload.get("status") == "error":
+            raise NewsApiError(
+                payload.get("code", "unknown"),
+                payload.get("message", response.text),
+                status_code=response.status_code,
+            )
+        return payload
+
+    async def get_everything(
+        self,
+        q: Optional[str] = None,
+        from_param: Optional[str] = None,
+        to: Optional[str] = None,
+        language: Optional[str] = None,
+        domains: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> dict:
+        """/v2/everything 검색 (newsapi-python get_everything과 동일한 인자/응답)"""
+        return await self._request("/everything", {
+            "q": q,
+            "from": from_param,
+            "to": to,
+            "language": language,
+            "domains": domains,
+            "sortBy": sort_by,
+            "page": page,
+            "pageSize": page_size,
+        })
+
+    async def aclose(self):
+        """커넥션 풀 종료"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("NewsAPI 커넥션 풀 종료")
+        self._client = None
+
+
+# API 키 확인
+api_key = os.getenv("NEWS_API_KEY")
+logger.info(f"API Key 로드됨: {'있음' if api_key else '없음'}")
+if api_key:
+    logger.info(f"API Key 길이: {len(api_key)}")
+
+# 요청 간 공유되는 클라이언트 (앱 종료 시 aclose)
+news_client = AsyncNewsApiClient(api_key=api_key)
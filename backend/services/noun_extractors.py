@@ -0,0 +1,271 @@
+"""
+명사 추출 엔진
+
+키워드 분석에서 사용하는 명사 추출기를 설정(KEYWORD_ANALYZER_ENGINE)으로 선택합니다.
+- okt: KoNLPy Okt (morph_pool 워커 프로세스, JVM 필요)
+- simple: 순수 파이썬 규칙 기반 추출 (JVM 불필요, 소규모 배포용)
+
+simple 엔진은 어절 끝의 조사/서술어 어미를 접미사 트라이로 최장 일치 제거하고,
+사전(NOUN_DICTIONARY_PATH, 한 줄에 명사 하나)이 있으면 최장 일치 명사를 우선 사용합니다.
+명사 끝 글자와 구별되지 않는 한 글자 조사(의/이)는 민주주의, 고양이처럼 명사를 자르지 않도록
+알려진 명사 어미(NOUN_ENDINGS)로 끝나는 어절에서는 떼지 않습니다.
+"""
+
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+
+from services.morph_pool import morph_pool
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_ANALYZER_ENGINE = os.getenv("KEYWORD_ANALYZER_ENGINE", "okt")
+NOUN_DICTIONARY_PATH = os.getenv("NOUN_DICTIONARY_PATH", "")
+
+HANGUL_WORD_RE = re.compile(r"[가-힣]+")
+
+# 체언 뒤에 붙는 조사 (복합 조사 포함)
+JOSA = [
+    "이", "가", "은", "는", "을", "를", "의", "에", "와", "과", "도", "만", "로", "으로",
+    "에서", "에게", "한테", "께", "께서", "부터", "까지", "보다", "처럼", "같이", "마저", "조차",
+    "이나", "이랑", "랑", "이며", "라도", "이라도", "밖에", "마다", "대로",
+    "에는", "에서는", "에게는", "으로는", "로는", "와는", "과는", "에도", "에서도", "으로도", "로도",
+    "에서의", "으로의", "로의", "와의", "과의", "에의", "까지의", "부터의",
+    "이라", "이라고", "라고", "이라는", "라는", "이란", "란",
+    "이다", "였다", "이었다", "이다가", "입니다", "이고", "이지만",
+]
+
+# 명사의 끝 글자이기도 한 한 글자 조사
+AMBIGUOUS_JOSA = set("의이")
+
+# 의/이로 끝나는 명사 어미 (어절이 이것으로 끝나면 의/이를 조사로 떼지 않음)
+NOUN_ENDINGS = [
+    "주의", "정의", "회의", "합의", "논의", "협의", "동의", "심의", "건의", "결의", "의의", "강의", "예의", "민의",
+    "고양이", "어린이", "아이", "차이", "사이", "나이", "종이", "놀이", "길이", "높이", "넓이", "깊이",
+    "오이", "원숭이", "구이",
+]
+
+# 명사 + 하다/되다/시키다 계열 어미 (앞부분을 명사로 취함)
+PREDICATE_AFTER_NOUN = [
+    "하다", "한다", "했다", "하는", "하고", "하며", "하여", "해", "해서", "했던", "하기", "한", "할",
+    "하면", "하지만", "하자", "했고", "했으며", "했지만", "합니다", "했습니다", "하겠다", "할지",
+    "되다", "된다", "됐다", "되었다", "되는", "되고", "되며", "되어", "돼", "된", "될", "됐던",
+    "되면", "되자", "됐고", "됐으며", "됩니다", "됐습니다",
+    "시키다", "시킨다", "시켰다", "시키는", "시킨",
+    "한다고", "했다고", "된다고", "됐다고", "한다는", "했다는", "된다는", "됐다는", "했다며", "됐다며",
+    "적인", "적으로",
+]
+
+# 용언으로 보고 버리는 어미 (명사 + 하다 계열에 해당하지 않는 경우)
+PREDICATE_ENDINGS = [
+    "다", "니다", "습니다", "지만", "는데", "도록", "려고", "면서", "으며", "으면", "어서", "아서",
+]
+
+# 두 글자 어절이 이 글자로 끝나면 관형형 용언으로 봄 (있는, 같은, 했던 등)
+SHORT_PREDICATE_FINALS = set("는은던을")
+
+
+class _SuffixTrie:
+    """접미사 최장 일치용 트라이 (문자열을 뒤집어 저장)"""
+
+    def __init__(self, suffixes: list[str]):
+        self._root: dict = {}
+        for suffix in suffixes:
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[""] = True
+
+    def longest_suffix(self, word: str, min_stem: int = 1) -> int:
+        """word 끝에서 일치하는 가장 긴 접미사 길이 (어간이 min_stem자 이상 남는 경우만)"""
+        node = self._root
+        longest = 0
+        for length, char in enumerate(reversed(word), start=1):
+            node = node.get(char)
+            if node is None or len(word) - length < min_stem:
+                break
+            if "" in node:
+                longest = length
+        return longest
+
+
+class _PrefixTrie:
+    """사전 명사 최장 일치용 트라이"""
+
+    def __init__(self, words: list[str]):
+        self._root: dict = {}
+        self.size = 0
+        for word in words:
+            node = self._root
+            for char in word:
+                node = node.setdefault(char, {})
+            if "" not in node:
+                node[""] = True
+                self.size += 1
+
+    def longest_prefix(self, word: str) -> int:
+        node = self._root
+        longest = 0
+        for length, char in enumerate(word, start=1):
+            node = node.get(char)
+            if node is None:
+                break
+            if "" in node:
+                longest = length
+        return longest
+
+
+class NounExtractor(ABC):
+    """명사 추출 엔진 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    def nouns_batch(self, texts: list[str]) -> list[list[str]]:
+        """여러 텍스트의 명사 추출 (입력 순서대로)"""
+
+    def nouns(self, text: str) -> list[str]:
+        """텍스트 하나의 명사 추출"""
+        return self.nouns_batch([text])[0]
+
+    def start(self):
+        """사전 로드/워커 기동 등 준비 작업 (필요한 엔진만)"""
+
+    def close(self):
+        """자원 정리 (필요한 엔진만)"""
+
+    def stats(self) -> dict:
+        return {"engine": self.name}
+
+
+class OktNounExtractor(NounExtractor):
+    """KoNLPy Okt 엔진 (morph_pool 워커 프로세스에서 실행)"""
+
+    name = "okt"
+
+    def nouns_batch(self, texts: list[str]) -> list[list[str]]:
+        return morph_pool.nouns_batch(texts)
+
+    def start(self):
+        morph_pool.start()
+
+    def close(self):
+        morph_pool.close()
+
+    def stats(self) -> dict:
+        return {"engine": self.name, **morph_pool.stats()}
+
+
+class SimpleNounExtractor(NounExtractor):
+    """순수 파이썬 규칙 기반 명사 추출 엔진
+
+    Args:
+        dictionary_path: 명사 사전 파일 경로 (한 줄에 하나, 없으면 규칙만 사용)
+    """
+
+    name = "simple"
+
+    def __init__(self, dictionary_path: Optional[str] = NOUN_DICTIONARY_PATH):
+        self._josa = _SuffixTrie(JOSA)
+        self._noun_endings = _SuffixTrie(NOUN_ENDINGS)
+        self._noun_predicates = _SuffixTrie(PREDICATE_AFTER_NOUN)
+        self._predicate_endings = _SuffixTrie(PREDICATE_ENDINGS)
+        self._dictionary = _PrefixTrie(self._load_dictionary(dictionary_path))
+        self._lock = threading.Lock()
+        self._stats = {"texts": 0, "words": 0}
+
+    @staticmethod
+    def _load_dictionary(path: Optional[str]) -> list[str]:
+        if not path:
+            return []
+        try:
+            with open(path, encoding="utf-8") as f:
+                words = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+            logger.info(f"명사 사전 로드: {len(words)}개 ({path})")
+            return words
+        except OSError as e:
+            logger.warning(f"명사 사전 로드 실패 ({path}): {e}")
+            return []
+
+    def _word_nouns(self, word: str) -> list[str]:
+        """어절 하나에서 명사 추출"""
+        # 1. 사전 최장 일치: 나머지가 조사/하다 계열이면 사전 명사만, 아니면 나머지도 다시 분석
+        matched = self._dictionary.longest_prefix(word)
+        if matched:
+            rest = word[matched:]
+            if not rest or self._josa.longest_suffix(rest, 0) == len(rest) \
+                    or self._noun_predicates.longest_suffix(rest, 0) == len(rest):
+                return [word[:matched]]
+            return [word[:matched], *self._word_nouns(rest)]
+
+        # 2. 명사 + 하다/되다 계열 (예: 발표했다 → 발표)
+        predicate = self._noun_predicates.longest_suffix(word, 2)
+        if predicate:
+            return [word[:-predicate]]
+
+        # 3. 조사 제거 (예: 정부가 → 정부, 확대하기로 → 확대하기 → 확대)
+        josa = self._josa.longest_suffix(word, 2)
+        if josa and not self._is_noun_final(word, josa):
+            stem = word[:-josa]
+            predicate = self._noun_predicates.longest_suffix(stem, 2)
+            return [stem[:-predicate] if predicate else stem]
+
+        # 4. 그 밖의 용언 어미로 끝나면 명사가 아닌 것으로 보고 제외
+        if self._predicate_endings.longest_suffix(word, 1):
+            return []
+        if len(word) == 2 and word[-1] in SHORT_PREDICATE_FINALS:
+            return []
+        return [word]
+
+    def _is_noun_final(self, word: str, josa: int) -> bool:
+        """어절 끝의 한 글자 조사 후보(의/이)가 실제로는 명사의 일부인지
+        (민주주의, 고양이 → 명사 일부, 민주주의의, 정부의 → 조사)"""
+        if josa != 1 or word[-1] not in AMBIGUOUS_JOSA:
+            return False
+        if self._noun_endings.longest_suffix(word[:-1], 0):
+            return False
+        return bool(self._noun_endings.longest_suffix(word, 0))
+
+    def nouns_batch(self, texts: list[str]) -> list[list[str]]:
+        results = []
+        word_count = 0
+        for text in texts:
+            words = HANGUL_WORD_RE.findall(text or "")
+            word_count += len(words)
+            nouns = []
+            for word in words:
+                nouns.extend(self._word_nouns(word))
+            results.append(nouns)
+        with self._lock:
+            self._stats["texts"] += len(texts)
+            self._stats["words"] += word_count
+        return results
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        return {"engine": self.name, "dictionary_words": self._dictionary.size, **stats}
+
+
+NOUN_EXTRACTORS = {
+    OktNounExtractor.name: OktNounExtractor,
+    SimpleNounExtractor.name: SimpleNounExtractor,
+}
+
+
+@lru_cache(maxsize=None)
+def get_noun_extractor(engine: Optional[str] = None) -> NounExtractor:
+    """설정된(또는 지정한) 명사 추출 엔진 (엔진별 인스턴스 하나)"""
+    engine = engine or KEYWORD_ANALYZER_ENGINE
+    extractor_cls = NOUN_EXTRACTORS.get(engine)
+    if extractor_cls is None:
+        logger.warning(f"알 수 없는 명사 추출 엔진 '{engine}', okt 사용")
+        extractor_cls = OktNounExtractor
+    return extractor_cls()
@@ -0,0 +1,153 @@
+"""
+뉴스 검색 결과 캐시
+
+NewsAPI get_everything 호출 앞단에 위치하는 2단계 캐시입니다.
+- 1단계: 프로세스 메모리 (TTL + LRU)
+- 2단계: SQLite 파일 (선택, SEARCH_CACHE_SQLITE_PATH 설정 시 활성화, 재시작 후에도 유지)
+
+빈 결과(negative)도 짧은 TTL로 캐시하여 NewsAPI 할당량 소모를 줄입니다.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+from utils.cache import TTLCache, SQLiteCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "600"))  # 결과 있는 검색 (초)
+SEARCH_CACHE_NEGATIVE_TTL = float(os.getenv("SEARCH_CACHE_NEGATIVE_TTL", "60"))  # 빈 결과 (초)
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+SEARCH_CACHE_SQLITE_PATH = os.getenv("SEARCH_CACHE_SQLITE_PATH", "")  # 비어있으면 디스크 캐시 비활성화
+SEARCH_CACHE_DISK_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_DISK_MAX_ENTRIES", "10000"))
+
+
+def make_search_key(
+    query: Optional[str],
+    from_date: Optional[str],
+    to_date: Optional[str],
+    page_size: int,
+    sort_by: str = "popularity",
+) -> str:
+    """정규화된 검색 캐시 키 생성
+
+    Args:
+        query: NewsAPI에 보내는 검색어 (번역 완료된 키워드 또는 국가 기본 키워드)
+        from_date: 시작일
+        to_date: 종료일
+        page_size: 결과 개수
+        sort_by: 정렬 기준
+
+    Returns:
+        캐시 키 (공백 정리 + casefold 적용)
+    """
+    normalized_query = " ".join((query or "").split()).casefold()
+    return "|".join([
+        normalized_query,
+        (from_date or "").strip(),
+        (to_date or "").strip(),
+        str(page_size),
+        sort_by,
+    ])
+
+
+def _copy_response(response: dict) -> dict:
+    """캐시된 응답이 호출 측에서 변경되지 않도록 기사 단위로 복사"""
+    return {
+        **response,
+        "articles": [dict(article) for article in response.get("articles", [])],
+    }
+
+
+class SearchResultCache:
+    """메모리 + SQLite 2단계 검색 결과 캐시"""
+
+    def __init__(
+        self,
+        ttl: float = SEARCH_CACHE_TTL,
+        negative_ttl: float = SEARCH_CACHE_NEGATIVE_TTL,
+        max_entries: int = SEARCH_CACHE_MAX_ENTRIES,
+        sqlite_path: str = SEARCH_CACHE_SQLITE_PATH,
+        disk_max_entries: int = SEARCH_CACHE_DISK_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.memory = TTLCache(maxsize=max_entries, ttl=ttl)
+        self.disk: Optional[SQLiteCache] = None
+        if sqlite_path:
+            try:
+                self.disk = SQLiteCache(sqlite_path, table="search_cache", max_entries=disk_max_entries)
+                logger.info(f"검색 디스크 캐시 활성화: {sqlite_path}")
+            except Exception as e:
+                logger.warning(f"검색 디스크 캐시 초기화 실패, 메모리 캐시만 사용: {e}")
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[dict]:
+        """캐시 조회 (메모리 → 디스크 순, 디스크 적중 시 메모리로 승격)"""
+        response = self.memory.get(key)
+        if response is not None:
+            self.memory_hits += 1
+        elif self.disk is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk.get_entry, key)
+            except Exception as e:
+                logger.warning(f"검색 디스크 캐시 조회 실패: {e}")
+                entry = None
+            if entry is not None:
+                response, remaining_ttl = entry
+                self.memory.set(key, response, ttl=remaining_ttl)
+                self.disk_hits += 1
+
+        if response is None:
+            self.misses += 1
+            return None
+
+        if not response.get("articles"):
+            self.negative_hits += 1
+        return _copy_response(response)
+
+    async def set(self, key: str, response: dict):
+        """캐시 저장 (빈 결과는 negative TTL 적용)"""
+        ttl = self.ttl if response.get("articles") else self.negative_ttl
+        response = _copy_response(response)
+        self.memory.set(key, response, ttl=ttl)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, response, ttl)
+            except Exception as e:
+                logger.warning(f"검색 디스크 캐시 저장 실패: {e}")
+
+    def clear(self) -> int:
+        """메모리/디스크 캐시 전체 삭제"""
+        count = self.memory.clear()
+        if self.disk is not None:
+            count += self.disk.clear()
+        return count
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 통계"""
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "memory": self.memory.stats(),
+            "disk_enabled": self.disk is not None,
+        }
+
+
+# 요청 간 공유되는 검색 캐시
+search_cache = SearchResultCache()
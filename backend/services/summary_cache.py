@@ -0,0 +1,117 @@
+"""
+GPT 요약 캐시
+
+인기 기사는 여러 사용자의 use_gpt 검색에서 반복해서 요약되므로
+(기사 URL 또는 본문 해시, 모델, 문장 수, 프롬프트 버전)을 키로 요약을 재사용합니다.
+- 1단계: 프로세스 메모리 (TTL + LRU)
+- 2단계: DB (summary_cache 테이블)
+
+프롬프트가 바뀌면 버전이 달라져 기존 캐시는 자동으로 무시되고,
+purge_stale_summaries로 이전 버전 행을 정리합니다.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+from database import SessionLocal
+from models.cache_models import SummaryCache
+from utils.cache import TieredDBCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", str(3 * 24 * 3600)))  # 기본 3일 (초)
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "2000"))
+
+summary_cache = TieredDBCache(
+    "요약 캐시",
+    SummaryCache,
+    "summary",
+    session_factory=SessionLocal,
+    maxsize=SUMMARY_CACHE_MAX_ENTRIES,
+    ttl=SUMMARY_CACHE_TTL,
+)
+
+
+def make_summary_key(
+    url: Optional[str],
+    text: str,
+    model: str,
+    max_sentences: int,
+    prompt_version: str
+) -> str:
+    """요약 캐시 키 생성 (URL이 있으면 URL, 없으면 본문 해시 기준)"""
+    if url:
+        source = f"url:{url.strip()}"
+    else:
+        source = "text:" + hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+    raw = f"{prompt_version}\x00{model}\x00{max_sentences}\x00{source}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached_summary(cache_key: str) -> Optional[str]:
+    """요약 캐시 조회 (메모리 → DB 순, DB 적중 시 메모리로 승격)"""
+    return summary_cache.get(cache_key)
+
+
+def prefetch_summaries(cache_keys: list[str]) -> int:
+    """여러 요약 캐시를 한 번의 DB 쿼리로 메모리에 적재
+
+    Returns:
+        메모리로 적재된 항목 수
+    """
+    return summary_cache.prefetch(cache_keys)
+
+
+def save_summary(
+    cache_key: str,
+    summary: str,
+    url: Optional[str],
+    model: str,
+    max_sentences: int,
+    prompt_version: str
+):
+    """요약을 메모리와 DB에 저장"""
+    summary_cache.save(
+        cache_key,
+        summary,
+        article_url=url,
+        model=model,
+        max_sentences=max_sentences,
+        prompt_version=prompt_version,
+    )
+
+
+def invalidate_summary(url: str) -> int:
+    """특정 기사 URL의 요약 캐시 삭제 (모든 모델/문장 수/버전)
+
+    Returns:
+        삭제된 DB 행 수
+    """
+    # 메모리 키는 해시라 URL로 찾을 수 없으므로 전체 비움
+    deleted = summary_cache.delete_where(SummaryCache.article_url == url, clear_memory=True)
+    logger.info(f"요약 캐시 삭제: {deleted}건 (url={url})")
+    return deleted
+
+
+def purge_stale_summaries(prompt_version: str) -> int:
+    """만료되었거나 이전 프롬프트 버전으로 만든 요약 삭제
+
+    Returns:
+        삭제된 DB 행 수
+    """
+    deleted = summary_cache.delete_where(
+        (SummaryCache.prompt_version != prompt_version) | summary_cache.expired()
+    )
+    if deleted:
+        logger.info(f"오래된 요약 캐시 삭제: {deleted}건 (현재 프롬프트 버전: {prompt_version})")
+    return deleted
+
+
+def get_summary_cache_stats() -> dict:
+    """요약 캐시 통계"""
+    return summary_cache.stats()
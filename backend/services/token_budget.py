@@ -0,0 +1,240 @@
+"""
+GPT 토큰 예산 관리
+
+- 토큰 계산: tiktoken이 있으면 모델 토크나이저로 정확히 계산하고,
+  없거나 인코딩 파일을 받을 수 없는 환경(오프라인)이면 문자 종류별 보정값으로 추정
+- 예산 맞춤: 기사 본문을 토큰 예산 안에서 문장 단위로 자르기
+- 사용량 기록: 요청 전 계획한 토큰 수와 응답 usage의 실제 토큰 수 비교
+"""
+
+import logging
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# auto: tiktoken 우선, 실패 시 추정 / estimate: 항상 추정
+TOKEN_COUNTER = os.getenv("TOKEN_COUNTER", "auto")
+
+# 채팅 메시지 형식 오버헤드 (gpt-4o 계열: 메시지당 3토큰, 응답 시작 3토큰)
+TOKENS_PER_MESSAGE = 3
+TOKENS_REPLY_PRIMING = 3
+
+# 문자 종류별 문자/토큰 비율 (gpt-4o o200k_base 기준으로 뉴스 문장에서 보정한 값)
+CHARS_PER_TOKEN = {
+    "hangul": 1.5,
+    "cjk": 1.2,     # 한자, 히라가나, 가타카나
+    "latin": 4.0,   # 영문/숫자/기호
+}
+
+# 모델별 비용 (USD per 1M tokens: 입력, 출력)
+MODEL_PRICING = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+HANGUL_RE = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏]")
+CJK_RE = re.compile(r"[぀-ヿ㐀-䶿一-鿿]")
+WHITESPACE_RE = re.compile(r"\s+")
+# 문장 경계: 마침표/물음표/느낌표(전각 포함) 뒤 공백, 또는 줄바꿈
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델의 tiktoken 인코딩 (사용할 수 없으면 None)"""
+    if TOKEN_COUNTER == "estimate":
+        return None
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("tiktoken이 설치되지 않아 토큰 수를 추정합니다.")
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # 인코딩 파일을 내려받지 못하는 오프라인 환경 등
+        logger.warning(f"tiktoken 인코딩 로드 실패, 토큰 수를 추정합니다: {e}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 종류별 보정값으로 토큰 수 추정 (오프라인용)"""
+    if not text:
+        return 0
+    hangul = len(HANGUL_RE.findall(text))
+    cjk = len(CJK_RE.findall(text))
+    # 공백은 대부분 앞뒤 단어 토큰에 흡수되므로 제외
+    other = len(WHITESPACE_RE.sub("", text)) - hangul - cjk
+    tokens = (
+        hangul / CHARS_PER_TOKEN["hangul"]
+        + cjk / CHARS_PER_TOKEN["cjk"]
+        + other / CHARS_PER_TOKEN["latin"]
+    )
+    return max(1, round(tokens))
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """텍스트의 토큰 수 (tiktoken 사용 가능하면 정확한 값)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(messages: list[dict], model: str = "gpt-4o-mini") -> int:
+    """chat completion 요청의 프롬프트 토큰 수 (메시지 형식 오버헤드 포함)"""
+    total = TOKENS_REPLY_PRIMING
+    for message in messages:
+        total += TOKENS_PER_MESSAGE
+        total += count_tokens(message.get("content") or "", model)
+        total += count_tokens(message.get("role") or "", model)
+    return total
+
+
+def trim_to_token_budget(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
+    """
+    텍스트를 토큰 예산 안에 들어가도록 문장 단위로 자릅니다.
+    남은 부분은 원문 그대로이며 (문장 사이 줄바꿈 유지), 첫 문장부터 예산을 넘으면 문장 중간에서 자릅니다.
+
+    Args:
+        text: 원본 텍스트
+        max_tokens: 최대 토큰 수
+        model: 모델 이름 (토크나이저 선택)
+
+    Returns:
+        예산 안에 들어가는 텍스트
+    """
+    if not text or count_tokens(text, model) <= max_tokens:
+        return text
+
+    # 원문을 마지막으로 넣은 문장 끝에서 잘라 문단 줄바꿈 등 원래 구분자를 유지
+    kept_end = 0
+    used = 0
+    start = 0
+    for boundary in [*SENTENCE_SPLIT_RE.finditer(text), None]:
+        end = boundary.start() if boundary is not None else len(text)
+        if end > start:
+            # 앞 구분자(공백/줄바꿈)까지 포함해 계산
+            segment_tokens = count_tokens(text[kept_end:end], model)
+            if used + segment_tokens > max_tokens:
+                break
+            used += segment_tokens
+            kept_end = end
+        if boundary is not None:
+            start = boundary.end()
+
+    if kept_end:
+        return text[:kept_end]
+
+    # 첫 문장이 예산보다 길면 글자 수 기준 이진 탐색으로 자름
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid], model) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def estimate_cost_usd(prompt_tokens: int, completion_tokens: int = 0, model: str = "gpt-4o-mini") -> float:
+    """토큰 수로 비용 계산 (USD)"""
+    input_price, output_price = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4o-mini"])
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def plan_chat_request(messages: list[dict], max_completion_tokens: int, model: str = "gpt-4o-mini") -> dict:
+    """
+    요청 전 토큰 예산 계획
+
+    Returns:
+        {"model", "prompt_tokens", "max_completion_tokens", "max_cost_usd"}
+    """
+    prompt_tokens = count_message_tokens(messages, model)
+    return {
+        "model": model,
+        "prompt_tokens": prompt_tokens,
+        "max_completion_tokens": max_completion_tokens,
+        "max_cost_usd": estimate_cost_usd(prompt_tokens, max_completion_tokens, model),
+    }
+
+
+# 계획 대비 실제 사용량 누적 (용도별)
+_usage_lock = threading.Lock()
+_usage_stats: dict[str, dict] = {}
+
+
+def record_usage(purpose: str, plan: dict, response) -> Optional[dict]:
+    """
+    응답의 usage와 계획을 비교해 기록합니다.
+
+    Args:
+        purpose: 용도 (summary, translation 등)
+        plan: plan_chat_request 결과
+        response: OpenAI chat completion 응답
+
+    Returns:
+        {"planned_prompt_tokens", "prompt_tokens", "completion_tokens"} (usage가 없으면 None)
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+
+    with _usage_lock:
+        stats = _usage_stats.setdefault(purpose, {
+            "requests": 0,
+            "planned_prompt_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "max_completion_tokens": 0,
+            "cost_usd": 0.0,
+        })
+        stats["requests"] += 1
+        stats["planned_prompt_tokens"] += plan["prompt_tokens"]
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        stats["max_completion_tokens"] += plan["max_completion_tokens"]
+        stats["cost_usd"] += estimate_cost_usd(prompt_tokens, completion_tokens, plan["model"])
+
+    logger.debug(
+        f"[{purpose}] 토큰 계획/실제: 프롬프트 {plan['prompt_tokens']}/{prompt_tokens}, "
+        f"완성 최대 {plan['max_completion_tokens']}/실제 {completion_tokens}"
+    )
+    return {
+        "planned_prompt_tokens": plan["prompt_tokens"],
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+    }
+
+
+def get_usage_stats() -> dict:
+    """용도별 계획 대비 실제 토큰 사용량 (프롬프트 추정 오차율 포함)"""
+    with _usage_lock:
+        result = {}
+        for purpose, stats in _usage_stats.items():
+            actual = stats["prompt_tokens"]
+            error = (stats["planned_prompt_tokens"] - actual) / actual if actual else 0.0
+            result[purpose] = {
+                **stats,
+                "cost_usd": round(stats["cost_usd"], 6),
+                "prompt_estimate_error": round(error, 4),
+            }
+        return result
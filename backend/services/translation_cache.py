@@ -0,0 +1,104 @@
+"""
+기사 텍스트 번역 캐시
+
+같은 헤드라인/설명이 여러 사용자의 검색에 반복해서 등장하므로
+(원문, 대상 언어, 번역기) 해시를 키로 번역 결과를 재사용합니다.
+- 1단계: 프로세스 메모리 (TTL + LRU, 크기 제한)
+- 2단계: DB (text_translations 테이블, 재시작 후에도 유지)
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+from database import SessionLocal
+from models.cache_models import TextTranslation
+from utils.cache import TieredDBCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", str(7 * 24 * 3600)))  # 기본 7일 (초)
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "5000"))
+
+translation_cache = TieredDBCache(
+    "번역 캐시",
+    TextTranslation,
+    "translated_text",
+    session_factory=SessionLocal,
+    maxsize=TRANSLATION_CACHE_MAX_ENTRIES,
+    ttl=TRANSLATION_CACHE_TTL,
+)
+
+
+def make_translation_key(text: str, target_lang: str, provider: str) -> str:
+    """(원문, 대상 언어, 번역기) 해시 키 생성"""
+    raw = f"{provider}\x00{target_lang}\x00{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached_translation(text: str, target_lang: str, provider: str) -> Optional[str]:
+    """번역 캐시 조회 (메모리 → DB 순, DB 적중 시 메모리로 승격)
+
+    Args:
+        text: 원문
+        target_lang: 대상 언어 코드
+        provider: 번역기 (gpt, google)
+
+    Returns:
+        캐시된 번역 (없으면 None)
+    """
+    return translation_cache.get(make_translation_key(text, target_lang, provider))
+
+
+def prefetch_translations(texts: list[str], target_lang: str, providers: list[str]) -> int:
+    """여러 원문의 번역 캐시를 한 번의 DB 쿼리로 메모리에 적재
+
+    Args:
+        texts: 원문 목록
+        target_lang: 대상 언어 코드
+        providers: 조회할 번역기 목록
+
+    Returns:
+        메모리로 적재된 항목 수
+    """
+    return translation_cache.prefetch(
+        make_translation_key(text, target_lang, provider)
+        for text in texts if text
+        for provider in providers
+    )
+
+
+def save_translation(text: str, target_lang: str, provider: str, translated_text: str):
+    """번역 결과를 메모리와 DB에 저장"""
+    translation_cache.save(
+        make_translation_key(text, target_lang, provider),
+        translated_text,
+        target_lang=target_lang,
+        provider=provider,
+    )
+
+
+def purge_translation_cache(expired_only: bool = True) -> int:
+    """번역 캐시 삭제
+
+    Args:
+        expired_only: True면 만료된 항목만, False면 전체 삭제
+
+    Returns:
+        삭제된 DB 행 수
+    """
+    if expired_only:
+        deleted = translation_cache.delete_where(translation_cache.expired())
+    else:
+        deleted = translation_cache.delete_where(clear_memory=True)
+    logger.info(f"번역 캐시 삭제: {deleted}건 (expired_only={expired_only})")
+    return deleted
+
+
+def get_translation_cache_stats() -> dict:
+    """번역 캐시 통계"""
+    return translation_cache.stats()
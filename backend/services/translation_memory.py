@@ -0,0 +1,157 @@
+"""
+키워드 번역 메모리
+
+translate_keyword_for_country 결과를 (keyword, country) 단위로 DB에 영구 저장하고,
+앞단의 메모리 LRU로 반복 검색 시 번역 지연을 없앱니다.
+"""
+
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+from database import SessionLocal
+from models.cache_models import KeywordTranslation
+from utils.cache import TTLCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_MEMORY_MAX_ENTRIES = int(os.getenv("KEYWORD_MEMORY_MAX_ENTRIES", "2048"))
+
+# (keyword, country) → 번역 키워드 (만료 없음, LRU 제거만)
+keyword_memory = TTLCache(maxsize=KEYWORD_MEMORY_MAX_ENTRIES, ttl=None)
+
+
+def normalize_keyword(keyword: str) -> str:
+    """키워드 정규화 (공백 정리 + casefold)"""
+    return " ".join((keyword or "").split()).casefold()
+
+
+def get_keyword_translation(keyword: str, country: str) -> Optional[str]:
+    """번역 메모리 조회 (메모리 LRU → DB 순)
+
+    Args:
+        keyword: 원본 키워드
+        country: 국가 코드
+
+    Returns:
+        저장된 번역 키워드 (없으면 None)
+    """
+    key = (normalize_keyword(keyword), country)
+    translated = keyword_memory.get(key)
+    if translated is not None:
+        return translated
+
+    db = SessionLocal()
+    try:
+        entry = db.query(KeywordTranslation)\
+            .filter(
+                KeywordTranslation.keyword == key[0],
+                KeywordTranslation.country == country
+            )\
+            .first()
+        if entry is None:
+            return None
+
+        keyword_memory.set(key, entry.translated_keyword)
+        return entry.translated_keyword
+    except Exception as e:
+        logger.warning(f"키워드 번역 메모리 조회 실패: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def save_keyword_translation(keyword: str, country: str, translated_keyword: str, provider: str):
+    """번역 결과를 메모리 LRU와 DB에 저장 (이미 있으면 갱신)"""
+    key = (normalize_keyword(keyword), country)
+    keyword_memory.set(key, translated_keyword)
+
+    db = SessionLocal()
+    try:
+        entry = db.query(KeywordTranslation)\
+            .filter(
+                KeywordTranslation.keyword == key[0],
+                KeywordTranslation.country == country
+            )\
+            .first()
+        if entry is None:
+            entry = KeywordTranslation(keyword=key[0], country=country)
+            db.add(entry)
+        entry.translated_keyword = translated_keyword
+        entry.provider = provider
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"키워드 번역 메모리 저장 실패: {e}")
+    finally:
+        db.close()
+
+
+def list_keyword_translations(
+    country: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> list[dict]:
+    """DB에 저장된 키워드 번역 목록 (최신순)"""
+    db = SessionLocal()
+    try:
+        query = db.query(KeywordTranslation)
+        if country:
+            query = query.filter(KeywordTranslation.country == country)
+        entries = query\
+            .order_by(KeywordTranslation.id.desc())\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+        return [
+            {
+                "keyword": entry.keyword,
+                "country": entry.country,
+                "translated_keyword": entry.translated_keyword,
+                "provider": entry.provider,
+                "created_at": entry.created_at,
+                "updated_at": entry.updated_at,
+            }
+            for entry in entries
+        ]
+    finally:
+        db.close()
+
+
+def purge_keyword_translations(keyword: Optional[str] = None, country: Optional[str] = None) -> int:
+    """키워드 번역 삭제 (조건 없으면 전체 삭제)
+
+    Returns:
+        삭제된 DB 행 수
+    """
+    normalized = normalize_keyword(keyword) if keyword else None
+
+    # 메모리 LRU에서 조건에 맞는 항목 제거
+    for key, _ in keyword_memory.items():
+        if (normalized is None or key[0] == normalized) and (country is None or key[1] == country):
+            keyword_memory.delete(key)
+
+    db = SessionLocal()
+    try:
+        query = db.query(KeywordTranslation)
+        if normalized is not None:
+            query = query.filter(KeywordTranslation.keyword == normalized)
+        if country:
+            query = query.filter(KeywordTranslation.country == country)
+        deleted = query.delete(synchronize_session=False)
+        db.commit()
+        logger.info(f"키워드 번역 메모리 삭제: {deleted}건 (keyword={keyword}, country={country})")
+        return deleted
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def get_keyword_memory_stats() -> dict:
+    """메모리 LRU 통계"""
+    return keyword_memory.stats()
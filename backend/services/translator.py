@@ -6,10 +6,18 @@ GPT를 사용하여 검색 키워드를 국가별 언어로 번역합니다.
 """
 
 from deep_translator import GoogleTranslator
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from dotenv import load_dotenv
 
+from services.translation_memory import get_keyword_translation, save_keyword_translation
+from services.translation_cache import get_cached_translation, save_translation, prefetch_translations
+from services.token_budget import count_tokens, trim_to_token_budget, plan_chat_request, record_usage
+from utils.rate_limit import ProviderLimiter
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -28,6 +36,33 @@ except Exception as e:
     logger.warning(f"GPT 클라이언트 초기화 실패 (키워드 번역): {e}")
     gpt_client = None
 
+# 기사 번역 병렬 처리 설정
+TRANSLATION_MAX_WORKERS = int(os.getenv("TRANSLATION_MAX_WORKERS", "16"))
+GPT_TRANSLATION_CONCURRENCY = int(os.getenv("GPT_TRANSLATION_CONCURRENCY", "4"))
+GPT_TRANSLATION_RATE = float(os.getenv("GPT_TRANSLATION_RATE", "5"))  # 초당 호출 수 (0이면 제한 없음)
+GOOGLE_TRANSLATION_CONCURRENCY = int(os.getenv("GOOGLE_TRANSLATION_CONCURRENCY", "8"))
+GOOGLE_TRANSLATION_RATE = float(os.getenv("GOOGLE_TRANSLATION_RATE", "10"))  # 초당 호출 수 (0이면 제한 없음)
+
+# 번역기별 호출 제한 (동시 실행 수 + 토큰 버킷)
+provider_limiters = {
+    "gpt": ProviderLimiter("gpt", GPT_TRANSLATION_CONCURRENCY, GPT_TRANSLATION_RATE),
+    "google": ProviderLimiter("google", GOOGLE_TRANSLATION_CONCURRENCY, GOOGLE_TRANSLATION_RATE),
+}
+
+_translation_executor = ThreadPoolExecutor(max_workers=TRANSLATION_MAX_WORKERS, thread_name_prefix="translator")
+
+# GPT 배치 번역 설정 (한 번의 chat completion에 담는 최대 항목 수 / 원문 토큰 수 / 출력 토큰 수)
+GPT_BATCH_MAX_ITEMS = int(os.getenv("GPT_BATCH_MAX_ITEMS", "20"))
+GPT_BATCH_INPUT_TOKENS = int(os.getenv("GPT_BATCH_INPUT_TOKENS", "1500"))
+GPT_BATCH_MAX_TOKENS = int(os.getenv("GPT_BATCH_MAX_TOKENS", "4000"))
+
+# 번역 토큰 예산 (텍스트 하나당 입력 최대 토큰 / 단건 번역 출력 최대 토큰)
+GPT_TRANSLATION_INPUT_TOKENS = int(os.getenv("GPT_TRANSLATION_INPUT_TOKENS", "1000"))
+GPT_TRANSLATION_MAX_TOKENS = int(os.getenv("GPT_TRANSLATION_MAX_TOKENS", "1000"))
+
+# 기사에서 번역하는 필드
+TRANSLATABLE_FIELDS = ("title", "description")
+
 # 지원 언어
 SUPPORTED_LANGUAGES = {
     "ko": "Korean",
@@ -60,6 +95,32 @@ def translate_text_with_gpt(text: str, target_lang: str = "ko", source_lang: str
     if target_lang not in SUPPORTED_LANGUAGES:
         return None
     
+    translated, _ = _cached_translate(
+        text, target_lang, "gpt",
+        lambda: _request_gpt_translation(text, target_lang, source_lang),
+    )
+    return translated
+
+
+def _cached_translate(text: str, target_lang: str, provider: str, translate_fn) -> tuple[Optional[str], bool]:
+    """
+    번역 캐시를 먼저 조회하고, 없으면 translate_fn으로 번역 후 캐시에 저장합니다.
+    
+    Returns:
+        (번역된 텍스트 또는 None, 캐시 적중 여부)
+    """
+    cached = get_cached_translation(text, target_lang, provider)
+    if cached is not None:
+        return cached, True
+    
+    translated = translate_fn()
+    if translated:
+        save_translation(text, target_lang, provider, translated)
+    return translated, False
+
+
+def _request_gpt_translation(text: str, target_lang: str, source_lang: str) -> Optional[str]:
+    """GPT 번역 API 호출 (캐시 미사용, 실패 시 None)"""
     try:
         target_language_name = SUPPORTED_LANGUAGES.get(target_lang, target_lang)
         
@@ -76,25 +137,35 @@ def translate_text_with_gpt(text: str, target_lang: str = "ko", source_lang: str
             else:
                 detected_lang = "자동 감지"
         
-        logger.debug(f"GPT 번역 시도: {len(text)}자 → {target_language_name}")
+        # 원문을 토큰 예산에 맞춰 문장 단위로 자름
+        source_text = trim_to_token_budget(text, GPT_TRANSLATION_INPUT_TOKENS)
+        input_tokens = count_tokens(source_text)
+        logger.debug(f"GPT 번역 시도: {len(text)}자 ({input_tokens}토큰) → {target_language_name}")
         
-        response = gpt_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"당신은 전문 번역가입니다. 주어진 텍스트를 {target_language_name}로 자연스럽고 정확하게 번역하세요.\n\n중요 규칙:\n- 원문의 의미를 정확히 전달하세요\n- 자연스러운 {target_language_name} 표현을 사용하세요\n- 전문 용어는 {target_language_name} 표준 용어로 번역하세요\n- 번역된 텍스트만 반환하세요 (설명 없이)"
-                },
-                {
-                    "role": "user",
-                    "content": f"다음 텍스트를 {target_language_name}로 번역하세요:\n\n{text[:3000]}"  # 최대 3000자
-                }
-            ],
-            temperature=0.3,
-            max_tokens=1000,
+        messages = [
+            {
+                "role": "system",
+                "content": f"당신은 전문 번역가입니다. 주어진 텍스트를 {target_language_name}로 자연스럽고 정확하게 번역하세요.\n\n중요 규칙:\n- 원문의 의미를 정확히 전달하세요\n- 자연스러운 {target_language_name} 표현을 사용하세요\n- 전문 용어는 {target_language_name} 표준 용어로 번역하세요\n- 번역된 텍스트만 반환하세요 (설명 없이)"
+            },
+            {
+                "role": "user",
+                "content": f"다음 텍스트를 {target_language_name}로 번역하세요:\n\n{source_text}"
+            }
+        ]
+        plan = plan_chat_request(
+            messages, min(GPT_TRANSLATION_MAX_TOKENS, _translation_output_budget(input_tokens))
         )
         
+        with provider_limiters["gpt"]:
+            response = gpt_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.3,
+                max_tokens=plan["max_completion_tokens"],
+            )
+        
         translated = response.choices[0].message.content.strip()
+        record_usage("translation", plan, response)
         logger.debug(f"GPT 번역 성공: {len(text)}자 → {len(translated)}자")
         return translated
         
@@ -103,6 +174,154 @@ def translate_text_with_gpt(text: str, target_lang: str = "ko", source_lang: str
         return None
 
 
+def _translation_output_budget(input_tokens: int, items: int = 1) -> int:
+    """번역 출력 토큰 예산 (언어에 따라 토큰 수가 늘어날 수 있어 입력의 2배 + 항목당 여유분)"""
+    return input_tokens * 2 + 32 * items
+
+
+def translate_texts_with_gpt(
+    texts: list[str],
+    target_lang: str = "ko",
+    concurrent: bool = True
+) -> list[tuple[Optional[str], bool, bool]]:
+    """
+    여러 텍스트를 GPT 배치 번역합니다.
+    번역 캐시 적중 항목은 제외하고, 나머지를 크기 제한에 맞춰 묶어
+    배치당 한 번의 chat completion으로 번역합니다.
+    
+    Args:
+        texts: 번역할 텍스트 목록
+        target_lang: 대상 언어 코드
+        concurrent: True면 여러 배치를 병렬로 요청
+    
+    Returns:
+        입력 순서대로 (번역된 텍스트 또는 None, 캐시 적중 여부, 배치 호출 실패 여부) 목록
+        (배치 응답에서 파싱하지 못한 항목은 (None, False, False),
+         호출 자체가 실패한 배치의 항목은 (None, False, True))
+    """
+    results: dict[str, tuple[Optional[str], bool, bool]] = {}
+    if not gpt_client or target_lang not in SUPPORTED_LANGUAGES:
+        return [(None, False, True) for _ in texts]
+    
+    # 캐시 조회 (중복 텍스트는 한 번만 번역)
+    misses = []
+    for text in dict.fromkeys(t for t in texts if t and t.strip()):
+        cached = get_cached_translation(text, target_lang, "gpt")
+        if cached is not None:
+            results[text] = (cached, True, False)
+        else:
+            misses.append(text)
+    
+    batches = _chunk_texts(misses, GPT_BATCH_MAX_ITEMS, GPT_BATCH_INPUT_TOKENS)
+    if batches:
+        logger.info(f"GPT 배치 번역: {len(misses)}개 텍스트 → {len(batches)}회 호출")
+    
+    if concurrent and len(batches) > 1:
+        batch_outputs = list(_translation_executor.map(
+            lambda batch: _request_gpt_batch_translation(batch, target_lang), batches
+        ))
+    else:
+        batch_outputs = [_request_gpt_batch_translation(batch, target_lang) for batch in batches]
+    
+    for batch, outputs in zip(batches, batch_outputs):
+        if outputs is None:
+            # 호출 자체가 실패 (할당량/인증/시간 초과 등) → 개별 GPT 재시도도 실패할 가능성이 높음
+            for text in batch:
+                results[text] = (None, False, True)
+            continue
+        for text, translated in zip(batch, outputs):
+            if translated:
+                save_translation(text, target_lang, "gpt", translated)
+            results[text] = (translated, False, False)
+    
+    return [results.get(text, (None, False, False)) for text in texts]
+
+
+def _chunk_texts(texts: list[str], max_items: int, max_tokens: int) -> list[list[str]]:
+    """텍스트 목록을 항목 수/원문 토큰 수 제한에 맞춰 배치로 분할
+    (언어마다 글자당 토큰 수가 달라 글자 수 대신 실제 요청에 들어갈 토큰 수로 계산)"""
+    batches = []
+    current = []
+    current_tokens = 0
+    for text in texts:
+        tokens = count_tokens(trim_to_token_budget(text, GPT_TRANSLATION_INPUT_TOKENS))
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _request_gpt_batch_translation(texts: list[str], target_lang: str) -> Optional[list[Optional[str]]]:
+    """
+    여러 텍스트를 하나의 JSON 프롬프트로 묶어 GPT 번역 API를 한 번 호출합니다. (캐시 미사용)
+    
+    Returns:
+        입력 순서대로 번역 결과 목록 (파싱하지 못한 항목은 None),
+        호출 자체가 실패하면 None
+    """
+    if not texts:
+        return []
+    
+    target_language_name = SUPPORTED_LANGUAGES.get(target_lang, target_lang)
+    source_texts = [trim_to_token_budget(text, GPT_TRANSLATION_INPUT_TOKENS) for text in texts]
+    payload = json.dumps(
+        {"items": [{"id": idx, "text": text} for idx, text in enumerate(source_texts)]},
+        ensure_ascii=False,
+    )
+    input_tokens = sum(count_tokens(text) for text in source_texts)
+    messages = [
+        {
+            "role": "system",
+            "content": f"당신은 전문 번역가입니다. 입력 JSON의 items 각 항목의 text를 {target_language_name}로 자연스럽고 정확하게 번역하세요.\n\n중요 규칙:\n- 원문의 의미를 정확히 전달하세요\n- 전문 용어는 {target_language_name} 표준 용어로 번역하세요\n- 모든 항목을 빠짐없이 번역하고 id를 그대로 유지하세요\n- 다음 형식의 JSON만 반환하세요: {{\"translations\": [{{\"id\": 0, \"text\": \"번역문\"}}]}}"
+        },
+        {
+            "role": "user",
+            "content": payload
+        }
+    ]
+    plan = plan_chat_request(
+        messages, min(GPT_BATCH_MAX_TOKENS, _translation_output_budget(input_tokens, len(texts)))
+    )
+    
+    try:
+        with provider_limiters["gpt"]:
+            response = gpt_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.3,
+                max_tokens=plan["max_completion_tokens"],
+                response_format={"type": "json_object"},
+            )
+        record_usage("translation_batch", plan, response)
+        content = response.choices[0].message.content
+        translations = json.loads(content).get("translations", [])
+    except Exception as e:
+        logger.warning(f"GPT 배치 번역 실패 ({len(texts)}개): {e}")
+        return None
+    
+    results: list[Optional[str]] = [None] * len(texts)
+    for item in translations if isinstance(translations, list) else []:
+        try:
+            idx = int(item.get("id"))
+            translated = item.get("text")
+        except (AttributeError, TypeError, ValueError):
+            continue
+        if 0 <= idx < len(texts) and isinstance(translated, str) and translated.strip():
+            results[idx] = translated.strip()
+    
+    parsed_count = sum(1 for r in results if r)
+    if parsed_count < len(texts):
+        logger.warning(f"GPT 배치 번역 일부 누락: {parsed_count}/{len(texts)}개 파싱 성공")
+    else:
+        logger.debug(f"GPT 배치 번역 성공: {len(texts)}개")
+    return results
+
+
 def translate_text(text: str, target_lang: str = "ko", source_lang: str = "auto", use_gpt: bool = True) -> str:
     """
     텍스트를 지정된 언어로 번역합니다.
@@ -117,37 +336,70 @@ def translate_text(text: str, target_lang: str = "ko", source_lang: str = "auto"
     Returns:
         번역된 텍스트
     """
+    translated, _ = translate_text_with_cache_info(text, target_lang, source_lang, use_gpt)
+    return translated
+
+
+def translate_text_with_cache_info(
+    text: str,
+    target_lang: str = "ko",
+    source_lang: str = "auto",
+    use_gpt: bool = True
+) -> tuple[str, bool]:
+    """
+    translate_text와 같지만 번역 캐시 적중 여부도 함께 반환합니다.
+    캐시 적중 시 네트워크 호출 없이 바로 반환합니다.
+    
+    Returns:
+        (번역된 텍스트, 캐시 적중 여부)
+    """
     if not text or not text.strip():
-        return text
+        return text, False
     
     if target_lang not in SUPPORTED_LANGUAGES:
         logger.warning(f"지원하지 않는 언어: {target_lang}")
-        return text
+        return text, False
     
     # 1) GPT 번역 시도 (옵션)
-    if use_gpt:
-        gpt_translated = translate_text_with_gpt(text, target_lang, source_lang)
+    if use_gpt and gpt_client:
+        gpt_translated, from_cache = _cached_translate(
+            text, target_lang, "gpt",
+            lambda: _request_gpt_translation(text, target_lang, source_lang),
+        )
         if gpt_translated:
-            return gpt_translated
+            return gpt_translated, from_cache
         logger.info("GPT 번역 실패, Google Translator로 폴백")
     
     # 2) Google Translator로 폴백
+    translated, from_cache = _cached_translate(
+        text, target_lang, "google",
+        lambda: _request_google_translation(text, target_lang, source_lang),
+    )
+    if translated is None:
+        return text, False  # 실패 시 원문 반환
+    return translated, from_cache
+
+
+def _request_google_translation(text: str, target_lang: str, source_lang: str) -> Optional[str]:
+    """Google Translator 호출 (캐시 미사용, 실패 시 None)"""
     try:
         translator = GoogleTranslator(source=source_lang, target=target_lang)
-        translated = translator.translate(text[:5000])  # 최대 5000자로 제한
+        with provider_limiters["google"]:
+            translated = translator.translate(text[:5000])  # 최대 5000자로 제한
         
         logger.debug(f"Google Translator 번역 완료: {len(text)}자 → {len(translated)}자")
         return translated
         
     except Exception as e:
         logger.error(f"번역 실패: {e}")
-        return text  # 실패 시 원문 반환
+        return None
 
 
 def translate_articles(
     articles: list[dict],
     target_lang: str = "ko",
-    translate_fields: list[str] = ["title", "description"]
+    translate_fields: list[str] = ["title", "description"],
+    concurrent: bool = True
 ) -> list[dict]:
     """
     뉴스 기사 목록을 번역합니다.
@@ -156,6 +408,8 @@ def translate_articles(
         articles: 뉴스 기사 목록
         target_lang: 대상 언어 코드
         translate_fields: 번역할 필드 목록 (title, description 등)
+        concurrent: True면 (기사, 필드) 단위 번역을 스레드 풀에서 병렬 실행
+                    (번역기별 동시 실행 수/초당 호출 수 제한 적용)
     
     Returns:
         번역된 기사 목록 (translated_title, translated_description 필드 추가)
@@ -163,57 +417,133 @@ def translate_articles(
     if not articles:
         return articles
     
-    logger.info(f"{len(articles)}개 기사 번역 시작 (대상 언어: {target_lang})")
+    logger.info(f"{len(articles)}개 기사 번역 시작 (대상 언어: {target_lang}, 병렬: {concurrent})")
+    
+    # 번역 캐시를 한 번의 DB 쿼리로 미리 적재
+    prefetch_translations(
+        [article.get(field) for article in articles for field in translate_fields],
+        target_lang,
+        ["gpt", "google"],
+    )
+    
+    # (기사 인덱스, 필드) 단위 번역 작업 목록
+    jobs = [
+        (idx, field)
+        for idx, article in enumerate(articles)
+        for field in TRANSLATABLE_FIELDS
+        if field in translate_fields and article.get(field)
+    ]
+    
+    # 배치 호출 자체가 실패한 항목 (GPT 단건 재시도 없이 바로 Google로)
+    gpt_failed: set[tuple[int, str]] = set()
     
+    def run_job(job: tuple[int, str]) -> tuple[str, bool]:
+        idx, field = job
+        return translate_text_with_cache_info(articles[idx][field], target_lang, use_gpt=job not in gpt_failed)
+    
+    results: dict[tuple[int, str], tuple[str, bool]] = {}
+    failed_articles: set[int] = set()
+    
+    # 1) GPT 배치 번역: 페이지의 모든 필드를 몇 번의 호출로 처리
+    pending = jobs
+    if gpt_client and jobs:
+        batch_results = translate_texts_with_gpt(
+            [articles[idx][field] for idx, field in jobs],
+            target_lang,
+            concurrent=concurrent,
+        )
+        for job, (translated, from_cache, call_failed) in zip(jobs, batch_results):
+            if translated:
+                results[job] = (translated, from_cache)
+            elif call_failed:
+                gpt_failed.add(job)
+        pending = [job for job in jobs if job not in results]
+        if pending:
+            logger.info(
+                f"GPT 배치 번역 누락 {len(pending)}개 항목 개별 재시도 "
+                f"(호출 실패 {len(gpt_failed)}개는 Google로)"
+            )
+    
+    # 2) 배치에서 누락된 항목은 필드 단위로 개별 번역
+    #    (파싱 누락은 GPT 단건 → Google 폴백, 호출 실패 배치는 바로 Google)
+    if concurrent and len(pending) > 1:
+        # 모든 필드를 동시에 제출 → 전체 소요 시간은 가장 느린 호출 수준
+        futures = {job: _translation_executor.submit(run_job, job) for job in pending}
+        for job, future in futures.items():
+            try:
+                results[job] = future.result()
+            except Exception as e:
+                logger.error(f"기사 {job[0]+1} {job[1]} 번역 실패: {e}")
+                failed_articles.add(job[0])
+    else:
+        for job in pending:
+            try:
+                results[job] = run_job(job)
+            except Exception as e:
+                logger.error(f"기사 {job[0]+1} {job[1]} 번역 실패: {e}")
+                failed_articles.add(job[0])
+    
+    # 원래 순서대로 결과 조립
     translated_articles = []
     success_count = 0
-    # 너무 많은 GPT 호출을 막기 위해 상위 N개 기사만 GPT 사용
-    gpt_limit = 2
+    cache_hit_count = 0
     
     for idx, article in enumerate(articles):
-        try:
-            article_copy = {**article}
-            
-            # 제목 번역
-            if "title" in translate_fields and article.get("title"):
-                original_title = article.get("title", "")
-                translated_title = translate_text(
-                    original_title,
-                    target_lang,
-                    use_gpt=(idx < gpt_limit),
-                )
-                article_copy["translated_title"] = translated_title
-                article_copy["original_title"] = original_title
-            
-            # 설명 번역
-            if "description" in translate_fields and article.get("description"):
-                original_description = article.get("description", "")
-                translated_description = translate_text(
-                    original_description,
-                    target_lang,
-                    use_gpt=(idx < gpt_limit),
-                )
-                article_copy["translated_description"] = translated_description
-                article_copy["original_description"] = original_description
-            
-            # 번역 언어 정보 추가
-            article_copy["translation_language"] = target_lang
-            
-            translated_articles.append(article_copy)
-            success_count += 1
-            
-            logger.debug(f"기사 {idx+1}/{len(articles)} 번역 완료")
-            
-        except Exception as e:
-            logger.error(f"기사 {idx+1} 번역 실패: {e}")
+        if idx in failed_articles:
             # 번역 실패 시 원본 기사 그대로 추가
             translated_articles.append(article)
+            continue
+        
+        field_results = {
+            field: results[(idx, field)]
+            for field in TRANSLATABLE_FIELDS
+            if (idx, field) in results
+        }
+        article_copy = apply_translations(article, target_lang, field_results)
+        cache_hit_count += len(article_copy["translation_cached_fields"])
+        translated_articles.append(article_copy)
+        success_count += 1
     
-    logger.info(f"번역 완료: {success_count}/{len(articles)}개 성공")
+    logger.info(f"번역 완료: {success_count}/{len(articles)}개 성공 (캐시 적중 {cache_hit_count}개 필드)")
     
     return translated_articles
 
 
+def apply_translations(
+    article: dict,
+    target_lang: str,
+    field_results: dict[str, tuple[str, bool]]
+) -> dict:
+    """
+    필드별 번역 결과를 기사에 반영한 사본을 반환합니다.
+    
+    Args:
+        article: 원본 기사
+        target_lang: 대상 언어 코드
+        field_results: {필드명: (번역된 텍스트, 캐시 적중 여부)}
+    
+    Returns:
+        translated_*/original_* 필드가 추가된 기사 사본
+    """
+    article_copy = {**article}
+    cached_fields = []
+    
+    for field in TRANSLATABLE_FIELDS:
+        if field not in field_results:
+            continue
+        translated, from_cache = field_results[field]
+        article_copy[f"translated_{field}"] = translated
+        article_copy[f"original_{field}"] = article.get(field, "")
+        if from_cache:
+            cached_fields.append(field)
+    
+    # 번역 언어 정보 추가
+    article_copy["translation_language"] = target_lang
+    # 번역 캐시에서 가져온 필드 (캐시 적중률 추적용)
+    article_copy["translation_cached_fields"] = cached_fields
+    return article_copy
+
+
 def get_supported_languages() -> dict:
     """
     지원하는 언어 목록을 반환합니다.
@@ -270,6 +600,7 @@ def detect_language(text: str) -> str:
 def translate_keyword_for_country(keyword: str, country: str) -> str:
     """
     검색 키워드를 해당 국가의 언어로 번역합니다.
+    번역 메모리(메모리 LRU → DB)를 먼저 조회하고, 없으면
     GPT를 우선 사용하고, 실패 시 Google Translator로 폴백합니다.
     
     Args:
@@ -282,6 +613,28 @@ def translate_keyword_for_country(keyword: str, country: str) -> str:
     if not keyword or not keyword.strip():
         return keyword
     
+    # 번역 메모리 조회
+    cached = get_keyword_translation(keyword, country)
+    if cached is not None:
+        logger.info(f"키워드 번역 메모리 적중: '{keyword}' → '{cached}' (국가: {country})")
+        return cached
+    
+    translated, provider = _translate_keyword(keyword, country)
+    
+    # 실제 번역에 성공한 경우만 저장 (실패 시 원본이 반환되므로 저장하지 않음)
+    if provider and translated:
+        save_keyword_translation(keyword, country, translated, provider)
+    
+    return translated
+
+
+def _translate_keyword(keyword: str, country: str) -> tuple[str, Optional[str]]:
+    """
+    키워드를 GPT → Google Translator 순으로 번역합니다. (번역 메모리 미사용)
+    
+    Returns:
+        (번역된 키워드, 사용한 번역기) - 번역하지 못하면 (원본, None)
+    """
     # 국가별 언어 매핑
     country_language_map = {
         "kr": "한국어",
@@ -297,27 +650,28 @@ def translate_keyword_for_country(keyword: str, country: str) -> str:
     
     target_language = country_language_map.get(country)
     if not target_language:
-        return keyword  # 매핑 없으면 원본 반환
+        return keyword, None  # 매핑 없으면 원본 반환
     
     # GPT로 번역 시도 (더 정확함)
     if gpt_client:
         try:
             logger.info(f"GPT로 키워드 번역 시도: '{keyword}' → {target_language}")
-            response = gpt_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"당신은 전문 번역가입니다. 주어진 검색 키워드를 {target_language}로 정확하게 번역하세요.\n\n중요 규칙:\n- {target_language}로만 번역하세요 (다른 언어나 OR 조건 사용 금지)\n- 일본어면 일본어로만, 영어면 영어로만, 중국어면 중국어로만\n- 전문 용어는 해당 언어의 표준 용어 사용\n- 번역된 키워드 하나만 반환하세요 (설명, 예시, OR 조건 없이)\n- 예: '비트코인' → 일본어면 'ビットコイン' (Bitcoin 아님, OR 없음)"
-                    },
-                    {
-                        "role": "user",
-                        "content": f"다음 검색 키워드를 {target_language}로만 번역하세요 (단일 키워드만 반환): {keyword}"
-                    }
-                ],
-                temperature=0.2,  # 더 일관된 결과를 위해 낮춤
-                max_tokens=30,  # 짧은 키워드만 반환
-            )
+            with provider_limiters["gpt"]:
+                response = gpt_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": f"당신은 전문 번역가입니다. 주어진 검색 키워드를 {target_language}로 정확하게 번역하세요.\n\n중요 규칙:\n- {target_language}로만 번역하세요 (다른 언어나 OR 조건 사용 금지)\n- 일본어면 일본어로만, 영어면 영어로만, 중국어면 중국어로만\n- 전문 용어는 해당 언어의 표준 용어 사용\n- 번역된 키워드 하나만 반환하세요 (설명, 예시, OR 조건 없이)\n- 예: '비트코인' → 일본어면 'ビットコイン' (Bitcoin 아님, OR 없음)"
+                        },
+                        {
+                            "role": "user",
+                            "content": f"다음 검색 키워드를 {target_language}로만 번역하세요 (단일 키워드만 반환): {keyword}"
+                        }
+                    ],
+                    temperature=0.2,  # 더 일관된 결과를 위해 낮춤
+                    max_tokens=30,  # 짧은 키워드만 반환
+                )
             
             translated = response.choices[0].message.content.strip()
             
@@ -331,7 +685,7 @@ def translate_keyword_for_country(keyword: str, country: str) -> str:
             translated = translated.strip('"').strip("'").strip()
             
             logger.info(f"GPT 키워드 번역 성공: '{keyword}' → '{translated}'")
-            return translated
+            return translated, "gpt"
             
         except Exception as e:
             logger.warning(f"GPT 키워드 번역 실패: {e}, Google Translator로 폴백")
@@ -353,7 +707,8 @@ def translate_keyword_for_country(keyword: str, country: str) -> str:
         
         target_lang_code = country_lang_map.get(country, "en")
         translator = GoogleTranslator(source='auto', target=target_lang_code)
-        translated = translator.translate(keyword)
+        with provider_limiters["google"]:
+            translated = translator.translate(keyword)
         
         # OR 조건 제거 (혹시 모를 경우 대비)
         if " OR " in translated.upper() or " 또는 " in translated or "|" in translated:
@@ -364,10 +719,10 @@ def translate_keyword_for_country(keyword: str, country: str) -> str:
         translated = translated.strip('"').strip("'").strip()
         
         logger.info(f"Google Translator 키워드 번역: '{keyword}' → '{translated}'")
-        return translated
+        return translated, "google"
         
     except Exception as e:
         logger.error(f"키워드 번역 실패: {e}")
-        return keyword  # 실패 시 원본 반환
+        return keyword, None  # 실패 시 원본 반환
 
 
@@ -0,0 +1,266 @@
+"""
+실시간 트렌드 키워드 집계
+
+search_news로 가져온 기사의 명사 빈도를 국가별 시간 버킷(기본 5분)에 누적하고,
+최근 구간(슬라이딩 윈도우)의 버킷을 합쳐 트렌드 키워드를 계산합니다.
+- 같은 기사(URL)는 보존 기간 동안 한 번만 집계
+- 보존 기간이 지난 버킷은 자동 삭제
+- 기사별 명사 빈도는 keyword_analyzer의 기사 명사 캐시를 재사용
+- 형태소 분석기가 한국어 전용이므로 한국어 원문 또는 한국어 번역이 있는 기사만 집계
+- 집계 대기열은 TRENDING_QUEUE_SIZE개로 제한 (넘치면 가장 오래된 요청을 버림)
+"""
+
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Optional
+from dotenv import load_dotenv
+
+from services.keyword_analyzer import get_article_noun_counts, top_keywords
+from services.morph_pool import MorphAnalyzerError
+from utils.cache import TTLCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TRENDING_BUCKET_SECONDS = int(os.getenv("TRENDING_BUCKET_SECONDS", "300"))  # 기본 5분
+TRENDING_RETENTION_SECONDS = int(os.getenv("TRENDING_RETENTION_SECONDS", str(24 * 3600)))  # 기본 24시간
+TRENDING_SEEN_ARTICLES = int(os.getenv("TRENDING_SEEN_ARTICLES", "20000"))  # 중복 집계 방지용 URL 기억 개수
+TRENDING_QUEUE_SIZE = int(os.getenv("TRENDING_QUEUE_SIZE", "32"))  # 집계 대기 중인 검색 결과 최대 개수
+
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def _analysis_fields(article: dict) -> Optional[dict]:
+    """형태소 분석용 기사 필드 (한국어 번역이 있으면 번역문 사용, 분석할 한국어가 없으면 None)"""
+    if article.get("translation_language") == "ko":
+        fields = {
+            "title": article.get("translated_title") or article.get("title"),
+            "description": article.get("translated_description") or article.get("description"),
+        }
+    else:
+        fields = {
+            "title": article.get("title"),
+            "description": article.get("description"),
+            "content": article.get("content"),
+        }
+    # 한국어 전용 추출기에 다른 언어를 넣으면 의미 없는 토큰만 나오므로 제외
+    if not any(value and _HANGUL_RE.search(value) for value in fields.values()):
+        return None
+    return fields
+
+
+class TrendingKeywords:
+    """국가별 시간 버킷 키워드 카운터
+
+    Args:
+        bucket_seconds: 버킷 크기 (초)
+        retention_seconds: 버킷 보존 기간 (초, 조회 가능한 최대 윈도우의 2배 이상 권장)
+        seen_articles: 중복 집계를 막기 위해 기억할 기사 URL 수
+        queue_size: 집계 대기열 크기 (가득 차면 가장 오래된 요청을 버림)
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = TRENDING_BUCKET_SECONDS,
+        retention_seconds: int = TRENDING_RETENTION_SECONDS,
+        seen_articles: int = TRENDING_SEEN_ARTICLES,
+        queue_size: int = TRENDING_QUEUE_SIZE,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        # 국가 → deque[(버킷 시작 시각, Counter)] (시간순)
+        self._buckets: dict[str, deque] = {}
+        self._seen = TTLCache(maxsize=seen_articles, ttl=retention_seconds)
+        self._lock = threading.Lock()
+        # 검색 응답을 막지 않도록 집계는 단일 백그라운드 스레드에서 순서대로 처리
+        # (명사 추출이 느려져도 메모리가 늘지 않도록 대기열 크기 제한)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._stats = {"ingested_articles": 0, "duplicate_articles": 0, "skipped_articles": 0, "failures": 0, "dropped_submissions": 0}
+
+    def _bucket_start(self, now: float) -> int:
+        return int(now // self.bucket_seconds) * self.bucket_seconds
+
+    def submit(self, country: str, articles: list[dict]):
+        """기사 집계를 백그라운드로 예약 (즉시 반환, 대기열이 가득 차면 가장 오래된 요청을 버림)"""
+        if not country or country == "all" or not articles:
+            return
+        self._ensure_worker()
+        item = (country, list(articles))
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            try:
+                # 트렌드는 최신 검색 결과가 더 중요하므로 오래된 요청부터 버림
+                self._queue.get_nowait()
+                self._queue.task_done()
+                with self._lock:
+                    self._stats["dropped_submissions"] += 1
+            except queue.Empty:
+                pass
+
+    def _ensure_worker(self):
+        """집계 스레드 시작 (처음 한 번)"""
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="trending", daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            country, articles = self._queue.get()
+            try:
+                self._ingest_safely(country, articles)
+            finally:
+                self._queue.task_done()
+
+    def _ingest_safely(self, country: str, articles: list[dict]):
+        try:
+            self.ingest(country, articles)
+        except MorphAnalyzerError as e:
+            self._stats["failures"] += 1
+            logger.warning(f"트렌드 집계 실패 ({country}, {e.kind}): {e}")
+        except Exception as e:
+            self._stats["failures"] += 1
+            logger.error(f"트렌드 집계 에러 ({country}): {type(e).__name__}: {e}")
+
+    def ingest(self, country: str, articles: list[dict], now: Optional[float] = None):
+        """
+        기사들의 명사 빈도를 현재 버킷에 누적
+
+        Args:
+            country: 국가 코드
+            articles: 검색된 기사 목록
+            now: 집계 시각 (기본: 현재)
+        """
+        now = time.time() if now is None else now
+
+        new_articles = {}
+        duplicates = skipped = 0
+        for article in articles:
+            seen_key = (country, article.get("url") or article.get("title"))
+            if seen_key[1] is None or seen_key in self._seen or seen_key in new_articles:
+                duplicates += 1
+                continue
+            fields = _analysis_fields(article)
+            if fields is None:
+                # 한국어로 분석할 수 없는 기사 (번역되지 않은 외국어 기사)
+                skipped += 1
+                continue
+            new_articles[seen_key] = fields
+
+        with self._lock:
+            self._stats["duplicate_articles"] += duplicates
+            self._stats["skipped_articles"] += skipped
+        if not new_articles:
+            return
+
+        counter = Counter()
+        for article_counts in get_article_noun_counts(list(new_articles.values())):
+            counter.update(article_counts)
+        # 분석에 성공한 기사만 집계 완료로 기록 (실패하면 다음 검색 때 다시 시도)
+        for seen_key in new_articles:
+            self._seen.set(seen_key, True)
+
+        bucket_start = self._bucket_start(now)
+        with self._lock:
+            buckets = self._buckets.setdefault(country, deque())
+            if buckets and buckets[-1][0] == bucket_start:
+                buckets[-1][1].update(counter)
+            else:
+                buckets.append((bucket_start, counter))
+            self._evict_locked(now)
+            self._stats["ingested_articles"] += len(new_articles)
+
+    def _evict_locked(self, now: float):
+        """보존 기간이 지난 버킷 삭제"""
+        cutoff = now - self.retention_seconds
+        for country in list(self._buckets):
+            buckets = self._buckets[country]
+            while buckets and buckets[0][0] + self.bucket_seconds <= cutoff:
+                buckets.popleft()
+            if not buckets:
+                del self._buckets[country]
+
+    def _window_counts_locked(self, countries: list[str], start: float, end: float) -> Counter:
+        counter = Counter()
+        for country in countries:
+            for bucket_start, bucket_counts in self._buckets.get(country, ()):
+                if start <= bucket_start < end:
+                    counter.update(bucket_counts)
+        return counter
+
+    def top(
+        self,
+        country: str = "all",
+        window_seconds: int = 3600,
+        top_n: int = 20,
+        now: Optional[float] = None
+    ) -> dict:
+        """
+        최근 윈도우의 트렌드 키워드
+
+        Args:
+            country: 국가 코드 (all이면 전체 국가 합산)
+            window_seconds: 집계 구간 (초, 버킷 단위로 올림)
+            top_n: 키워드 개수
+            now: 기준 시각 (기본: 현재)
+
+        Returns:
+            {"keywords": [{"word", "count", "previous", "change"}], "window_seconds", "bucket_seconds", ...}
+            previous는 바로 앞 같은 길이 구간의 빈도
+        """
+        now = time.time() if now is None else now
+        window_buckets = max(1, -(-window_seconds // self.bucket_seconds))
+        window = window_buckets * self.bucket_seconds
+        # 현재 버킷까지 포함하는 윈도우
+        end = self._bucket_start(now) + self.bucket_seconds
+        start = end - window
+
+        with self._lock:
+            self._evict_locked(now)
+            countries = list(self._buckets) if country == "all" else [country]
+            current = self._window_counts_locked(countries, start, end)
+            previous = self._window_counts_locked(countries, start - window, start)
+
+        keywords = top_keywords(current, top_n)
+        for keyword in keywords:
+            keyword["previous"] = previous.get(keyword["word"], 0)
+            keyword["change"] = keyword["count"] - keyword["previous"]
+
+        return {
+            "keywords": keywords,
+            "country": country,
+            "window_seconds": window,
+            "bucket_seconds": self.bucket_seconds,
+            "window_start": start,
+            "window_end": end,
+        }
+
+    def stats(self) -> dict:
+        """집계 통계 및 국가별 버킷 수"""
+        with self._lock:
+            buckets = {country: len(buckets) for country, buckets in self._buckets.items()}
+        return {
+            **self._stats,
+            "queued_submissions": self._queue.qsize(),
+            "buckets": buckets,
+            "seen_articles": len(self._seen),
+        }
+
+
+# 전역 트렌드 집계기 (api/news.py의 검색 결과로 갱신)
+trending_keywords = TrendingKeywords()
@@ -1,138 +1,249 @@
 """
 워드클라우드 이미지 생성 서비스
 KoNLPy로 추출한 키워드를 시각화
+
+WordCloud가 만든 이미지를 Pillow로 바로 PNG/WebP 바이트로 인코딩합니다.
+(matplotlib 전역 상태를 쓰지 않으므로 여러 스레드에서 동시에 생성해도 안전)
+렌더링 자체는 services.wordcloud_pool 워커 프로세스에서 실행되고,
+저장된 이미지의 정리는 services.wordcloud_store 백그라운드 작업이 맡습니다.
 """
 
 from wordcloud import WordCloud
-import matplotlib
-matplotlib.use('Agg')  # GUI 없이 이미지 생성
-import matplotlib.pyplot as plt
+import hashlib
+import io
+import json
 import os
-from datetime import datetime
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import logging
+from dotenv import load_dotenv
+from services.wordcloud_pool import wordcloud_pool
+from services.wordcloud_store import wordcloud_store, WORDCLOUD_DIR
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 이미지 형식별 (확장자, MIME 타입, Pillow 저장 옵션)
+IMAGE_FORMATS = {
+    "png": ("png", "image/png", {"format": "PNG", "compress_level": 6}),
+    "webp": ("webp", "image/webp", {"format": "WEBP", "quality": 85, "method": 4}),
+}
+WORDCLOUD_FORMAT = os.getenv("WORDCLOUD_FORMAT", "png")
+
+# 워드클라우드 스타일 (바꾸면 캐시 키가 달라져 새로 생성됨)
+WORDCLOUD_STYLE = {
+    "background_color": "white",
+    "max_words": 100,
+    "relative_scaling": 0.3,
+    "min_font_size": 10,
+    "colormap": "viridis",
+}
+
+# 같은 키를 생성 중인 요청은 먼저 시작한 요청의 결과를 기다림
+_in_flight: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+_stats = {"renders": 0, "cache_hits": 0, "coalesced": 0}
+
+
+@lru_cache(maxsize=1)
+def _find_font_path() -> str:
+    """한글 폰트 경로 (WORDCLOUD_FONT_PATH 환경 변수 우선, 없으면 OS별 기본 경로)"""
+    import platform
+    
+    if os.getenv("WORDCLOUD_FONT_PATH"):
+        font_path = os.getenv("WORDCLOUD_FONT_PATH")
+    elif platform.system() == 'Windows':
+        # Windows
+        font_path = "C:/Windows/Fonts/malgun.ttf"
+        if not os.path.exists(font_path):
+            font_path = "C:/Windows/Fonts/gulim.ttc"
+    else:
+        # Linux (Ubuntu)
+        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
+        if not os.path.exists(font_path):
+            font_path = "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf"
+    
+    # 최종 폰트 파일 확인
+    if not os.path.exists(font_path):
+        logger.error(f"폰트 파일을 찾을 수 없습니다: {font_path}")
+        raise FileNotFoundError(f"한글 폰트를 찾을 수 없습니다: {font_path}")
+    return font_path
+
+
+def make_wordcloud_key(
+    keywords: dict,
+    width: int,
+    height: int,
+    image_format: str = "png",
+    style: dict = WORDCLOUD_STYLE
+) -> str:
+    """워드클라우드 캐시 키 (빈도, 크기, 형식, 스타일의 해시)"""
+    raw = json.dumps(
+        {
+            "frequencies": sorted(keywords.items()),
+            "width": width,
+            "height": height,
+            "format": image_format,
+            "style": style,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
 
 def generate_wordcloud(
     keywords: dict[str, int],
-    output_dir: str = "static/wordcloud",
+    output_dir: str = WORDCLOUD_DIR,
     width: int = 600,
-    height: int = 400
+    height: int = 400,
+    image_format: str = WORDCLOUD_FORMAT
 ) -> str:
     """
     키워드 딕셔너리로부터 워드클라우드 이미지를 생성합니다.
+    파일명은 (빈도, 크기, 형식, 스타일)의 해시이므로 같은 입력이면 기존 이미지를 그대로 사용합니다.
     
     Args:
         keywords: {"단어": 빈도수} 형태의 딕셔너리
         output_dir: 이미지 저장 디렉토리
         width: 이미지 너비
         height: 이미지 높이
+        image_format: 이미지 형식 (png, webp)
     
     Returns:
-        생성된 이미지의 URL 경로 (예: "/static/wordcloud/wordcloud_20251212_123456.png")
+        생성된 이미지의 URL 경로 (예: "/api/wordcloud/wordcloud_<해시>.png")
     """
     if not keywords:
         logger.warning("키워드가 비어있습니다.")
         return ""
     
-    try:
-        # 한글 폰트 경로 설정 (OS별)
-        import platform
-        
-        if platform.system() == 'Windows':
-            # Windows
-            font_path = "C:/Windows/Fonts/malgun.ttf"
-            if not os.path.exists(font_path):
-                font_path = "C:/Windows/Fonts/gulim.ttc"
-        else:
-            # Linux (Ubuntu)
-            font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-            if not os.path.exists(font_path):
-                font_path = "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf"
-        
-        # 최종 폰트 파일 확인
-        if not os.path.exists(font_path):
-            logger.error(f"폰트 파일을 찾을 수 없습니다: {font_path}")
-            raise FileNotFoundError(f"한글 폰트를 찾을 수 없습니다: {font_path}")
-        
-        # 워드클라우드 생성
-        wc = WordCloud(
-            width=width,
-            height=height,
-            background_color='white',
-            font_path=font_path,
-            max_words=100,
-            relative_scaling=0.3,
-            min_font_size=10,
-            colormap='viridis'
-        ).generate_from_frequencies(keywords)
-        
-        # 출력 디렉토리 생성
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
-        # 파일명 생성 (타임스탬프 포함)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"wordcloud_{timestamp}.png"
-        filepath = os.path.join(output_dir, filename)
-        
-        # 이미지 저장
-        plt.figure(figsize=(width/100, height/100), dpi=100)
-        plt.imshow(wc, interpolation='bilinear')
-        plt.axis('off')
-        plt.tight_layout(pad=0)
-        plt.savefig(filepath, format='png', bbox_inches='tight', dpi=100)
-        plt.close()
-        
-        # URL 경로 반환
-        url_path = f"/api/wordcloud/{filename}"
-        logger.info(f"워드클라우드 생성 완료: {url_path}")
-        
-        return url_path
-        
-    except Exception as e:
-        logger.error(f"워드클라우드 생성 중 에러 발생: {e}")
-        raise
+    filename, _ = _ensure_wordcloud(keywords, output_dir, width, height, image_format)
+    return f"/api/wordcloud/{filename}"
 
 
-def cleanup_old_wordclouds(
-    output_dir: str = "static/wordcloud",
-    max_age_hours: int = 24
-) -> int:
+def get_wordcloud_image(
+    keywords: dict[str, int],
+    output_dir: str = WORDCLOUD_DIR,
+    width: int = 600,
+    height: int = 400,
+    image_format: str = WORDCLOUD_FORMAT
+) -> tuple[bytes, str, str]:
     """
-    오래된 워드클라우드 이미지를 삭제합니다.
+    워드클라우드 이미지 바이트 (응답 본문으로 바로 반환할 때 사용, 파일에도 저장됨)
     
-    Args:
-        output_dir: 이미지 디렉토리
-        max_age_hours: 보관 기간 (시간)
+    Returns:
+        (이미지 바이트, MIME 타입, URL 경로)
+    """
+    if not keywords:
+        raise ValueError("키워드가 비어있습니다.")
+    
+    filename, image_bytes = _ensure_wordcloud(keywords, output_dir, width, height, image_format)
+    if image_bytes is None:
+        image_bytes = Path(output_dir, filename).read_bytes()
+    return image_bytes, IMAGE_FORMATS[image_format][1], f"/api/wordcloud/{filename}"
+
+
+def _ensure_wordcloud(
+    keywords: dict,
+    output_dir: str,
+    width: int,
+    height: int,
+    image_format: str
+) -> tuple[str, Optional[bytes]]:
+    """
+    캐시된 이미지가 없으면 생성해 저장 (같은 키를 동시에 생성하지 않음)
     
     Returns:
-        삭제된 파일 개수
+        (파일명, 이번에 생성했으면 이미지 바이트 / 캐시 적중이면 None)
     """
-    if not os.path.exists(output_dir):
-        return 0
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식: {image_format}")
     
-    now = datetime.now()
-    deleted_count = 0
+    key = make_wordcloud_key(keywords, width, height, image_format)
+    filename = f"wordcloud_{key}.{IMAGE_FORMATS[image_format][0]}"
+    filepath = os.path.join(output_dir, filename)
     
-    try:
-        for filename in os.listdir(output_dir):
-            if not filename.startswith('wordcloud_') or not filename.endswith('.png'):
-                continue
-            
-            filepath = os.path.join(output_dir, filename)
-            file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-            age_hours = (now - file_time).total_seconds() / 3600
-            
-            if age_hours > max_age_hours:
-                os.remove(filepath)
-                deleted_count += 1
-                logger.info(f"오래된 워드클라우드 삭제: {filename}")
-        
-        return deleted_count
+    with _in_flight_lock:
+        if os.path.exists(filepath):
+            _stats["cache_hits"] += 1
+            wordcloud_store.touch(filepath)
+            logger.info(f"워드클라우드 캐시 사용: {filename}")
+            return filename, None
         
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _in_flight[key] = future
+        else:
+            _stats["coalesced"] += 1
+    
+    if not leader:
+        # 같은 이미지를 생성 중인 요청을 기다림 (실패하면 같은 예외)
+        return filename, future.result()
+    
+    try:
+        image_bytes = wordcloud_pool.render(keywords, width, height, image_format)
+        _write_atomic(filepath, image_bytes)
+        wordcloud_store.add(filepath, len(image_bytes))
+        _stats["renders"] += 1
+        logger.info(f"워드클라우드 생성 완료: {filename} ({len(image_bytes)} bytes)")
+        future.set_result(image_bytes)
+        return filename, image_bytes
     except Exception as e:
-        logger.error(f"워드클라우드 정리 중 에러 발생: {e}")
-        return deleted_count
+        logger.error(f"워드클라우드 생성 중 에러 발생: {e}")
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+
+
+def render_wordcloud(
+    keywords: dict,
+    width: int = 600,
+    height: int = 400,
+    image_format: str = "png",
+    font_path: Optional[str] = None
+) -> bytes:
+    """
+    워드클라우드 레이아웃 계산 후 이미지 바이트로 인코딩 (디스크 I/O 없음)
+    서버에서는 wordcloud_pool 워커 프로세스 안에서 호출됩니다.
+    """
+    wc = WordCloud(
+        width=width,
+        height=height,
+        font_path=font_path or _find_font_path(),
+        **WORDCLOUD_STYLE
+    ).generate_from_frequencies(keywords)
+    
+    buffer = io.BytesIO()
+    wc.to_image().save(buffer, **IMAGE_FORMATS[image_format][2])
+    return buffer.getvalue()
+
+
+def _write_atomic(filepath: str, data: bytes):
+    """임시 파일에 쓴 뒤 교체 (완성되기 전의 파일이 서빙되지 않도록)"""
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
+def get_wordcloud_stats() -> dict:
+    """워드클라우드 생성/캐시 적중/요청 병합/워커 풀/저장소 통계"""
+    return {
+        **_stats,
+        "in_flight": len(_in_flight),
+        "pool": wordcloud_pool.stats(),
+        "store": wordcloud_store.stats(),
+    }
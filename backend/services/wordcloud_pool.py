@@ -0,0 +1,248 @@
+"""
+워드클라우드 렌더링 워커 프로세스 풀
+
+WordCloud 레이아웃 계산은 순수 Python/numpy CPU 작업이라 웹 서버 프로세스의
+스레드에서 돌리면 GIL을 잡고 있는 동안 다른 API 응답까지 느려집니다.
+그래서 렌더링은 별도 워커 프로세스에서 실행합니다.
+
+- 워커는 기동 시 한 번만 한글 폰트를 찾아 불러오고 작은 이미지로 워밍업
+- 대기 중/실행 중인 작업이 WORDCLOUD_MAX_PENDING개를 넘으면 바로 거절 (busy)
+- 호출마다 WORDCLOUD_RENDER_TIMEOUT초까지만 기다림 (timeout, 실행 중인 작업이면 풀을 새로 만들어 워커 정리)
+- 워커가 죽으면 풀을 새로 만들고 해당 요청은 실패 처리 (crash)
+- WORDCLOUD_WORKERS=0이면 워커 없이 호출한 스레드에서 렌더링
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+WORDCLOUD_WORKERS = int(os.getenv("WORDCLOUD_WORKERS", str(min(2, os.cpu_count() or 1))))
+WORDCLOUD_MAX_PENDING = int(os.getenv("WORDCLOUD_MAX_PENDING", "8"))  # 대기+실행 중 작업 상한
+WORDCLOUD_RENDER_TIMEOUT = float(os.getenv("WORDCLOUD_RENDER_TIMEOUT", "30"))  # 호출당 제한 시간 (초)
+
+# 스레드가 떠 있는 서버 프로세스에서 fork하지 않도록 항상 spawn으로 워커 생성
+_mp_context = multiprocessing.get_context("spawn")
+
+# 워커 프로세스에서 기동 시 한 번 정해지는 폰트 경로
+_worker_font_path: Optional[str] = None
+
+
+class WordcloudRenderError(Exception):
+    """워드클라우드 렌더링 실패
+
+    kind:
+        busy: 대기 중인 작업이 너무 많음
+        timeout: 제한 시간 안에 끝나지 않음
+        crash: 워커 프로세스 비정상 종료 (풀 재생성됨)
+        error: 렌더링 중 예외
+    """
+
+    def __init__(self, message: str, kind: str = "error"):
+        super().__init__(message)
+        self.kind = kind
+
+
+def _worker_init(font_path: str):
+    """워커 프로세스 초기화 (폰트를 한 번 불러오고 렌더링 경로 워밍업)"""
+    global _worker_font_path
+    # Ctrl+C는 부모 프로세스가 처리하고 워커는 풀 종료로 정리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from PIL import ImageFont
+    from services.wordcloud_generator import render_wordcloud
+
+    ImageFont.truetype(font_path, 10)
+    _worker_font_path = font_path
+    try:
+        render_wordcloud({"워밍업": 1}, width=64, height=64, font_path=font_path)
+    except Exception as e:
+        # 워밍업 실패는 실제 요청에서 다시 드러나므로 워커는 그대로 둠
+        logger.warning(f"워드클라우드 워커 워밍업 실패: {type(e).__name__}: {e}")
+
+
+def _render_job(keywords: dict, width: int, height: int, image_format: str) -> bytes:
+    """워커 프로세스에서 실행되는 렌더링 작업"""
+    from services.wordcloud_generator import render_wordcloud
+    return render_wordcloud(keywords, width, height, image_format, font_path=_worker_font_path)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class WordcloudRenderPool:
+    """워드클라우드 렌더링 프로세스 풀 (스레드 안전, 동기 API)
+
+    async 코드에서는 run_in_threadpool/asyncio.to_thread로 호출합니다.
+
+    Args:
+        size: 워커 프로세스 수 (0이면 호출한 스레드에서 렌더링)
+        max_pending: 대기+실행 중 작업 상한
+        timeout: 호출당 제한 시간 (초)
+    """
+
+    def __init__(
+        self,
+        size: int = WORDCLOUD_WORKERS,
+        max_pending: int = WORDCLOUD_MAX_PENDING,
+        timeout: float = WORDCLOUD_RENDER_TIMEOUT,
+    ):
+        self.size = max(0, size)
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {"renders": 0, "rejected": 0, "timeouts": 0, "crashes": 0, "restarts": 0, "errors": 0}
+
+    def start(self):
+        """워커 프로세스 기동 (워커들이 미리 폰트를 불러오도록)"""
+        if self.size == 0:
+            return
+        try:
+            with self._lock:
+                executor = self._get_executor()
+        except FileNotFoundError as e:
+            logger.error(f"워드클라우드 워커 풀 기동 실패: {e}")
+            return
+        # 빈 작업을 보내 워커 프로세스를 띄움
+        for future in [executor.submit(_ping) for _ in range(self.size)]:
+            try:
+                future.result(timeout=self.timeout)
+            except Exception as e:
+                logger.warning(f"워드클라우드 워커 기동 실패: {type(e).__name__}: {e}")
+                return
+        logger.info(f"워드클라우드 워커 풀 준비: {self.size}개")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """실행기 (없으면 생성, _lock 안에서 호출)"""
+        if self._executor is None:
+            from services.wordcloud_generator import _find_font_path
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.size,
+                mp_context=_mp_context,
+                initializer=_worker_init,
+                initargs=(_find_font_path(),),
+            )
+        return self._executor
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+
+    def _releaser(self):
+        """작업 하나의 대기 슬롯을 한 번만 반납하는 함수 (시간 초과 처리와 완료 콜백이 겹쳐도 한 번)"""
+        released = False
+
+        def release(_future=None):
+            nonlocal released
+            with self._lock:
+                if released:
+                    return
+                released = True
+                self._pending -= 1
+        return release
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def render(self, keywords: dict, width: int, height: int, image_format: str) -> bytes:
+        """워드클라우드 이미지 바이트 렌더링"""
+        if self.size == 0:
+            from services.wordcloud_generator import render_wordcloud
+            image_bytes = render_wordcloud(keywords, width, height, image_format)
+            self._count("renders")
+            return image_bytes
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise WordcloudRenderError(
+                    f"워드클라우드 생성 대기 작업이 너무 많습니다 ({self._pending}개)", "busy"
+                )
+            executor = self._get_executor()
+            self._pending += 1
+
+        try:
+            future = executor.submit(_render_job, keywords, width, height, image_format)
+        except BrokenProcessPool as e:
+            self._release()
+            self._count("crashes")
+            self._restart(executor)
+            raise WordcloudRenderError(f"워드클라우드 워커 비정상 종료: {e}", "crash")
+        except Exception:
+            self._release()
+            raise
+        release = self._releaser()
+        future.add_done_callback(release)
+
+        try:
+            image_bytes = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            self._count("timeouts")
+            if not future.cancel():
+                # 이미 실행 중인 작업은 취소되지 않으므로 워커를 정리하고 풀을 새로 만듦
+                # (멈춘 레이아웃 계산이 워커와 대기 슬롯을 계속 잡고 있지 않도록)
+                release()
+                self._restart(executor, terminate=True)
+            raise WordcloudRenderError(f"워드클라우드 생성 시간 초과 ({self.timeout:.0f}초)", "timeout")
+        except BrokenProcessPool as e:
+            self._count("crashes")
+            self._restart(executor)
+            raise WordcloudRenderError(f"워드클라우드 워커 비정상 종료: {e}", "crash")
+        except Exception as e:
+            self._count("errors")
+            raise WordcloudRenderError(f"{type(e).__name__}: {e}", "error")
+
+        self._count("renders")
+        return image_bytes
+
+    def _restart(self, broken: ProcessPoolExecutor, terminate: bool = False):
+        """깨진 실행기를 버림 (다음 호출에서 새로 생성)
+
+        Args:
+            terminate: 워커 프로세스를 강제 종료 (시간 초과로 멈춘 작업이 있을 때)
+        """
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = None
+            self._stats["restarts"] += 1
+        logger.warning("워드클라우드 워커 풀 재생성" + (" (시간 초과 워커 종료)" if terminate else ""))
+        # 강제 종료 전에 워커 목록을 잡아둠 (shutdown이 목록을 비움)
+        processes = list((getattr(broken, "_processes", None) or {}).values()) if terminate else []
+        broken.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def close(self):
+        """워커 프로세스 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "workers": self.size,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "started": self._executor is not None,
+            }
+
+
+# 싱글톤 인스턴스
+wordcloud_pool = WordcloudRenderPool()
@@ -0,0 +1,268 @@
+"""
+워드클라우드 이미지 저장소 (메모리 LRU 인덱스 + 백그라운드 정리)
+
+요청마다 디렉토리 전체를 os.listdir/getmtime으로 훑지 않도록
+생성된 이미지의 (크기, 마지막 접근 시각)을 메모리에 LRU 순서로 기록하고,
+백그라운드 작업이 주기적으로 다음 기준에 따라 오래 안 쓴 이미지부터 삭제합니다.
+- 마지막 접근 후 WORDCLOUD_MAX_AGE_HOURS 경과
+- 파일 수 WORDCLOUD_MAX_FILES 초과
+- 전체 크기 WORDCLOUD_MAX_MB 초과
+
+디렉토리 스캔은 시작 시 한 번만 하며, 요청 경로에서는 인덱스만 갱신합니다.
+접근 시 파일 수정 시각도 갱신하므로 여러 서버 프로세스가 같은 디렉토리를 써도
+삭제 직전에 수정 시각을 확인해 다른 프로세스가 쓰고 있는 이미지는 남깁니다.
+(메모리 캐시에서 서빙할 때는 수정 시각을 정리 주기마다 한 번만 갱신)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+
+from utils.static_cache import StaticAssetCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+WORDCLOUD_DIR = os.getenv("WORDCLOUD_DIR", "static/wordcloud")
+WORDCLOUD_MAX_AGE_HOURS = float(os.getenv("WORDCLOUD_MAX_AGE_HOURS", "24"))
+WORDCLOUD_MAX_FILES = int(os.getenv("WORDCLOUD_MAX_FILES", "10000"))
+WORDCLOUD_MAX_MB = float(os.getenv("WORDCLOUD_MAX_MB", "512"))
+WORDCLOUD_JANITOR_SECONDS = float(os.getenv("WORDCLOUD_JANITOR_SECONDS", "300"))  # 정리 주기 (초)
+WORDCLOUD_HOT_CACHE_MB = float(os.getenv("WORDCLOUD_HOT_CACHE_MB", "32"))  # 서빙용 메모리 캐시 크기
+
+# 이미지 서빙 응답용 메모리 캐시 (자주 보는 이미지는 디스크를 읽지 않음)
+wordcloud_asset_cache = StaticAssetCache(max_bytes=int(WORDCLOUD_HOT_CACHE_MB * 1024 * 1024))
+
+# 정리 대상 파일 (생성기가 만드는 파일명 형식)
+_PREFIX = "wordcloud_"
+_SUFFIXES = (".png", ".webp")
+
+
+class WordcloudStore:
+    """워드클라우드 이미지 LRU 인덱스와 백그라운드 정리 작업
+
+    Args:
+        directory: 이미지 디렉토리
+        max_age_hours: 마지막 접근 후 보관 기간 (시간)
+        max_files: 최대 파일 수
+        max_bytes: 최대 전체 크기 (바이트)
+        interval: 정리 주기 (초)
+    """
+
+    def __init__(
+        self,
+        directory: str = WORDCLOUD_DIR,
+        max_age_hours: float = WORDCLOUD_MAX_AGE_HOURS,
+        max_files: int = WORDCLOUD_MAX_FILES,
+        max_bytes: int = int(WORDCLOUD_MAX_MB * 1024 * 1024),
+        interval: float = WORDCLOUD_JANITOR_SECONDS,
+    ):
+        self.directory = os.path.abspath(directory)
+        self.max_age = max_age_hours * 3600
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.interval = interval
+        # 절대 경로 → (크기, 마지막 접근 시각), 오래 안 쓴 순서
+        self._index: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._task: Optional[asyncio.Task] = None
+        # 경로 → 마지막으로 파일 수정 시각을 갱신한 시각 (메모리 캐시 서빙 시 갱신 빈도 제한용)
+        self._mtime_updated: dict[str, float] = {}
+        self._stats = {"sweeps": 0, "expired": 0, "evicted": 0, "kept_by_other_process": 0, "last_sweep": None}
+
+    # ----- 요청 경로 (디렉토리 스캔 없음) -----
+
+    def add(self, filepath: str, size: int, accessed: Optional[float] = None):
+        """새로 저장한 이미지 기록 (가장 최근 사용으로)"""
+        key = os.path.abspath(filepath)
+        accessed = time.time() if accessed is None else accessed
+        with self._lock:
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[0]
+            self._index[key] = (size, accessed)
+            self._total_bytes += size
+        # 같은 이름으로 다시 저장됐을 수 있으므로 서빙용 메모리 캐시는 비움
+        wordcloud_asset_cache.invalidate(key)
+
+    def touch(self, filepath: str, update_mtime: bool = True):
+        """이미지 접근 기록 (LRU 순서와 파일 수정 시각 갱신)
+
+        Args:
+            update_mtime: False면 파일 수정 시각은 정리 주기마다 한 번만 갱신
+                (메모리 캐시에서 서빙할 때 디스크 I/O를 줄이면서도
+                다른 프로세스의 정리 작업이 사용 중인 이미지를 지우지 않도록)
+        """
+        key = os.path.abspath(filepath)
+        now = time.time()
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None:
+                self._index[key] = (entry[0], now)
+                self._index.move_to_end(key)
+            if not update_mtime and entry is not None \
+                    and now - self._mtime_updated.get(key, 0.0) < self.interval:
+                return
+            self._mtime_updated[key] = now
+        try:
+            os.utime(key, (now, now))
+        except OSError:
+            return
+        if entry is None:
+            # 시작 시 스캔 이후 다른 프로세스가 만든 이미지
+            try:
+                self.add(key, os.path.getsize(key), now)
+            except OSError:
+                pass
+
+    # ----- 백그라운드 정리 -----
+
+    def load(self):
+        """디렉토리를 한 번 스캔해 기존 이미지를 인덱스에 추가 (시작 시 1회)"""
+        if self._loaded:
+            return
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.startswith(_PREFIX) and entry.name.endswith(_SUFFIXES):
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            # 스캔하는 동안 요청 경로에서 기록된 항목이 더 최신이므로 그 앞에 배치
+            recorded = self._index
+            self._index = OrderedDict()
+            self._total_bytes = 0
+            for path, size, mtime in sorted(entries, key=lambda e: e[2]):
+                if path not in recorded:
+                    self._index[path] = (size, mtime)
+                    self._total_bytes += size
+            for path, entry in recorded.items():
+                self._index[path] = entry
+                self._total_bytes += entry[0]
+            self._loaded = True
+        logger.info(f"워드클라우드 인덱스 로드: {len(self._index)}개, {self._total_bytes / 1024 / 1024:.1f}MB")
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """보관 기간/파일 수/전체 크기 기준으로 오래 안 쓴 이미지 삭제
+
+        Returns:
+            삭제된 파일 개수
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = []
+            for path, (_, accessed) in self._index.items():
+                if now - accessed <= self.max_age:
+                    break
+                expired.append(path)
+
+            over = []
+            count = len(self._index) - len(expired)
+            total = self._total_bytes - sum(self._index[path][0] for path in expired)
+            for path, (size, _) in list(self._index.items())[len(expired):]:
+                if count <= self.max_files and total <= self.max_bytes:
+                    break
+                over.append(path)
+                count -= 1
+                total -= size
+
+        deleted = 0
+        for path, kind in [(p, "expired") for p in expired] + [(p, "evicted") for p in over]:
+            if self._remove_if_unused(path):
+                deleted += 1
+                self._stats[kind] += 1
+
+        self._stats["sweeps"] += 1
+        self._stats["last_sweep"] = now
+        if deleted:
+            logger.info(f"워드클라우드 정리: {deleted}개 삭제, 남은 {len(self._index)}개")
+        return deleted
+
+    def _remove_if_unused(self, path: str) -> bool:
+        """인덱스 기록 이후 접근되지 않았으면 파일 삭제"""
+        with self._lock:
+            entry = self._index.get(path)
+        if entry is None:
+            return False
+        try:
+            mtime = os.path.getmtime(path)
+            if mtime > entry[1] + 1:
+                # 다른 프로세스가 그 사이에 사용함 → 최근 사용으로 갱신하고 유지
+                self._stats["kept_by_other_process"] += 1
+                self.add(path, entry[0], mtime)
+                return False
+            os.remove(path)
+            wordcloud_asset_cache.invalidate(path)
+            removed = True
+        except FileNotFoundError:
+            removed = False
+        except OSError as e:
+            logger.warning(f"워드클라우드 삭제 실패: {path}: {e}")
+            return False
+
+        with self._lock:
+            # 확인하는 사이에 다시 기록됐으면 (재생성 등) 인덱스는 유지
+            if self._index.get(path) == entry:
+                del self._index[path]
+                self._mtime_updated.pop(path, None)
+                self._total_bytes -= entry[0]
+        return removed
+
+    def start(self):
+        """백그라운드 정리 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"워드클라우드 정리 작업 시작: 주기 {self.interval:.0f}초, "
+            f"보관 {self.max_age / 3600:.0f}시간, 최대 {self.max_files}개/{self.max_bytes / 1024 / 1024:.0f}MB"
+        )
+
+    async def stop(self):
+        """백그라운드 정리 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        await asyncio.to_thread(self.load)
+        while True:
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.warning(f"워드클라우드 정리 실패: {type(e).__name__}: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            files, total_bytes = len(self._index), self._total_bytes
+        return {
+            **self._stats,
+            "files": files,
+            "bytes": total_bytes,
+            "max_files": self.max_files,
+            "max_bytes": self.max_bytes,
+            "loaded": self._loaded,
+            "hot_cache": wordcloud_asset_cache.stats(),
+        }
+
+
+# 싱글톤 인스턴스
+wordcloud_store = WordcloudStore()
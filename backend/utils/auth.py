@@ -1,18 +1,27 @@
 """
 인증 관련 유틸리티 (JWT, 비밀번호 해싱)
 """
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import asyncio
+import hashlib
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
-from database import get_db
+from database import get_async_db
 from models.user_models import User
+from utils.cache import TTLCache
 
 load_dotenv()
 
@@ -21,28 +30,120 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7일
 
+# 인증 사용자 캐시 (요청마다 사용자 조회 쿼리를 보내지 않도록)
+# - 토큰 캐시: 토큰 해시 → 사용자 ID (토큰 만료 시각까지)
+# - 사용자 캐시: 사용자 ID → CurrentUser (사용자 수정/삭제 시 무효화, 다른 서버 프로세스의 변경은 TTL까지 반영 지연)
+#   ORM 이벤트는 update(User)/delete(User) 같은 일괄 쿼리에서는 발생하지 않으므로
+#   일괄 쿼리로 사용자를 수정/삭제하면 invalidate_user를 직접 호출해야 함
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"))
+AUTH_USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", "60"))  # 초
+
+token_cache = TTLCache(maxsize=AUTH_TOKEN_CACHE_SIZE, ttl=None)
+user_cache = TTLCache(maxsize=AUTH_USER_CACHE_SIZE, ttl=AUTH_USER_CACHE_TTL)
+
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """인증된 사용자 (읽기 전용, 세션에 속하지 않음)
+
+    캐시에서 꺼낸 값이므로 ORM 객체처럼 세션에 추가하거나 관계를 읽을 수 없습니다.
+    사용자를 수정하려면 id로 db에서 User를 다시 조회하세요. (비밀번호 해시는 메모리에 두지 않음)
+    """
+    id: int
+    email: str
+    username: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
 # 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt 비용(rounds)이 설정과 다른 기존 해시는 로그인 성공 시 새 비용으로 다시 해싱
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+# bcrypt는 호출당 수백 ms CPU를 쓰므로 이벤트 루프 밖 전용 스레드 풀에서 실행
+# (bcrypt는 해싱 중 GIL을 놓으므로 스레드 수만큼 병렬 처리)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))  # 대기+실행 중 작업 상한
+
+_password_executor = ThreadPoolExecutor(max_workers=max(1, PASSWORD_HASH_WORKERS), thread_name_prefix="password-hash")
+_password_slots = threading.BoundedSemaphore(max(1, PASSWORD_HASH_MAX_PENDING))
+
+
+class PasswordHashBusy(Exception):
+    """비밀번호 해싱 대기 작업이 너무 많음"""
 
 # OAuth2 스키마
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+def _truncate_password(password: str) -> str:
+    """bcrypt는 72바이트를 초과하면 예외가 발생하므로 UTF-8 바이트 기준으로 안전하게 자름"""
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > 72:
+        password_bytes = password_bytes[:72]
+        # 잘린 바이트를 다시 문자열로 변환 (깨지는 문자는 무시)
+        password = password_bytes.decode("utf-8", errors="ignore")
+    return password
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context.verify(_truncate_password(plain_password), hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
-    # bcrypt는 72바이트를 초과하면 예외가 발생하므로
-    # UTF-8 바이트 기준으로 안전하게 잘라서 처리
-    password_bytes = password.encode("utf-8")
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-        # 잘린 바이트를 다시 문자열로 변환 (깨지는 문자는 무시)
-        password = password_bytes.decode("utf-8", errors="ignore")
-    return pwd_context.hash(password)
+    return pwd_context.hash(_truncate_password(password))
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 설정이 바뀐 해시면 새 해시 생성
+
+    Returns:
+        (일치 여부, 다시 해싱한 값 또는 None)
+    """
+    return pwd_context.verify_and_update(_truncate_password(plain_password), hashed_password)
+
+
+async def _run_password_task(fn, *args):
+    """비밀번호 해싱 전용 스레드 풀에서 실행 (대기 작업이 상한을 넘으면 PasswordHashBusy)"""
+    if not _password_slots.acquire(blocking=False):
+        raise PasswordHashBusy(f"비밀번호 처리 대기 작업이 너무 많습니다 (최대 {PASSWORD_HASH_MAX_PENDING}개)")
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, fn, *args)
+    finally:
+        _password_slots.release()
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (이벤트 루프를 막지 않음)"""
+    return await _run_password_task(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 재해싱 (이벤트 루프를 막지 않음)"""
+    return await _run_password_task(verify_and_update_password, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -67,32 +168,109 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+def _token_key(token: str) -> str:
+    """토큰 캐시 키 (원문 토큰은 메모리에 두지 않음)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_token_user_id(token: str) -> Optional[int]:
+    """검증된 토큰의 사용자 ID (검증 결과는 토큰 만료 시각까지 캐시)"""
+    key = _token_key(token)
+    user_id = token_cache.get(key)
+    if user_id is not None:
+        return user_id
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    # user_id를 정수로 변환 (JWT에서 문자열로 올 수 있음)
+    try:
+        user_id = int(payload.get("sub"))
+    except (ValueError, TypeError):
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = float(exp) - time.time()
+        if remaining <= 0:
+            return None
+        token_cache.set(key, user_id, ttl=remaining)
+    return user_id
+
+
+async def get_cached_user(db: AsyncSession, user_id: int) -> Optional[CurrentUser]:
+    """사용자 조회 (캐시에 있으면 DB 조회 없이 반환)"""
+    current_user = user_cache.get(user_id)
+    if current_user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalars().first()
+        if user is None:
+            return None
+        current_user = CurrentUser.from_user(user)
+        user_cache.set(user_id, current_user)
+    return current_user
+
+
+def invalidate_user(user_id: int):
+    """사용자 캐시 항목 삭제
+
+    ORM 객체를 수정/삭제하면 매퍼 이벤트로 자동 호출되지만,
+    update(User)/delete(User) 일괄 쿼리는 이벤트가 발생하지 않으므로 커밋 후 직접 호출해야 합니다.
+    """
+    user_cache.delete(user_id)
+
+
+def get_auth_cache_stats() -> dict:
+    """인증 캐시 통계"""
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_on_change(mapper, connection, target):
+    """사용자가 수정/삭제되면 캐시 삭제 (커밋 후에도 한 번 더 삭제)
+
+    일괄 update()/delete() 쿼리에서는 호출되지 않음 (invalidate_user 직접 호출 필요)
+    """
+    invalidate_user(target.id)
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("invalidated_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users_after_commit(session):
+    """플러시와 커밋 사이에 이전 값이 다시 캐시됐을 수 있으므로 커밋 후 다시 삭제"""
+    for user_id in session.info.pop("invalidated_user_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_invalidated_users(session):
+    session.info.pop("invalidated_user_ids", None)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 로그인한 사용자 가져오기"""
+    db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
+    """현재 로그인한 사용자 가져오기
+
+    토큰 검증 결과와 사용자 정보를 캐시하므로 ORM 객체가 아닌 읽기 전용 CurrentUser를 반환합니다.
+    (수정하려면 id로 db에서 User를 다시 조회)
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    
-    user_id = payload.get("sub")
+    user_id = get_token_user_id(token)
     if user_id is None:
         raise credentials_exception
     
-    # user_id를 정수로 변환 (JWT에서 문자열로 올 수 있음)
-    try:
-        user_id = int(user_id)
-    except (ValueError, TypeError):
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await get_cached_user(db, user_id)
     if user is None:
         raise credentials_exception
     
@@ -0,0 +1,363 @@
+"""
+캐시 유틸리티
+
+- TTLCache: TTL 만료 + LRU 제거를 지원하는 스레드 안전 메모리 캐시
+- SQLiteCache: 프로세스 재시작 후에도 유지되는 SQLite 파일 캐시 (TTL + LRU)
+- TieredDBCache: TTLCache를 SQLAlchemy 테이블 앞에 둔 2단계 캐시
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """TTL + LRU 메모리 캐시
+
+    Args:
+        maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        ttl: 기본 만료 시간 (초, None이면 만료 없음)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default: Any = None) -> Any:
+        """값 조회 (만료된 항목은 제거 후 miss 처리)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> bool:
+        """항목 삭제 (삭제 여부 반환)"""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> int:
+        """전체 삭제 (삭제된 항목 수 반환)"""
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            return count
+
+    def items(self) -> list[tuple]:
+        """만료되지 않은 (key, value) 목록 (최근 사용 순)"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (expires_at, value) in reversed(self._data.items())
+                if expires_at is None or expires_at > now
+            ]
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def __contains__(self, key) -> bool:
+        """만료되지 않은 항목 존재 여부 (통계/LRU 순서에 영향 없음)"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[0] is None or entry[0] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """SQLite 파일 기반 TTL + LRU 캐시 (값은 JSON으로 저장)
+
+    Args:
+        path: SQLite 파일 경로
+        table: 테이블 이름
+        max_entries: 최대 항목 수 (초과 시 마지막 접근 시각이 오래된 항목부터 제거)
+    """
+
+    # 매 쓰기마다 개수를 세지 않고 N번마다 한 번씩 LRU 정리
+    EVICT_EVERY = 50
+
+    def __init__(self, path: str, table: str = "cache", max_entries: int = 10000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_accessed ON {table} (accessed_at)")
+
+    def get_entry(self, key: str) -> Optional[tuple[Any, Optional[float]]]:
+        """(값, 남은 TTL 초) 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+
+        remaining = expires_at - now if expires_at is not None else None
+        return json.loads(value), remaining
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """값 조회"""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl None이면 만료 없음)"""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        payload = json.dumps(value, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict_locked(now)
+
+    def _evict_locked(self, now: float):
+        """만료 항목 및 max_entries 초과분 제거 (lock 보유 상태에서 호출)"""
+        self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def delete(self, key: str) -> bool:
+        """항목 삭제"""
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            return cursor.rowcount > 0
+
+    def clear(self) -> int:
+        """전체 삭제 (삭제된 항목 수 반환)"""
+        with self._lock:
+            return self._conn.execute(f"DELETE FROM {self.table}").rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class TieredDBCache:
+    """메모리(TTLCache) → DB(SQLAlchemy 테이블) 2단계 캐시
+
+    테이블 모델은 cache_key(고유), expires_at 컬럼과 값 컬럼(value_column)을 가져야 합니다.
+    호출하는 쪽이 번역기/요약기 워커 스레드의 동기 코드이므로 동기 세션을 사용합니다
+    (async 라우터에서는 run_in_threadpool로 호출).
+    DB 오류는 조회/저장에서는 경고만 남기고 캐시 미스로 처리하며, 삭제에서는 그대로 올립니다.
+
+    Args:
+        name: 로그에 쓰는 캐시 이름
+        model: SQLAlchemy 모델
+        value_column: 캐시 값을 담는 컬럼 이름
+        session_factory: DB 세션 생성 함수 (SessionLocal)
+        maxsize: 메모리 계층 최대 항목 수
+        ttl: 만료 시간 (초, 메모리와 DB 공통)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model,
+        value_column: str,
+        session_factory: Callable,
+        maxsize: int,
+        ttl: float,
+    ):
+        self.name = name
+        self.model = model
+        self.value_column = value_column
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        # DB 계층 통계 (메모리 계층 통계는 TTLCache가 집계)
+        self._db_stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (메모리 → DB 순, DB 적중 시 메모리로 승격)"""
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        db = self.session_factory()
+        try:
+            entry = db.query(self.model)\
+                .filter(self.model.cache_key == key)\
+                .first()
+            if entry is None or (entry.expires_at is not None and entry.expires_at <= datetime.utcnow()):
+                self._db_stats["misses"] += 1
+                return None
+
+            self._db_stats["hits"] += 1
+            value = getattr(entry, self.value_column)
+            self.memory.set(key, value, ttl=self._remaining_ttl(entry.expires_at))
+            return value
+        except Exception as e:
+            logger.warning(f"{self.name} 조회 실패: {e}")
+            return None
+        finally:
+            db.close()
+
+    def prefetch(self, keys) -> int:
+        """여러 키를 한 번의 DB 쿼리로 메모리에 적재
+
+        Returns:
+            메모리로 적재된 항목 수
+        """
+        # 이미 메모리에 있는 항목은 DB 조회 제외
+        keys = [key for key in dict.fromkeys(keys) if key not in self.memory]
+        if not keys:
+            return 0
+
+        db = self.session_factory()
+        try:
+            entries = db.query(self.model)\
+                .filter(
+                    self.model.cache_key.in_(keys),
+                    (self.model.expires_at.is_(None)) | (self.model.expires_at > datetime.utcnow())
+                )\
+                .all()
+            for entry in entries:
+                self.memory.set(
+                    entry.cache_key, getattr(entry, self.value_column), ttl=self._remaining_ttl(entry.expires_at)
+                )
+            self._db_stats["hits"] += len(entries)
+            self._db_stats["misses"] += len(keys) - len(entries)
+            return len(entries)
+        except Exception as e:
+            logger.warning(f"{self.name} 일괄 조회 실패: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def save(self, key: str, value: Any, **columns):
+        """값을 메모리와 DB에 저장 (columns: 함께 기록할 메타데이터 컬럼)"""
+        self.memory.set(key, value)
+
+        db = self.session_factory()
+        try:
+            entry = db.query(self.model)\
+                .filter(self.model.cache_key == key)\
+                .first()
+            if entry is None:
+                entry = self.model(cache_key=key)
+                db.add(entry)
+            for column, column_value in columns.items():
+                setattr(entry, column, column_value)
+            setattr(entry, self.value_column, value)
+            entry.expires_at = datetime.utcnow() + timedelta(seconds=self.ttl)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"{self.name} 저장 실패: {e}")
+        finally:
+            db.close()
+
+    def delete_where(self, *criteria, clear_memory: bool = False) -> int:
+        """조건에 맞는 DB 행 삭제 (조건이 없으면 전체)
+
+        Args:
+            criteria: SQLAlchemy 필터 조건
+            clear_memory: 메모리 계층도 비울지 (메모리 키로는 조건을 확인할 수 없으므로 전체)
+
+        Returns:
+            삭제된 DB 행 수
+        """
+        if clear_memory:
+            self.memory.clear()
+
+        db = self.session_factory()
+        try:
+            query = db.query(self.model)
+            if criteria:
+                query = query.filter(*criteria)
+            deleted = query.delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def expired(self):
+        """만료된 행 필터 조건"""
+        return self.model.expires_at <= datetime.utcnow()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            "memory": self.memory.stats(),
+            "db_hits": self._db_stats["hits"],
+            "db_misses": self._db_stats["misses"],
+        }
+
+    def _remaining_ttl(self, expires_at: Optional[datetime]) -> float:
+        """DB 만료 시각까지 남은 초 (메모리 TTL보다 길지 않게)"""
+        if expires_at is None:
+            return self.ttl
+        return max(0.0, min(self.ttl, (expires_at - datetime.utcnow()).total_seconds()))
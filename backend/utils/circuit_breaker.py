@@ -0,0 +1,102 @@
+"""
+서킷 브레이커 (스레드 안전)
+
+외부 API가 할당량 초과/인증 실패처럼 재시도해도 소용없는 상태가 되면
+일정 시간 동안 새 호출을 막고, 이후 한 번의 시험 호출로 복구 여부를 확인합니다.
+
+상태:
+- closed: 정상 (호출 허용)
+- open: 차단 (reset_timeout 동안 호출 거부)
+- half_open: 시험 호출 1회 허용 (성공 시 closed, 실패 시 다시 open)
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 또는 즉시 차단(trip)으로 열리는 서킷 브레이커
+
+    Args:
+        name: 로그용 이름
+        failure_threshold: 연속 실패 몇 번에 차단할지
+        reset_timeout: 차단 유지 시간 (초)
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def _update_state(self):
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = "half_open"
+            self._trial_in_flight = False
+
+    def is_open(self) -> bool:
+        """차단 상태인지 확인 (시험 호출 권한을 소모하지 않음)"""
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        """새 호출을 시작해도 되는지 확인"""
+        with self._lock:
+            self._update_state()
+            if self._state == "closed":
+                return True
+            if self._state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """호출 성공 기록 (half_open이면 closed로 복구)"""
+        with self._lock:
+            self._update_state()
+            if self._state == "open":
+                # 차단 전에 시작된 호출의 성공은 복구 근거로 쓰지 않음
+                return
+            if self._state == "half_open":
+                logger.info(f"[{self.name}] 서킷 복구 (closed)")
+            self._state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """일시적 실패 기록 (연속 실패가 임계치를 넘으면 차단)"""
+        with self._lock:
+            self._failures += 1
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                self._open_locked(f"연속 실패 {self._failures}회")
+
+    def trip(self, reason: str = ""):
+        """즉시 차단 (할당량 초과, 인증 실패 등)"""
+        with self._lock:
+            self._open_locked(reason)
+
+    def _open_locked(self, reason: str):
+        if self._state != "open":
+            logger.warning(f"[{self.name}] 서킷 차단 {self.reset_timeout:.0f}초: {reason}")
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        """현재 상태"""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self._failures,
+        }
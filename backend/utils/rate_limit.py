@@ -0,0 +1,79 @@
+"""
+외부 API 호출 제한 유틸리티 (스레드 안전)
+
+- TokenBucket: 초당 호출 수 제한 (버스트 허용)
+- ProviderLimiter: 동시 실행 수 제한(세마포어) + 토큰 버킷
+"""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기
+
+    Args:
+        rate: 초당 충전되는 토큰 수 (0 이하이면 제한 없음)
+        capacity: 최대 토큰 수 (버스트 크기, 기본값은 rate)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기 (timeout 초과 시 False 반환)"""
+        if self.rate <= 0:
+            return True
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class ProviderLimiter:
+    """번역기/LLM 등 외부 API별 동시 실행 수 + 초당 호출 수 제한
+
+    with 문으로 사용합니다.
+        with limiter:
+            call_api()
+    """
+
+    def __init__(self, name: str, max_concurrency: int, rate: float, burst: Optional[float] = None):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._bucket = TokenBucket(rate, burst)
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        try:
+            self._bucket.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
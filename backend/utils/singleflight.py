@@ -0,0 +1,67 @@
+"""
+단일 실행(single-flight) 요청 병합 유틸리티 (asyncio)
+
+같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고
+진행 중인 작업의 결과(또는 예외)를 함께 기다립니다.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 작업만 실행하는 요청 병합기
+
+    작업은 별도 Task로 실행되므로, 먼저 요청한 클라이언트의 연결이 끊겨도
+    같은 결과를 기다리는 다른 요청에는 영향이 없습니다.
+
+    Args:
+        name: 로그용 이름
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._stats = {"executed": 0, "coalesced": 0, "failures": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키에 해당하는 작업을 실행하거나 진행 중인 작업에 합류
+
+        Args:
+            key: 병합 기준 키 (정규화된 요청 파라미터)
+            fn: 실제 작업 코루틴 함수 (인자 없음)
+
+        Returns:
+            작업 결과 (합류한 요청도 같은 객체를 받음)
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+            logger.debug(f"[{self.name}] 진행 중인 요청에 합류: {key}")
+        else:
+            self._stats["executed"] += 1
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+
+        # 대기 중인 요청이 취소되어도 공유 작업은 계속 실행
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._stats["failures"] += 1
+
+    def stats(self) -> dict:
+        """실행/병합 통계"""
+        total = self._stats["executed"] + self._stats["coalesced"]
+        return {
+            "name": self.name,
+            **self._stats,
+            "in_flight": len(self._in_flight),
+            "coalesce_rate": self._stats["coalesced"] / total if total else 0.0,
+        }
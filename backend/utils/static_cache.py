@@ -0,0 +1,125 @@
+"""
+정적 이미지 HTTP 캐시 유틸리티
+
+이름에 해시가 들어가 내용이 바뀌지 않는 파일(워드클라우드 이미지 등)을 위한 응답 계층
+- 강한 ETag (내용 해시) + Cache-Control: immutable
+- If-None-Match 조건부 요청에 304 응답
+- 자주 요청되는 파일의 바이트를 메모리에 보관 (전체 크기 제한 LRU)
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# 해시 이름 파일은 내용이 바뀌지 않으므로 1년 동안 재검증 없이 사용
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticAsset(NamedTuple):
+    """메모리에 올린 파일 (바이트, 강한 ETag, MIME 타입)"""
+    content: bytes
+    etag: str
+    media_type: str
+
+
+def make_etag(content: bytes) -> str:
+    """내용 해시로 만든 강한 ETag"""
+    return '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (GET은 약한 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class StaticAssetCache:
+    """파일 경로 → StaticAsset 메모리 캐시 (전체 바이트 기준 LRU, 스레드 안전)
+
+    Args:
+        max_bytes: 보관할 전체 크기 (바이트)
+        max_item_bytes: 이보다 큰 파일은 메모리에 올리지 않음
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_item_bytes: int = 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._data: OrderedDict[str, StaticAsset] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "not_modified": 0, "evictions": 0}
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        """메모리에 있는 파일 (디스크 I/O 없음)"""
+        key = os.path.abspath(path)
+        with self._lock:
+            asset = self._data.get(key)
+            if asset is None:
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return asset
+
+    def load(self, path: str, media_type: str) -> Optional[StaticAsset]:
+        """디스크에서 파일을 읽어 ETag 계산 (크기 제한 이하면 메모리에 보관, 없으면 None)"""
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+        asset = StaticAsset(content, make_etag(content), media_type)
+        if len(content) <= self.max_item_bytes:
+            self._put(os.path.abspath(path), asset)
+        return asset
+
+    def _put(self, key: str, asset: StaticAsset):
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous.content)
+            self._data[key] = asset
+            self._total_bytes += len(asset.content)
+            while self._total_bytes > self.max_bytes and self._data:
+                _, evicted = self._data.popitem(last=False)
+                self._total_bytes -= len(evicted.content)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, path: str):
+        """파일이 바뀌거나 삭제됐을 때 메모리 항목 제거"""
+        with self._lock:
+            previous = self._data.pop(os.path.abspath(path), None)
+            if previous is not None:
+                self._total_bytes -= len(previous.content)
+
+    def response(self, request: Request, asset: StaticAsset) -> Response:
+        """조건부 요청이면 304, 아니면 캐시 헤더를 붙인 본문 응답"""
+        headers = {"ETag": asset.etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), asset.etag):
+            with self._lock:
+                self._stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=asset.content, media_type=asset.media_type, headers=headers)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._data),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }